@@ -0,0 +1,48 @@
+# backend/cache.py
+
+import threading
+from copy import deepcopy
+
+_MISSING = object()
+
+
+class FragmentCache:
+    """
+    Process-wide parse cache for config fragments.
+
+    Entries are keyed by whatever the provider uses to identify a resource
+    (e.g. an absolute file path or URL), so each fragment is read and parsed
+    once per run no matter how many networks reference it. Callers always get
+    a private copy, so mutating a returned fragment never leaks into the cache.
+    Missing fragments are cached too and re-raised as FileNotFoundError.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, loader):
+        with self._lock:
+            cached = self._entries.get(key, _MISSING)
+
+        if cached is _MISSING:
+            try:
+                cached = loader()
+            except FileNotFoundError:
+                with self._lock:
+                    self._entries.setdefault(key, FileNotFoundError)
+                raise
+            with self._lock:
+                cached = self._entries.setdefault(key, cached)
+
+        if cached is FileNotFoundError:
+            raise FileNotFoundError(f"Config fragment not found: {key}")
+        return deepcopy(cached)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 🧠 Shared by every backend instance in this process
+FRAGMENT_CACHE = FragmentCache()
@@ -0,0 +1,189 @@
+# backend/http_backend.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote, urljoin
+
+from backend.cache import FRAGMENT_CACHE
+from backend.interface import BackendProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "state/http_cache"
+
+
+class ETagCache:
+    """
+    On-disk cache of the last response body and ETag per URL, so unchanged
+    resources can be revalidated with If-None-Match and cost a 304.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, url):
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url):
+        try:
+            with open(self._path(url), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, url, etag, body):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"url": url, "etag": etag, "body": body}, f)
+        os.replace(tmp, path)
+
+
+class HTTPBackend(BackendProvider):
+    """
+    Backend provider for a remote source of truth that serves config as JSON.
+
+    Layout expected from the server:
+      GET {base_url}/fragments/<path relative to config/>  → the file as JSON
+      GET {base_url}/devices                                → {"groups": [...]}, paginated
+                                                              with a `Link: <...>; rel="next"` header
+
+    One keep-alive session (connection pool sized by `pool_size`) is shared by
+    every call and by `prefetch()`, which fetches many resources concurrently.
+    Responses are revalidated against an on-disk ETag cache.
+    """
+
+    caches_fragments = True
+
+    def __init__(self, base_url=None, token=None, cache_dir=DEFAULT_CACHE_DIR,
+                 pool_size=8, timeout=10, cache=FRAGMENT_CACHE):
+        self.base_url = (base_url or os.getenv("BACKEND_HTTP_URL", "http://localhost:8080")).rstrip("/") + "/"
+        self.token = token or os.getenv("BACKEND_HTTP_TOKEN")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.etags = ETagCache(cache_dir)
+        self.cache = cache
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    # 🔌 Session (created on first use)
+    @property
+    def session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["Accept"] = "application/json"
+                if self.token:
+                    session.headers["Authorization"] = f"Bearer {self.token}"
+                self._session = session
+            return self._session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    # 🌐 Conditional GET
+    def _get(self, url):
+        """Return (body, response). Serves the cached body on 304; 404 → FileNotFoundError."""
+        cached = self.etags.get(url)
+        headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            logger.debug(f"♻️ 304 Not Modified: {url}")
+            return cached["body"], response
+        if response.status_code == 404:
+            raise FileNotFoundError(f"Config fragment not found: {url}")
+        response.raise_for_status()
+
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self.etags.put(url, etag, body)
+        return body, response
+
+    def _fragment_url(self, path):
+        return urljoin(self.base_url, f"fragments/{quote(str(path))}")
+
+    def get_fragment(self, path):
+        url = self._fragment_url(path)
+        return self.cache.get_or_load(url, lambda: self._get(url)[0])
+
+    def prefetch(self, paths, max_workers=None):
+        """
+        Fetch many fragments concurrently over the shared session.
+        Returns {path: fragment}; missing fragments are left out.
+        """
+        paths = list(dict.fromkeys(paths))
+
+        def fetch(path):
+            try:
+                return path, self.get_fragment(path)
+            except FileNotFoundError:
+                return path, None
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.pool_size) as pool:
+            results = pool.map(fetch, paths)
+        return {path: data for path, data in results if data is not None}
+
+    # 📦 Devices (paginated, streamed page by page)
+    def iter_device_groups(self):
+        url = urljoin(self.base_url, "devices")
+        while url:
+            body, response = self._get(url)
+            yield from body.get("groups", [])
+            url = response.links.get("next", {}).get("url")
+
+    def get_devices(self):
+        return {"groups": list(self.iter_device_groups())}
+
+    # 📄 Whole-file resources (same paths as LocalYAMLBackend)
+    def get_vlans(self):
+        return self.get_fragment("common/vlans/mx_vlans.yaml")
+
+    def get_mx_ports(self):
+        return self.get_fragment("common/ports/mx_ports.yaml")
+
+    def get_mx_ports_project(self, project_name):
+        return self.get_fragment(f"projects/{project_name}/ports/mx_ports.yaml")
+
+    def get_firewall_rules(self):
+        return self.get_fragment("common/firewall/mx_firewall.yaml")
+
+    def get_mx_static_routes(self):
+        return self.get_fragment("common/routes/mx_static.yaml")
+
+    def get_mx_autovpn_common(self):
+        return self.get_fragment("common/vpn/mx_autovpn.yaml")
+
+    def get_mx_autovpn_project(self, project_name):
+        return self.get_fragment(f"projects/{project_name}/vpn/mx_autovpn.yaml")
+
+    def get_fixed_assignments(self, project_name):
+        return self.get_fragment(f"projects/{project_name}/fixed_ip_assignments.yaml")
+
+    def get_exclusions(self):
+        return self.get_fragment("common/exclusion_rules.yaml")
+
+    def get_manifest(self):
+        return self.get_fragment("manifest.yaml")
+
+    def get_defaults(self):
+        return self.get_fragment("defaults.yaml")
+
+    def get_mx_wireless(self):
+        return self.get_fragment("common/wireless/mx_wireless.yaml")
@@ -0,0 +1,88 @@
+# backend/http_standin.py
+#
+# 🧪 Local stand-in for a remote source of truth: serves the config/ YAML tree
+# as JSON in the layout HTTPBackend expects (ETags, 304s, paginated devices).
+#
+#   python -m backend.http_standin --config-dir config --port 8080
+
+import argparse
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+import yaml
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.requests.append(url.path)
+
+        if url.path.startswith("/fragments/"):
+            file_path = self.server.config_dir / unquote(url.path[len("/fragments/"):])
+            if not file_path.is_file() or self.server.config_dir.resolve() not in file_path.resolve().parents:
+                return self._send(404, {"error": "not found"})
+            with open(file_path, "r") as f:
+                return self._send(200, yaml.safe_load(f))
+
+        if url.path == "/devices":
+            page = int(parse_qs(url.query).get("page", ["0"])[0])
+            with open(self.server.config_dir / "devices/devices.yaml", "r") as f:
+                groups = (yaml.safe_load(f) or {}).get("groups", [])
+            size = self.server.page_size
+            headers = {}
+            if (page + 1) * size < len(groups):
+                headers["Link"] = f'<http://{self.headers["Host"]}/devices?page={page + 1}>; rel="next"'
+            return self._send(200, {"groups": groups[page * size:(page + 1) * size]}, headers)
+
+        self._send(404, {"error": "not found"})
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body, default=str).encode("utf-8")
+        etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, payload = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def start_standin_server(config_dir="config", host="127.0.0.1", port=0, page_size=1):
+    """Start the server on a background thread. Returns the server; `server.url` is its base URL."""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.config_dir = Path(config_dir)
+    server.page_size = page_size
+    server.requests = []
+    server.url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve config/ as JSON for the HTTP backend.")
+    parser.add_argument("--config-dir", default="config")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--page-size", type=int, default=50)
+    args = parser.parse_args()
+
+    server = start_standin_server(args.config_dir, port=args.port, page_size=args.page_size)
+    print(f"🧪 Serving {args.config_dir} at {server.url}")
+    threading.Event().wait()
+
+
+if __name__ == "__main__":
+    main()
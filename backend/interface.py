@@ -6,11 +6,18 @@ class BackendProvider(ABC):
     Implementations may fetch data from local YAML, NetBox, InfraHub, etc.
     """
 
+    # 🚀 True if repeated getter calls are served from a cache (see backend/prefetch.py)
+    caches_fragments = False
+
     @abstractmethod
     def get_devices(self):
         """🔧 Returns all Meraki device inventory with tags, types, and overrides."""
         pass
 
+    def iter_device_groups(self):
+        """🌊 Yields device groups one at a time. Providers that can stream should override this."""
+        yield from (self.get_devices() or {}).get("groups", [])
+
     @abstractmethod
     def get_vlans(self):
         """🌐 Returns VLAN definitions, including subnet and DHCP settings."""
@@ -54,4 +61,9 @@ class BackendProvider(ABC):
     @abstractmethod
     def get_mx_ports(self):
         """🔌 Returns MX port configuration including profiles and overrides."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_fragment(self, path):
+        """🧩 Returns any config fragment by relative path (e.g. a project override file)."""
+        pass
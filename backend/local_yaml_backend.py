@@ -1,21 +1,39 @@
 # backend/local_yaml_backend.py
 
+import os
 import yaml
 from pathlib import Path
+from backend.cache import FRAGMENT_CACHE
 from backend.interface import BackendProvider
+from backend.yaml_stream import iter_sequence
 
 class LocalYAMLBackend(BackendProvider):
-    def __init__(self, config_dir="config"):
+    caches_fragments = True
+
+    def __init__(self, config_dir="config", cache=FRAGMENT_CACHE):
         self.config_dir = Path(config_dir)
+        self.cache = cache
 
-    def _load_yaml(self, relative_path):
-        file_path = self.config_dir / relative_path
+    def _read_yaml(self, file_path):
         with open(file_path, "r") as f:
             return yaml.safe_load(f)
 
+    def _load_yaml(self, relative_path):
+        # 🧠 Parse each file once per run; later calls are served from the shared cache
+        file_path = self.config_dir / relative_path
+        return self.cache.get_or_load(os.path.abspath(file_path), lambda: self._read_yaml(file_path))
+
+    def get_fragment(self, path):
+        return self._load_yaml(path)
+
     def get_devices(self):
         return self._load_yaml("devices/devices.yaml")
 
+    def iter_device_groups(self):
+        # 🌊 Streamed straight from disk, group by group; never cached as a whole document
+        with open(self.config_dir / "devices/devices.yaml", "r") as f:
+            yield from iter_sequence(f, "groups")
+
     def get_vlans(self):
         return self._load_yaml("common/vlans/mx_vlans.yaml")
     
@@ -0,0 +1,41 @@
+# backend/prefetch.py
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_WORKERS = 8
+
+
+def prefetch(calls, executor=None, max_workers=PREFETCH_WORKERS):
+    """
+    Run provider getters concurrently so their results land in the provider's
+    cache before resolution starts. `calls` is an iterable of
+    (provider, method_name, args). Providers that do not cache fetched
+    fragments (`caches_fragments = False`) are skipped, since warming them
+    would only repeat work. Missing fragments are expected; other errors are
+    left for the resolver to report when it asks again.
+    Returns the number of calls made.
+    """
+    calls = [call for call in calls if getattr(call[0], "caches_fragments", False)]
+    if not calls:
+        return 0
+
+    def run(call):
+        provider, method, args = call
+        try:
+            getattr(provider, method)(*args)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"[PREFETCH] {type(provider).__name__}.{method}{args} failed: {e}")
+
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(run, calls))
+    else:
+        list(executor.map(run, calls))
+
+    logger.debug(f"[PREFETCH] Warmed {len(calls)} resources")
+    return len(calls)
@@ -1,22 +1,65 @@
 # backend/router.py
 
-from backend.interface import BackendProvider
-from backend.local_yaml_backend import LocalYAMLBackend
+import threading
+from importlib import import_module
+from importlib.metadata import entry_points
 
-# Future: add imports for NetBoxBackend, InfraHubBackend here
+from backend.interface import BackendProvider
 
-PROVIDERS = {
-    "local": LocalYAMLBackend(),
-    # "netbox": NetBoxBackend(),
-    # "infrahub": InfraHubBackend(),
+# 🧩 Built-in providers as "module:Class". Nothing is imported or constructed
+# until a provider is actually selected in defaults.yaml `backend_providers`.
+BUILTIN_PROVIDERS = {
+    "local": "backend.local_yaml_backend:LocalYAMLBackend",
+    "sqlite": "backend.sqlite_backend:SQLiteBackend",    # 🗄️ build with: python -m backend.sqlite_import
+    "http": "backend.http_backend:HTTPBackend",          # 🌐 BACKEND_HTTP_URL / BACKEND_HTTP_TOKEN
 }
 
-def get_backend_for(resource_name: str, defaults: dict) -> BackendProvider:
+# 🔌 Third-party providers (NetBox, InfraHub, ...) register under this group:
+#   [project.entry-points."python_meraki.backends"]
+#   netbox = "my_package.netbox:NetBoxBackend"
+ENTRY_POINT_GROUP = "python_meraki.backends"
+
+_instances = {}
+_lock = threading.Lock()
+
+
+def _load_builtin(target):
+    module_name, _, class_name = target.partition(":")
+    return getattr(import_module(module_name), class_name)
+
+
+def available_providers():
+    """Provider name → zero-arg callable returning the provider class."""
+    providers = {name: (lambda target=target: _load_builtin(target)) for name, target in BUILTIN_PROVIDERS.items()}
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        providers.setdefault(ep.name, ep.load)
+    return providers
+
+
+def get_provider(name: str) -> BackendProvider:
+    """Return the shared instance of provider `name`, constructing it on first use."""
+    with _lock:
+        provider = _instances.get(name)
+        if provider is None:
+            loader = available_providers().get(name)
+            if loader is None:
+                raise ValueError(f"❌ Unknown backend provider '{name}'. Available: {', '.join(sorted(available_providers()))}")
+            provider = _instances[name] = loader()()
+        return provider
+
+
+def reset_providers():
+    """Drop all constructed providers (tests, or after changing provider settings)."""
+    with _lock:
+        _instances.clear()
+
+
+def get_backend_for(resource_name: str, defaults: dict = None) -> BackendProvider:
     """
     Returns the correct backend provider for a given resource.
     Looks for overrides in `defaults["backend_providers"]`.
     """
-    config = defaults.get("backend_providers", {})
+    config = (defaults or {}).get("backend_providers", {})
     override = config.get("overrides", {}).get(resource_name)
     provider_name = override or config.get("default", "local")
-    return PROVIDERS[provider_name]
\ No newline at end of file
+    return get_provider(provider_name)
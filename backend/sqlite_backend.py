@@ -0,0 +1,176 @@
+# backend/sqlite_backend.py
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from backend.interface import BackendProvider
+from models.inventory import normalize_tag
+
+DEFAULT_DB_PATH = "state/backend.sqlite3"
+
+# 🗄️ Built by backend/sqlite_import.py from the config/ tree
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fragments (
+    path          TEXT PRIMARY KEY,   -- path relative to config/, e.g. common/vlans/mx_vlans.yaml
+    project_slug  TEXT,               -- set for files under projects/<slug>/
+    body          TEXT NOT NULL       -- JSON
+);
+CREATE INDEX IF NOT EXISTS idx_fragments_project ON fragments (project_slug);
+
+CREATE TABLE IF NOT EXISTS device_groups (
+    position  INTEGER PRIMARY KEY,
+    tag       TEXT,
+    body      TEXT NOT NULL           -- group without its devices
+);
+
+CREATE TABLE IF NOT EXISTS devices (
+    id        INTEGER PRIMARY KEY,
+    position  INTEGER NOT NULL REFERENCES device_groups (position),
+    serial    TEXT,
+    body      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_devices_serial ON devices (serial);
+CREATE INDEX IF NOT EXISTS idx_devices_position ON devices (position);
+
+CREATE TABLE IF NOT EXISTS device_tags (
+    tag        TEXT NOT NULL,         -- normalised (underscores → hyphens)
+    device_id  INTEGER NOT NULL REFERENCES devices (id),
+    PRIMARY KEY (tag, device_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS fixed_assignments (
+    project_slug  TEXT NOT NULL,
+    network_slug  TEXT NOT NULL,      -- top-level key of fixed_ip_assignments.yaml
+    body          TEXT NOT NULL,
+    PRIMARY KEY (project_slug, network_slug)
+) WITHOUT ROWID;
+"""
+
+
+class SQLiteBackend(BackendProvider):
+    """
+    Backend provider over a local SQLite database.
+
+    Whole-file getters return the same shapes as LocalYAMLBackend; the extra
+    `get_devices_for_tag`, `get_device` and `get_network_fixed_assignments`
+    helpers answer per-network questions with a single indexed query.
+    The database is opened lazily (read-only), one connection per thread.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if not self.db_path.exists():
+                raise FileNotFoundError(f"SQLite backend database not found: {self.db_path} (run python -m backend.sqlite_import)")
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+            self._local.conn = conn
+        return conn
+
+    def _query(self, sql, params=()):
+        return self._connection().execute(sql, params)
+
+    # 🧩 Fragments
+    def get_fragment(self, path):
+        row = self._query("SELECT body FROM fragments WHERE path = ?", (str(path),)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Config fragment not found: {path}")
+        return json.loads(row[0])
+
+    def get_project_fragments(self, project_slug):
+        """All fragments under projects/<slug>/, keyed by relative path."""
+        rows = self._query("SELECT path, body FROM fragments WHERE project_slug = ?", (project_slug,))
+        return {path: json.loads(body) for path, body in rows}
+
+    # 📦 Devices
+    def get_devices(self):
+        return {"groups": list(self.iter_device_groups())}
+
+    def iter_device_groups(self):
+        groups = self._query("SELECT position, body FROM device_groups ORDER BY position").fetchall()
+        for position, body in groups:
+            group = json.loads(body)
+            rows = self._query("SELECT body FROM devices WHERE position = ? ORDER BY id", (position,))
+            group["devices"] = [json.loads(device) for device, in rows]
+            yield group
+
+    def get_devices_for_tag(self, tag):
+        """Devices carrying `tag` (as listed in devices.yaml, group tag included)."""
+        rows = self._query(
+            "SELECT d.body, g.tag FROM device_tags t "
+            "JOIN devices d ON d.id = t.device_id "
+            "JOIN device_groups g ON g.position = d.position "
+            "WHERE t.tag = ? ORDER BY d.id",
+            (normalize_tag(tag),),
+        )
+        return [self._with_group_tag(json.loads(body), group_tag) for body, group_tag in rows]
+
+    def get_device(self, serial):
+        row = self._query(
+            "SELECT d.body, g.tag FROM devices d JOIN device_groups g ON g.position = d.position "
+            "WHERE d.serial = ? ORDER BY d.id DESC LIMIT 1",
+            (serial,),
+        ).fetchone()
+        return self._with_group_tag(json.loads(row[0]), row[1]) if row else None
+
+    @staticmethod
+    def _with_group_tag(device, group_tag):
+        tags = device.get("tags", [])
+        if isinstance(tags, str):
+            tags = [tags]
+        device["tags"] = list(dict.fromkeys([*tags, group_tag] if group_tag else tags))
+        return device
+
+    # 📌 Fixed assignments
+    def get_fixed_assignments(self, project_name):
+        rows = self._query(
+            "SELECT network_slug, body FROM fixed_assignments WHERE project_slug = ?", (project_name,)
+        ).fetchall()
+        if not rows:
+            return self.get_fragment(f"projects/{project_name}/fixed_ip_assignments.yaml")
+        return {network_slug: json.loads(body) for network_slug, body in rows}
+
+    def get_network_fixed_assignments(self, project_name, network_slug):
+        row = self._query(
+            "SELECT body FROM fixed_assignments WHERE project_slug = ? AND network_slug = ?",
+            (project_name, network_slug),
+        ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    # 📄 Whole-file resources (same paths as LocalYAMLBackend)
+    def get_vlans(self):
+        return self.get_fragment("common/vlans/mx_vlans.yaml")
+
+    def get_mx_ports(self):
+        return self.get_fragment("common/ports/mx_ports.yaml")
+
+    def get_mx_ports_project(self, project_name):
+        return self.get_fragment(f"projects/{project_name}/ports/mx_ports.yaml")
+
+    def get_firewall_rules(self):
+        return self.get_fragment("common/firewall/mx_firewall.yaml")
+
+    def get_mx_static_routes(self):
+        return self.get_fragment("common/routes/mx_static.yaml")
+
+    def get_mx_autovpn_common(self):
+        return self.get_fragment("common/vpn/mx_autovpn.yaml")
+
+    def get_mx_autovpn_project(self, project_name):
+        return self.get_fragment(f"projects/{project_name}/vpn/mx_autovpn.yaml")
+
+    def get_exclusions(self):
+        return self.get_fragment("common/exclusion_rules.yaml")
+
+    def get_manifest(self):
+        return self.get_fragment("manifest.yaml")
+
+    def get_defaults(self):
+        return self.get_fragment("defaults.yaml")
+
+    def get_mx_wireless(self):
+        return self.get_fragment("common/wireless/mx_wireless.yaml")
@@ -0,0 +1,126 @@
+# backend/sqlite_import.py
+#
+# 🗄️ Build the SQLite backend database from the config/ YAML tree
+#
+#   python -m backend.sqlite_import --config-dir config --db state/backend.sqlite3
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+from pathlib import Path
+
+import yaml
+
+from backend.sqlite_backend import DEFAULT_DB_PATH, SCHEMA
+from backend.yaml_stream import iter_sequence
+from models.inventory import normalize_tag
+
+logger = logging.getLogger(__name__)
+
+DEVICES_PATH = "devices/devices.yaml"
+FIXED_ASSIGNMENTS_FILE = "fixed_ip_assignments.yaml"
+
+
+def _dumps(value):
+    return json.dumps(value, default=str, separators=(",", ":"))
+
+
+def _project_slug(rel_path):
+    parts = rel_path.parts
+    return parts[1] if len(parts) > 2 and parts[0] == "projects" else None
+
+
+def import_config_tree(config_dir="config", db_path=DEFAULT_DB_PATH):
+    """
+    (Re)build `db_path` from every YAML file under `config_dir`.
+    The database is written to a temporary file and swapped in atomically.
+    Returns a dict of row counts.
+    """
+    config_dir = Path(config_dir)
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    counts = {"fragments": 0, "groups": 0, "devices": 0, "fixed_assignments": 0}
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+
+        for file_path in sorted(config_dir.rglob("*.yaml")):
+            rel_path = file_path.relative_to(config_dir)
+            if rel_path.as_posix() == DEVICES_PATH:
+                continue  # 📦 streamed into the device tables below
+
+            with open(file_path, "r") as f:
+                data = yaml.safe_load(f)
+
+            project_slug = _project_slug(rel_path)
+            conn.execute(
+                "INSERT INTO fragments (path, project_slug, body) VALUES (?, ?, ?)",
+                (rel_path.as_posix(), project_slug, _dumps(data)),
+            )
+            counts["fragments"] += 1
+
+            if project_slug and rel_path.name == FIXED_ASSIGNMENTS_FILE and isinstance(data, dict):
+                conn.executemany(
+                    "INSERT INTO fixed_assignments (project_slug, network_slug, body) VALUES (?, ?, ?)",
+                    [(project_slug, str(network_slug), _dumps(body)) for network_slug, body in data.items()],
+                )
+                counts["fixed_assignments"] += len(data)
+
+        devices_file = config_dir / DEVICES_PATH
+        if devices_file.exists():
+            with open(devices_file, "r") as f:
+                for position, group in enumerate(iter_sequence(f, "groups")):
+                    _insert_group(conn, position, group, counts)
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, db_path)
+    logger.info(f"🗄️ Imported {config_dir} → {db_path}: {counts}")
+    return counts
+
+
+def _insert_group(conn, position, group, counts):
+    group_tag = group.get("tag")
+    devices = group.get("devices") or []
+    conn.execute(
+        "INSERT INTO device_groups (position, tag, body) VALUES (?, ?, ?)",
+        (position, group_tag, _dumps({k: v for k, v in group.items() if k != "devices"})),
+    )
+    counts["groups"] += 1
+
+    for device in devices:
+        cursor = conn.execute(
+            "INSERT INTO devices (position, serial, body) VALUES (?, ?, ?)",
+            (position, device.get("serial"), _dumps(device)),
+        )
+        tags = device.get("tags", [])
+        if isinstance(tags, str):
+            tags = [tags]
+        normalised = {normalize_tag(t) for t in [*tags, group_tag] if t}
+        conn.executemany(
+            "INSERT INTO device_tags (tag, device_id) VALUES (?, ?)",
+            [(tag, cursor.lastrowid) for tag in normalised],
+        )
+        counts["devices"] += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the SQLite backend database from config/.")
+    parser.add_argument("--config-dir", default="config")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    import_config_tree(args.config_dir, args.db)
+
+
+if __name__ == "__main__":
+    main()
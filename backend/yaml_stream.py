@@ -0,0 +1,61 @@
+# backend/yaml_stream.py
+
+import yaml
+from yaml.events import MappingEndEvent, MappingStartEvent, ScalarEvent, SequenceEndEvent, SequenceStartEvent
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🌊 Event-driven reader for large YAML inventories                           │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# `yaml.safe_load` builds the whole document (and its node graph) before
+# returning anything. For devices.yaml we only ever need one group at a time, so
+# this walks the parser's event stream and composes/constructs each item of a
+# top-level sequence on its own. Anchors defined in earlier items still resolve.
+
+
+def iter_sequence(stream, key):
+    """
+    Yield the items of the top-level `key: [...]` sequence one by one.
+    `stream` is an open file (or string). Other top-level keys are skipped.
+    """
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()                      # StreamStart
+        if not loader.check_event(yaml.DocumentStartEvent):
+            return                              # empty file
+        loader.get_event()                      # DocumentStart
+        if not loader.check_event(MappingStartEvent):
+            raise ValueError(f"Expected a mapping at the top of the document to find '{key}'")
+        loader.get_event()
+
+        while not loader.check_event(MappingEndEvent):
+            name = loader.get_event()
+            if not isinstance(name, ScalarEvent) or name.value != key:
+                _skip_node(loader)
+                continue
+
+            if not loader.check_event(SequenceStartEvent):
+                value = loader.construct_document(loader.compose_node(None, None))
+                if value is not None:
+                    raise ValueError(f"Expected '{key}' to be a list")
+                continue
+
+            loader.get_event()
+            while not loader.check_event(SequenceEndEvent):
+                # 🧩 Compose + construct a single item, then let it go
+                yield loader.construct_document(loader.compose_node(None, None))
+            loader.get_event()
+    finally:
+        loader.dispose()
+
+
+def _skip_node(loader):
+    """Consume the events of one node without constructing it."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
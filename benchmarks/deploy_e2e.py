@@ -0,0 +1,122 @@
+# benchmarks/deploy_e2e.py
+#
+# 🚀 Full `main.py deploy` runs against the fake Dashboard, offline
+#
+#   python -m benchmarks.deploy_e2e --networks 10 50 --latency-ms 40 --rate-429 0.01 -o e2e.json
+#
+# For each size: generate a synthetic config/ tree, start a fresh fake Dashboard
+# seeded with its devices, run `main.py deploy` in a subprocess pointed at it via
+# MERAKI_BASE_URL, and report networks/minute and API calls per network.
+#
+# The SDK's own per-org pacing (smart_flow) still applies, so with zero latency
+# the numbers approximate what the real Dashboard rate limit allows.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from benchmarks.fake_dashboard import start_fake_dashboard
+from benchmarks.synthetic_config import generate_config_tree
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = (10, 50)
+
+
+def _prepare_tree(workdir, networks, session_options):
+    config_dir = workdir / "config"
+    generate_config_tree(config_dir, networks=networks)
+
+    # ⚙️ Session tuning under test (workers, retries, logging) goes through defaults.yaml
+    defaults_path = config_dir / "defaults.yaml"
+    with open(defaults_path, "r") as f:
+        defaults = yaml.safe_load(f)
+    defaults["dashboard_session"] = {"suppress_logging": True, "nginx_429_retry_wait_time": 0, **session_options}
+    with open(defaults_path, "w") as f:
+        yaml.safe_dump(defaults, f, sort_keys=False)
+
+    with open(config_dir / "devices" / "devices.yaml", "r") as f:
+        groups = yaml.safe_load(f)["groups"]
+    return {d["serial"]: {"model": d.get("model", "MX68")} for g in groups for d in g["devices"]}
+
+
+def run_deploy(networks, latency=0.0, rate_429=0.0, session_options=None, timeout=1800, extra_args=()):
+    """Run one full deploy of `networks` synthetic networks. Returns a result dict."""
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        devices = _prepare_tree(workdir, networks, session_options or {})
+        server = start_fake_dashboard(latency=latency, rate_429=rate_429, devices=devices)
+        env = {**os.environ, "MERAKI_API_KEY": "0" * 40, "MERAKI_BASE_URL": server.url}
+        started = time.perf_counter()
+        try:
+            proc = subprocess.run(
+                [sys.executable, str(ROOT / "main.py"), "deploy", *extra_args],
+                cwd=workdir, env=env, capture_output=True, text=True, timeout=timeout,
+            )
+            status = "ok" if proc.returncode == 0 else "error"
+            error = None if status == "ok" else (proc.stderr.strip().splitlines() or ["?"])[-1]
+        except subprocess.TimeoutExpired:
+            status, error = "timeout", None
+        elapsed = time.perf_counter() - started
+        server.shutdown()
+        server.server_close()
+
+    calls = sum(server.requests.values())
+    result = {
+        "status": status,
+        "networks": networks,
+        "seconds": round(elapsed, 3),
+        "networks_per_minute": round(networks / elapsed * 60, 2) if elapsed else None,
+        "api_calls": calls,
+        "calls_per_network": round(calls / networks, 1),
+        "rate_limited": server.rate_limited,
+        "top_endpoints": dict(server.requests.most_common(10)),
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full deployments against a fake Dashboard.")
+    parser.add_argument("--networks", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added to every fake API response")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--workers", type=int, help="dashboard_session.workers for the run")
+    parser.add_argument("--timeout", type=int, default=1800)
+    parser.add_argument("-o", "--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    session_options = {"workers": args.workers} if args.workers else {}
+    results = []
+    for networks in args.networks:
+        result = run_deploy(networks, args.latency_ms / 1000, args.rate_429, session_options, args.timeout)
+        results.append(result)
+        if result["status"] == "ok":
+            print(f"🚀 {networks:>5} networks: {result['seconds']:.1f}s, {result['networks_per_minute']} networks/min, "
+                  f"{result['calls_per_network']} calls/network, {result['rate_limited']} × 429")
+        else:
+            print(f"❌ {networks:>5} networks: {result['status']} {result.get('error', '')}")
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "latency_ms": args.latency_ms,
+        "rate_429": args.rate_429,
+        "session": session_options,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+    return 0 if all(r["status"] == "ok" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
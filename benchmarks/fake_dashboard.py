@@ -0,0 +1,281 @@
+# benchmarks/fake_dashboard.py
+#
+# 🧪 In-memory stand-in for the Meraki Dashboard API
+#
+#   python -m benchmarks.fake_dashboard --port 8090 --latency-ms 50 --rate-429 0.02
+#   MERAKI_BASE_URL=http://127.0.0.1:8090/api/v1 MERAKI_API_KEY=fake python main.py deploy
+#
+# Holds orgs, networks, devices and every per-network resource the configurators
+# touch (VLANs, ports, static routes, firewall rules, SSIDs, VPN) in memory.
+# Each request can be delayed (`latency`) and a fraction answered with 429 +
+# Retry-After, so the SDK's retry path is exercised too.
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+API_PREFIX = "/api/v1"
+# List endpoints that answer [] before anything was created under them
+COLLECTIONS = ("/appliance/vlans", "/appliance/staticRoutes")
+DEFAULT_MX_PORTS = 12
+
+
+_ID_SEGMENT = re.compile(r"[A-Z]_\d+|\d+|Q[0-9A-Z]{3}-[0-9A-Z-]+")
+
+
+def endpoint_template(method, path):
+    """Collapse IDs so request counts group by endpoint: GET /networks/{id}/appliance/vlans."""
+    parts = ["{id}" if _ID_SEGMENT.fullmatch(p) else p for p in path.strip("/").split("/")]
+    return f"{method} /{'/'.join(parts)}"
+
+
+class DashboardState:
+    """Everything the fake Dashboard knows. All access goes through `lock`."""
+
+    def __init__(self, devices=None):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.orgs = {}
+        self.networks = {}
+        # serial → device; seed with {serial: {"model": ...}} so claims return real models
+        self.devices = {serial: {"serial": serial, "networkId": None, **info} for serial, info in (devices or {}).items()}
+        self.resources = {}    # path → object   (settings, firewall rules, single items)
+        self.collections = {}  # path → {id: object}
+
+    def new_id(self, prefix):
+        return f"{prefix}_{next(self.ids):06d}"
+
+    # 🏢 Orgs and networks
+    def org_networks(self, org_id):
+        return [n for n in self.networks.values() if n["organizationId"] == org_id]
+
+    def delete_network(self, network_id):
+        self.networks.pop(network_id, None)
+        for device in self.devices.values():
+            if device.get("networkId") == network_id:
+                device["networkId"] = None
+        prefix = f"/networks/{network_id}/"
+        for store in (self.resources, self.collections):
+            for key in [k for k in store if k.startswith(prefix)]:
+                del store[key]
+
+    # 📦 Devices
+    def claim(self, network_id, serials):
+        for serial in serials:
+            device = self.devices.setdefault(serial, {"serial": serial, "model": "MX68"})
+            device["networkId"] = network_id
+            device.setdefault("name", serial)
+
+    def network_devices(self, network_id):
+        return [d for d in self.devices.values() if d.get("networkId") == network_id]
+
+    def org_inventory(self, org_id):
+        nets = {n["id"] for n in self.org_networks(org_id)}
+        return [d for d in self.devices.values() if d.get("networkId") in nets]
+
+    # 🧩 Generic per-network resources
+    def get(self, path):
+        if path in self.collections:
+            return list(self.collections[path].values())
+        parent, _, item = path.rpartition("/")
+        if parent in self.collections and item in self.collections[parent]:
+            return self.collections[parent][item]
+        if path in self.resources:
+            return self.resources[path]
+        if path.endswith("/appliance/ports"):
+            return [{"number": n, "enabled": True, "type": "access", "vlan": 1} for n in range(1, DEFAULT_MX_PORTS + 1)]
+        if path.endswith(COLLECTIONS):
+            return []
+        return {}
+
+    def create(self, path, body):
+        item_id = str(body.get("id") or self.new_id("R"))
+        obj = {**body, "id": body.get("id", item_id)}
+        self.collections.setdefault(path, {})[item_id] = obj
+        return obj
+
+    def update(self, path, body):
+        parent, _, item = path.rpartition("/")
+        if parent in self.collections and item in self.collections[parent]:
+            self.collections[parent][item].update(body)
+            return self.collections[parent][item]
+        obj = self.resources.setdefault(path, {})
+        obj.update(body)
+        return obj
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        server = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        path = urlparse(self.path).path
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        endpoint = endpoint_template(method, path)
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        with server.counter_lock:
+            server.requests[endpoint] += 1
+            throttle = server.rate_429 and server.random.random() < server.rate_429
+            if throttle:
+                server.rate_limited += 1
+        if throttle:
+            return self._send(429, {"errors": ["API rate limit exceeded for organization"]},
+                              {"Retry-After": str(server.retry_after)})
+
+        with server.state.lock:
+            status, payload = _route(server.state, method, path, body)
+        self._send(status, payload)
+
+    def _send(self, status, body, headers=None):
+        payload = b"" if status == 204 else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def _route(state, method, path, body):
+    """Return (status, body) for one request. Runs under state.lock."""
+    if m := re.fullmatch(r"/organizations", path):
+        if method == "GET":
+            return 200, list(state.orgs.values())
+        org = {"id": state.new_id("O"), "name": body.get("name"), "url": ""}
+        state.orgs[org["id"]] = org
+        return 201, org
+
+    if m := re.fullmatch(r"/organizations/([^/]+)", path):
+        org = state.orgs.get(m[1])
+        if org is None:
+            return 404, {"errors": ["Organization not found"]}
+        if method == "PUT":
+            org.update(body)
+        return 200, org
+
+    if m := re.fullmatch(r"/organizations/([^/]+)/networks", path):
+        if method == "GET":
+            return 200, state.org_networks(m[1])
+        network = {**body, "id": state.new_id("L"), "organizationId": m[1]}
+        state.networks[network["id"]] = network
+        return 201, network
+
+    if m := re.fullmatch(r"/organizations/([^/]+)/(inventory/devices|inventoryDevices)", path):
+        return 200, state.org_inventory(m[1])
+
+    if m := re.fullmatch(r"/networks/([^/]+)", path):
+        if m[1] not in state.networks:
+            return 404, {"errors": ["Network not found"]}
+        if method == "DELETE":
+            state.delete_network(m[1])
+            return 204, None
+        if method == "PUT":
+            state.networks[m[1]].update(body)
+        return 200, state.networks[m[1]]
+
+    if m := re.fullmatch(r"/networks/([^/]+)/devices/claim", path):
+        state.claim(m[1], body.get("serials", []))
+        return 200, {"serials": body.get("serials", [])}
+
+    if m := re.fullmatch(r"/networks/([^/]+)/devices/remove", path):
+        device = state.devices.get(body.get("serial"))
+        if not device or device.get("networkId") != m[1]:
+            return 400, {"errors": ["Device does not belong to a network"]}
+        device["networkId"] = None
+        return 204, None
+
+    if m := re.fullmatch(r"/networks/([^/]+)/devices", path):
+        return 200, state.network_devices(m[1])
+
+    if m := re.fullmatch(r"/devices/([^/]+)", path):
+        device = state.devices.get(m[1])
+        if device is None:
+            return 404, {"errors": ["Device not found"]}
+        if method == "PUT":
+            device.update(body)
+        return 200, device
+
+    if path.startswith("/networks/"):
+        if path.split("/")[2] not in state.networks:
+            return 404, {"errors": ["Network not found"]}
+        if method == "GET":
+            return 200, state.get(path)
+        if method == "POST":
+            return 201, state.create(path, body)
+        if method == "PUT":
+            return 200, state.update(path, body)
+        if method == "DELETE":
+            parent, _, item = path.rpartition("/")
+            state.collections.get(parent, {}).pop(item, None)
+            state.resources.pop(path, None)
+            return 204, None
+
+    return 404, {"errors": [f"No fake route for {method} {path}"]}
+
+
+def start_fake_dashboard(host="127.0.0.1", port=0, latency=0.0, rate_429=0.0, retry_after=0, devices=None, seed=0):
+    """
+    Start the fake Dashboard on a background thread. `server.url` is the SDK
+    base_url; `server.requests` counts requests per endpoint template.
+    """
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.state = DashboardState(devices)
+    server.latency = latency
+    server.rate_429 = rate_429
+    server.retry_after = retry_after
+    server.random = random.Random(seed)
+    server.requests = Counter()
+    server.rate_limited = 0
+    server.counter_lock = threading.Lock()
+    server.url = f"http://{host}:{server.server_address[1]}{API_PREFIX}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an in-memory fake Meraki Dashboard API.")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    server = start_fake_dashboard(port=args.port, latency=args.latency_ms / 1000,
+                                  rate_429=args.rate_429, retry_after=args.retry_after)
+    print(f"🧪 Fake Dashboard at {server.url}")
+    threading.Event().wait()
+
+
+if __name__ == "__main__":
+    main()
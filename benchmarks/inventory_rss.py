@@ -0,0 +1,83 @@
+# benchmarks/inventory_rss.py
+#
+# 📏 Peak-RSS comparison: whole-document devices.yaml load vs streaming reader
+#
+#   python -m benchmarks.inventory_rss --devices 100000 --group-size 50
+#
+# Each loader runs in a fresh interpreter so the peak RSS it reports is its own.
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+LOADERS = {
+    # Current path: full safe_load (cached + deep-copied), then index
+    "safe_load": (
+        "from backend.local_yaml_backend import LocalYAMLBackend\n"
+        "from models import DeviceInventory\n"
+        "inventory = DeviceInventory(LocalYAMLBackend(CONFIG_DIR).get_devices())\n"
+    ),
+    # Streaming path: one group composed at a time, fed straight into the index
+    "stream": (
+        "from backend.local_yaml_backend import LocalYAMLBackend\n"
+        "from models import DeviceInventory\n"
+        "inventory = DeviceInventory.from_groups(LocalYAMLBackend(CONFIG_DIR).iter_device_groups())\n"
+    ),
+}
+
+_RUNNER = """
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+CONFIG_DIR = {config_dir!r}
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"devices": len(inventory), "seconds": round(elapsed, 3), "peak_rss_mb": round(peak_kb / 1024, 1)}}))
+"""
+
+
+def write_devices_yaml(path, devices, group_size):
+    """Write a synthetic devices.yaml with `devices` entries in groups of `group_size`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        f.write("groups:\n")
+        for n in range(devices):
+            if n % group_size == 0:
+                f.write(f"  - tag: bench-project-net-{n // group_size:05d}\n    devices:\n")
+            f.write(
+                f"      - serial: Q2BM-{n // 10000:04d}-{n % 10000:04d}\n"
+                f"        type: MS\n"
+                f"        model: MS120-8LP\n"
+                f"        tags: [access-switch, poe-capable]\n"
+                f"        overrides:\n"
+                f"          notes: \"Synthetic device {n}\"\n"
+            )
+
+
+def run_loader(name, config_dir):
+    root = str(Path(__file__).resolve().parent.parent)
+    code = _RUNNER.format(root=root, config_dir=str(config_dir), body=LOADERS[name])
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare peak RSS of devices.yaml loaders.")
+    parser.add_argument("--devices", type=int, default=100_000)
+    parser.add_argument("--group-size", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_dir = Path(tmp)
+        write_devices_yaml(config_dir / "devices" / "devices.yaml", args.devices, args.group_size)
+        results = {name: run_loader(name, config_dir) for name in LOADERS}
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
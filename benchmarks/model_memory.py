@@ -0,0 +1,70 @@
+# benchmarks/model_memory.py
+#
+# 📏 Memory held by resolved VLANs and firewall rules: plain dicts vs slotted records
+#
+#   python -m benchmarks.model_memory --networks 1000 --vlans 20 --rules 50
+#
+# Builds the same data both ways and reports what tracemalloc sees still
+# allocated afterwards, so the numbers cover the objects themselves, not the
+# YAML parsing around them.
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from models import VLAN, FirewallRule
+
+
+def synthetic_rows(networks, vlans, rules):
+    """Raw dict rows as the resolver sees them: (vlan rows, rule rows) per network."""
+    for n in range(networks):
+        vlan_rows = [{"id": 10 * (v + 1), "name": f"VLAN-{v}", "subnet": f"10.{n % 250}.{v}.0/24",
+                      "gatewayIp": f"10.{n % 250}.{v}.1", "dhcpHandling": "Run a DHCP server"}
+                     for v in range(vlans)]
+        rule_rows = [{"comment": f"Rule {r}", "policy": "allow", "protocol": "tcp", "srcCidr": "any",
+                      "srcPort": "any", "destCidr": f"10.{n % 250}.{r % vlans}.0/24", "destPort": str(1000 + r)}
+                     for r in range(rules)]
+        yield vlan_rows, rule_rows
+
+
+def measure(build, networks, vlans, rules):
+    """Allocated bytes still held after `build` turns every network's rows into objects."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [build(vlan_rows, rule_rows) for vlan_rows, rule_rows in synthetic_rows(networks, vlans, rules)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return after - before
+
+
+BUILDERS = {
+    "dicts": lambda vlan_rows, rule_rows: (vlan_rows, rule_rows),
+    "records": lambda vlan_rows, rule_rows: ([VLAN.from_dict(v) for v in vlan_rows],
+                                             [FirewallRule.from_dict(r) for r in rule_rows]),
+}
+
+
+def run(networks=1000, vlans=20, rules=50):
+    """{builder: {"bytes", "mb"}} for the same synthetic networks."""
+    results = {}
+    for name, build in BUILDERS.items():
+        held = measure(build, networks, vlans, rules)
+        results[name] = {"bytes": held, "mb": round(held / 1024 / 1024, 1)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory of dict vs record network models.")
+    parser.add_argument("--networks", type=int, default=1000)
+    parser.add_argument("--vlans", type=int, default=20)
+    parser.add_argument("--rules", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(run(args.networks, args.vlans, args.rules), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# benchmarks/scale.py
+#
+# 📈 Resolver / IPAM / naming / loader benchmarks on synthetic trees of growing size
+#
+#   python -m benchmarks.scale                                   # 10, 100, 1000, 10000 networks
+#   python -m benchmarks.scale --sizes 10 100 -o bench.json      # save results
+#   python -m benchmarks.scale --sizes 10 100 --baseline bench.json --threshold 1.5
+#
+# Each case runs in a fresh interpreter, so the peak RSS it reports is its own.
+# A case that exceeds --timeout is recorded as "timeout", and larger sizes of the
+# same case are skipped. With --baseline, the run exits 1 when any case is slower
+# or bigger than baseline × threshold, or times out where the baseline finished.
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic_config import generate_config_tree
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_TIMEOUT = 300
+# Ignore differences below these floors (timer and allocator noise on tiny cases)
+MIN_SECONDS = 0.05
+MIN_RSS_MB = 5.0
+
+CASES = {
+    # Full resolve from the YAML tree, as `main.py resolve` runs it
+    "resolve": (
+        "from config_resolver import resolve_project_configs\n"
+        "from backend.local_yaml_backend import LocalYAMLBackend\n"
+        "backend = LocalYAMLBackend(CONFIG_DIR)\n"
+        "start = time.perf_counter()\n"
+        "result = resolve_project_configs(backend=backend)\n"
+        "items = len(result['resolved_networks'])\n"
+    ),
+    # IPAM alone: one block per network, then every VLAN subnet inside it
+    "ipam": (
+        "from backend.local_yaml_backend import LocalYAMLBackend\n"
+        "from ipam.allocator import IPAMAllocator\n"
+        "backend = LocalYAMLBackend(CONFIG_DIR)\n"
+        "ipam = backend.get_defaults()['ipam']\n"
+        "vlans = backend.get_vlans()['vlans']\n"
+        "networks = sum(len(p['networks']) for p in backend.get_manifest()['projects'])\n"
+        "start = time.perf_counter()\n"
+        "allocator = IPAMAllocator(ipam['supernet'], used_subnets=ipam.get('reserved', []))\n"
+        "for _ in range(networks):\n"
+        "    block = allocator.allocate_network_block(16)\n"
+        "    for vlan in vlans:\n"
+        "        allocator.allocate_vlan_subnet(block, vlan_id=vlan['id'], prefixlen=24)\n"
+        "items = networks * len(vlans)\n"
+    ),
+    # Device naming for every network's devices
+    "naming": (
+        "from backend.local_yaml_backend import LocalYAMLBackend\n"
+        "from meraki_sdk.device import generate_device_names\n"
+        "backend = LocalYAMLBackend(CONFIG_DIR)\n"
+        "naming = backend.get_defaults()['naming']\n"
+        "per_tag = {f\"{p['slug']}-{n['slug']}\": {**naming, **n.get('naming', {})}\n"
+        "           for p in backend.get_manifest()['projects'] for n in p['networks']}\n"
+        "groups = list(backend.iter_device_groups())\n"
+        "start = time.perf_counter()\n"
+        "items = sum(len(generate_device_names(g['devices'], per_tag[g['tag']])) for g in groups)\n"
+    ),
+    # YAML load + ${VAR} substitution walk over the device inventory
+    "loader": (
+        "import os\n"
+        "from config_loader import load_yaml_file\n"
+        "path = os.path.join(CONFIG_DIR, 'devices', 'devices.yaml')\n"
+        "start = time.perf_counter()\n"
+        "items = sum(len(g['devices']) for g in load_yaml_file(path)['groups'])\n"
+    ),
+}
+
+_RUNNER = """
+import json, logging, resource, sys, time
+sys.path.insert(0, {root!r})
+logging.disable(logging.WARNING)
+CONFIG_DIR = {config_dir!r}
+{body}
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"status": "ok", "items": items, "seconds": round(elapsed, 4), "peak_rss_mb": round(peak_kb / 1024, 1)}}))
+"""
+
+
+def run_case(name, config_dir, timeout=DEFAULT_TIMEOUT):
+    code = _RUNNER.format(root=str(ROOT), config_dir=str(config_dir), body=CASES[name])
+    try:
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             check=True, timeout=timeout, cwd=ROOT)
+    except subprocess.TimeoutExpired:
+        return {"status": "timeout", "timeout": timeout}
+    except subprocess.CalledProcessError as e:
+        return {"status": "error", "error": e.stderr.strip().splitlines()[-1] if e.stderr.strip() else str(e)}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run_suite(sizes=DEFAULT_SIZES, cases=tuple(CASES), timeout=DEFAULT_TIMEOUT, log=print):
+    results = {name: {} for name in cases}
+    stopped = set()
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_dir = Path(tmp) / "config"
+            generate_config_tree(config_dir, networks=size)
+            for name in cases:
+                if name in stopped:
+                    results[name][str(size)] = {"status": "skipped"}
+                    continue
+                result = results[name][str(size)] = run_case(name, config_dir, timeout)
+                if result["status"] == "ok":
+                    log(f"⏱️ {name:<8} {size:>6} networks: {result['seconds']:.3f}s, {result['peak_rss_mb']} MB peak RSS")
+                else:
+                    log(f"⚠️ {name:<8} {size:>6} networks: {result['status']} — skipping larger sizes")
+                    stopped.add(name)
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "sizes": list(sizes),
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=1.5):
+    """Return a list of regression messages (empty when within threshold)."""
+    regressions = []
+    for name, by_size in current["results"].items():
+        for size, result in by_size.items():
+            before = baseline.get("results", {}).get(name, {}).get(size)
+            if not before or before.get("status") != "ok":
+                continue
+            if result["status"] != "ok":
+                regressions.append(f"{name}@{size}: {result['status']} (baseline {before['seconds']}s)")
+                continue
+            for key, floor in (("seconds", MIN_SECONDS), ("peak_rss_mb", MIN_RSS_MB)):
+                limit = max(before[key] * threshold, before[key] + floor)
+                if result[key] > limit:
+                    regressions.append(f"{name}@{size}: {key} {result[key]} > {limit:.3f} (baseline {before[key]})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resolve, IPAM and device naming at scale.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help="Seconds per case before giving up")
+    parser.add_argument("-o", "--output", help="Write results as JSON")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=1.5, help="Allowed ratio vs baseline before failing")
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, args.cases, args.timeout)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        if regressions:
+            print("❌ Regressions vs baseline:")
+            for line in regressions:
+                print(f"   • {line}")
+            return 1
+        print(f"✅ Within {args.threshold}× of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# benchmarks/synthetic_config.py
+#
+# 🏗️ Synthetic config/ trees of any size, built from the real tree as a template
+#
+#   python -m benchmarks.synthetic_config /tmp/bench-config --networks 1000
+#
+# Everything outside the scale-dependent files is copied from config/, so the
+# resolver sees the same defaults, exclusions, routes and AutoVPN fragments.
+
+import argparse
+import math
+import shutil
+from pathlib import Path
+
+import yaml
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "config"
+DEVICE_TYPES = ("MX", "MS", "MR", "MV")
+VLAN_NAMES = ("MGMT", "Internal", "IoT", "Guest", "Corp", "Security", "Transit")
+DEVICE_TAGS = {"MX": ["hub-vpn"], "MS": ["access-switch"], "MR": [], "MV": []}
+
+
+def _ipam_layout(networks, vlans):
+    """
+    Keep the real layout (a /16 per network, VLAN-aligned /24s) and widen the
+    supernet past 10.0.0.0/8 when more than 256 networks need a block.
+    """
+    if vlans > 25:
+        raise ValueError("❌ VLAN IDs are 10, 20, ...; more than 25 VLANs do not fit a VLAN-aligned /16")
+    bits = math.ceil(math.log2(max(networks, 1)))
+    supernet = "10.0.0.0/8" if bits <= 8 else f"0.0.0.0/{max(0, 16 - bits)}"
+    return {
+        "supernet": supernet,
+        "allocation": {"network_prefix": 16, "vlan_prefix": 24},
+        "reserved": [],
+    }
+
+
+def _dump(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.safe_dump(data, f, sort_keys=False)
+
+
+def generate_config_tree(root, networks=100, networks_per_project=50, vlans=4,
+                         firewall_rules=20, ports=12, devices_per_network=4, fixed_per_network=2):
+    """
+    Write a config/ tree with `networks` networks split into projects of
+    `networks_per_project`. Returns a dict describing what was generated.
+    """
+    root = Path(root)
+    if root.exists():
+        shutil.rmtree(root)
+    shutil.copytree(TEMPLATE_DIR, root, ignore=shutil.ignore_patterns("projects"))
+
+    # ⚙️ defaults.yaml: same settings, IPAM sized for this tree
+    with open(TEMPLATE_DIR / "defaults.yaml", "r") as f:
+        defaults = yaml.safe_load(f)
+    defaults["ipam"] = _ipam_layout(networks, vlans)
+    _dump(root / "defaults.yaml", defaults)
+
+    # 🌐 VLANs named like the real tree first, so shared routes' gatewayRef still resolves
+    vlan_list = [{"id": 10 * (i + 1), "name": VLAN_NAMES[i] if i < len(VLAN_NAMES) else f"VLAN{10 * (i + 1)}",
+                  "dhcpHandling": "Run a DHCP server", "dnsNameservers": "upstream_dns",
+                  "dhcpLeaseTime": "12 hours", "reservedIpRanges": [], "fixedIpAssignments": {}}
+                 for i in range(vlans)]
+    _dump(root / "common" / "vlans" / "mx_vlans.yaml", {"vlans": vlan_list})
+
+    # 🔥 Firewall rules referencing VLAN macros
+    rules = [{"comment": f"Rule {i}", "policy": "allow" if i % 3 else "deny", "protocol": "tcp",
+              "srcPort": "any", "srcCidr": f"VLAN({vlan_list[i % vlans]['id']}).*",
+              "destPort": str(1000 + i), "destCidr": f"10.{100 + i % 100}.0.0/16", "syslogEnabled": False}
+             for i in range(firewall_rules)]
+    _dump(root / "common" / "firewall" / "mx_firewall.yaml", {"outbound_rules": rules})
+
+    # 🔌 MX ports: two WAN, the rest LAN on the second VLAN
+    lan_vlan = vlan_list[min(1, vlans - 1)]["id"]
+    port_list = [{"portId": p, "name": f"WAN {p}", "type": "wan", "enabled": True} for p in (1, 2)]
+    port_list += [{"portId": p, "name": "Internal", "enabled": True, "type": "access", "vlan": lan_vlan,
+                   "dropUntaggedTraffic": False, "poeEnabled": p % 2 == 0, "allowedVlans": "all",
+                   "accessPolicy": "Open"} for p in range(3, ports + 1)]
+    _dump(root / "common" / "ports" / "mx_ports.yaml", {"ports": port_list})
+
+    # 🧱 Projects and networks
+    projects = []
+    groups = []
+    project_count = math.ceil(networks / networks_per_project)
+    for p in range(project_count):
+        slug = f"bench_project_{p:04d}"
+        nets = []
+        fixed = {}
+        for n in range(p * networks_per_project, min(networks, (p + 1) * networks_per_project)):
+            net_slug = f"net_{n:05d}"
+            nets.append({
+                "base_name": f"Bench Net {n:05d}",
+                "slug": net_slug,
+                "naming": {"building": f"b{n % 100:02d}", "room": "rack", "function": "edge"},
+                "config": {
+                    "vlans": "common/vlans.yaml",
+                    "firewall": "common/firewall/mx_firewall.yaml",
+                    "mx_ports": "common/ports/mx_ports.yaml",
+                    "fixed_assignments": f"projects/{slug}/fixed_ip_assignments.yaml",
+                },
+            })
+            fixed[net_slug] = {
+                vlan_list[min(1, vlans - 1)]["name"]: {
+                    f"02:00:{n >> 8 & 0xff:02x}:{n & 0xff:02x}:{k >> 8 & 0xff:02x}:{k & 0xff:02x}": {
+                        "offset": 20 + k, "name": f"Host {k}", "tags": ["static"]}
+                    for k in range(fixed_per_network)
+                }
+            }
+            groups.append({
+                "tag": f"{slug}-{net_slug}",
+                "devices": [{"serial": f"Q2BN-{n:05d}-{d:03d}", "type": DEVICE_TYPES[d % len(DEVICE_TYPES)],
+                             "model": "MX68" if d % len(DEVICE_TYPES) == 0 else "GEN",
+                             "tags": DEVICE_TAGS[DEVICE_TYPES[d % len(DEVICE_TYPES)]]}
+                            for d in range(devices_per_network)],
+            })
+        projects.append({"name": f"Bench Project {p:04d}", "slug": slug,
+                         "org_base_name": f"Bench Org {p:04d}", "networks": nets})
+        _dump(root / "projects" / slug / "fixed_ip_assignments.yaml", fixed)
+
+    _dump(root / "manifest.yaml", {"defaults": "defaults.yaml", "devices": "devices/devices.yaml", "projects": projects})
+    _dump(root / "devices" / "devices.yaml", {"groups": groups})
+
+    return {"networks": networks, "projects": project_count, "vlans": vlans, "firewall_rules": firewall_rules,
+            "ports": ports, "devices": networks * devices_per_network, "ipam": defaults["ipam"]["allocation"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic config/ tree.")
+    parser.add_argument("root")
+    parser.add_argument("--networks", type=int, default=100)
+    parser.add_argument("--networks-per-project", type=int, default=50)
+    parser.add_argument("--vlans", type=int, default=4)
+    parser.add_argument("--firewall-rules", type=int, default=20)
+    parser.add_argument("--ports", type=int, default=12)
+    parser.add_argument("--devices-per-network", type=int, default=4)
+    args = parser.parse_args()
+
+    summary = generate_config_tree(
+        args.root, args.networks, args.networks_per_project, args.vlans,
+        args.firewall_rules, args.ports, args.devices_per_network,
+    )
+    print(f"🏗️ Generated {summary['networks']} networks in {summary['projects']} projects at {args.root}")
+
+
+if __name__ == "__main__":
+    main()
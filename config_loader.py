@@ -5,25 +5,59 @@ import re
 CONFIG_DIR = "config"
 
 
-def check_unresolved(data):
-    if re.search(r"\$\{\w+\}", str(data)):
-        raise ValueError("Unresolved environment variables found in config.")
+# 🔎 Compiled once; matches ${VAR} references in string values
+ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")
 
-def resolve_env_vars(data):
+def _join_path(path, key):
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else str(key)
+
+def _substitute(data, path, unresolved):
+    """
+    Walk the tree once: substitute ${VAR} from the environment and record
+    (key_path, reference) for every variable that is not set.
+    Mapping keys are never substituted; a ${VAR} in a key is always reported.
+    """
     if isinstance(data, dict):
-        return {k: resolve_env_vars(v) for k, v in data.items()}
+        for k in data:
+            if isinstance(k, str) and "${" in k:
+                unresolved.extend((_join_path(path, k), m.group(0)) for m in ENV_VAR_PATTERN.finditer(k))
+        return {k: _substitute(v, _join_path(path, k), unresolved) for k, v in data.items()}
     elif isinstance(data, list):
-        return [resolve_env_vars(i) for i in data]
-    elif isinstance(data, str):
-        return re.sub(r"\$\{(\w+)\}", lambda m: os.environ.get(m.group(1), m.group(0)), data)
+        return [_substitute(v, _join_path(path, i), unresolved) for i, v in enumerate(data)]
+    elif isinstance(data, str) and "${" in data:
+        def replace(match):
+            value = os.environ.get(match.group(1))
+            if value is None:
+                unresolved.append((path or "<root>", match.group(0)))
+                return match.group(0)
+            return value
+        return ENV_VAR_PATTERN.sub(replace, data)
     return data
 
+def _unresolved_error(unresolved, source=None):
+    details = ", ".join(f"{key_path} ({ref})" for key_path, ref in unresolved)
+    where = f" in {source}" if source else ""
+    return ValueError(f"Unresolved environment variables found{where}: {details}")
+
+def check_unresolved(data):
+    unresolved = []
+    _substitute(data, "", unresolved)
+    if unresolved:
+        raise _unresolved_error(unresolved)
+
+def resolve_env_vars(data):
+    return _substitute(data, "", [])
+
 def load_yaml_file(path):
     with open(path, "r") as f:
         raw = yaml.safe_load(f)
-        resolved = resolve_env_vars(raw)
-        check_unresolved(resolved)
-        return resolved
+    unresolved = []
+    resolved = _substitute(raw, "", unresolved)
+    if unresolved:
+        raise _unresolved_error(unresolved, path)
+    return resolved
 
 def load_common_file(relative_path):
     path = os.path.join(CONFIG_DIR, "common", relative_path)
@@ -1,10 +1,13 @@
-import os
-import yaml
 import ipaddress
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from backend.prefetch import prefetch, PREFETCH_WORKERS
 from ipam.allocator import IPAMAllocator
-from utils.state.runtime import load_runtime_state
+from ipam.vlan_index import VLANIndex
+from utils.state.runtime import load_runtime_snapshot
+from utils.intern import SECTION_POOL
+from models import VLAN, MXPortSpec, StaticRoute, FirewallRule, SSID, AutoVPNSettings, DeviceInventory, ProviderInventory
 
 CONFIG_DIR = "config"
 logger = logging.getLogger(__name__)
@@ -25,18 +28,17 @@ def merge_dicts(base, override):
 
 # 🔄 Flatten the grouped device inventory into a flat list of Meraki devices
 def flatten_devices(grouped):
-    result = []
-    for group in grouped.get("groups", []):
-        tag = group["tag"]
-        for device in group["devices"]:
-            d = device.copy()
-            if "tags" not in d:
-                d["tags"] = [tag]
-            result.append(d)
-    return result
+    return DeviceInventory.of(grouped).devices
 
 def resolve_mx_ports(defaults, backend, project_overrides=None, network_slug=None):
-    from copy import deepcopy
+    """
+    Resolve one network's MX ports into an MXPortSpec (models/ports.py).
+
+    Compatibility: this used to return {"defaults": ..., "ports": [...]} with
+    every range expanded into one dict per port. Use `spec.defaults`, iterate
+    the spec for per-port MXPort records (`spec.port(n)` for one), or
+    `spec.to_dict()` for the compact {"defaults", "ports"} form with ranges kept.
+    """
     logger.debug(f"[MX PORTS ENTRY] network_slug={network_slug}, project_overrides={project_overrides}")
     config = {"defaults": {}, "ports": []}
 
@@ -79,33 +81,13 @@ def resolve_mx_ports(defaults, backend, project_overrides=None, network_slug=Non
         else:
             logger.warning(f"[MX PORTS] Expected dict for 'mx_ports', got {type(mx_ports_override).__name__}")
 
-    # Normalize portId/port and expand port ranges (single values and ranges)
-    logger.debug(f"[MX PORTS] Before expanding port ranges: {config['ports']}")
-    expanded_ports = []
-    for port_def in config["ports"]:
-        port_field = port_def.get("portId") or port_def.get("port")
-        if isinstance(port_field, str) and "-" in port_field:
-            try:
-                start, end = map(int, port_field.split("-"))
-                for p in range(start, end + 1):
-                    new_def = deepcopy(port_def)
-                    new_def["port"] = p
-                    new_def.pop("portId", None)  # remove original range
-                    expanded_ports.append(new_def)
-            except Exception as e:
-                logger.warning(f"⚠️ Invalid port range '{port_field}': {e}")
-        else:
-            new_def = deepcopy(port_def)
-            new_def["port"] = int(port_field) if port_field is not None else None
-            expanded_ports.append(new_def)
-    config["ports"] = expanded_ports
-    logger.debug(f"[MX PORTS] Expanded port list: {config['ports']}")
-
-    logger.debug(f"[MX PORTS] Final resolved ports: {config['ports']}, defaults: {config['defaults']}")
-    return config
+    # Keep port ranges compact; payloads are materialised per port at push time
+    spec = MXPortSpec(config["defaults"], config["ports"])
+    logger.debug(f"[MX PORTS] Final resolved ports: {len(spec)} port(s) from {len(spec.profiles)} profile(s), defaults: {config['defaults']}")
+    return spec
 
 # 📡 Resolve MX static routes config from common + project overrides
-def resolve_mx_static_routes(defaults, backend, project_overrides=None, resolved_vlans=None):
+def resolve_mx_static_routes(defaults, backend, project_overrides=None, resolved_vlans=None, vlan_index=None):
     config = {"routes": []}
 
     if "mx_static_routes" in defaults:
@@ -121,43 +103,34 @@ def resolve_mx_static_routes(defaults, backend, project_overrides=None, resolved
         override_path = project_overrides.get("mx_static_routes")
         if isinstance(override_path, str):
             try:
-                full_path = os.path.join(CONFIG_DIR, override_path)
-                with open(full_path, "r") as f:
-                    override = yaml.safe_load(f)
-                    config["routes"] += override.get("routes", [])
+                override = backend.get_fragment(override_path)
+                config["routes"] += override.get("routes", [])
             except Exception as e:
                 logger.warning(f"⚠️ Failed to load project mx_static_routes override from '{override_path}': {e}")
         elif isinstance(override_path, dict):
             config["routes"] += override_path.get("routes", [])
 
-    # 🧠 Resolve gatewayRef → gatewayIp using resolved_vlans
+    # 🧠 Resolve gatewayRef → gatewayIp using the network's VLAN index
+    vlan_index = vlan_index or VLANIndex(resolved_vlans)
     processed = []
     for route in config["routes"]:
-        route = deepcopy(route)
-        gw_ref = route.get("gatewayRef")
-
-        if gw_ref and not route.get("gatewayIp") and resolved_vlans:
-            gw_ref_str = str(gw_ref).lower()
-            matched = next(
-                (
-                    v for v in resolved_vlans
-                    if str(v.get("id")) == str(gw_ref) or str(v.get("name", "")).lower() == gw_ref_str
-                ),
-                None
-            )
+        route = StaticRoute.from_dict(route)
+        gw_ref = route.gateway_ref
+
+        if gw_ref and not route.gateway_ip and vlan_index.vlans:
+            matched = vlan_index.get(gw_ref)
             if matched:
-                route["gatewayIp"] = matched["gatewayIp"]
+                route.gateway_ip = matched["gatewayIp"]
             else:
-                logger.warning(f"⚠️ Could not resolve gatewayRef '{gw_ref}' in route '{route.get('name', 'Unnamed')}'")
+                logger.warning(f"⚠️ Could not resolve gatewayRef '{gw_ref}' in route '{route.name or 'Unnamed'}'")
 
         processed.append(route)
 
     return {"routes": processed}
 
 # 🔥 Resolve MX firewall rules config from common + project overrides
-def resolve_firewall_rules(defaults, backend, project_overrides=None, resolved_vlans=None):
+def resolve_firewall_rules(defaults, backend, project_overrides=None, resolved_vlans=None, vlan_index=None):
     import logging
-    from copy import deepcopy
     logger = logging.getLogger(__name__)
 
     # Base structure with empty rule sets
@@ -182,38 +155,27 @@ def resolve_firewall_rules(defaults, backend, project_overrides=None, resolved_v
         override_path = project_overrides.get("firewall")
         if isinstance(override_path, str):
             try:
-                full_path = os.path.join(CONFIG_DIR, override_path)
-                with open(full_path, "r") as f:
-                    override = yaml.safe_load(f)
-                    config.update(override)
+                override = backend.get_fragment(override_path)
+                config.update(override)
             except Exception as e:
                 logger.warning(f"⚠️ Failed to load project firewall override from '{override_path}': {e}")
         elif isinstance(override_path, dict):
             config.update(override_path)
 
-    # 4️⃣ Helper: convert VLAN(10) → actual subnet CIDR using resolved VLANs
+    # 4️⃣ Helper: convert VLAN(10) → actual subnet CIDR using the VLAN index
+    vlan_index = vlan_index or VLANIndex(resolved_vlans)
+
     def resolve_cidr(value):
-        if not isinstance(value, str) or "VLAN(" not in value:
-            return value  # nothing to resolve
-        for vlan in resolved_vlans or []:
-            cidr = vlan.get("subnet")
-            if not cidr:
-                continue
-            patterns = [f"VLAN({vlan['id']})", f"VLAN({vlan['name']})"]
-            for pat in patterns:
-                if pat in value:
-                    return value.replace(pat, cidr)
-        logger.warning(f"⚠️ Could not resolve VLAN reference in CIDR field: {value}")
-        return value  # fallback unchanged
+        return vlan_index.resolve_refs(value)
 
     # 5️⃣ Normalize each rule, resolving CIDRs only for inbound rules
     def resolve_rule(rule, resolve_vlan_refs=True):
-        rule = deepcopy(rule)
+        rule = dict(rule)
         if resolve_vlan_refs:
             rule["srcCidr"] = resolve_cidr(rule.get("srcCidr", "any"))
             rule["destCidr"] = resolve_cidr(rule.get("destCidr", "any"))
         logger.debug(f"[FIREWALL] Resolved rule: {rule}")
-        return rule
+        return FirewallRule.from_dict(rule)
 
     # 6️⃣ Resolve rules: outbound can keep Meraki-native VLAN() syntax, inbound must resolve to CIDR
     outbound = [resolve_rule(r, resolve_vlan_refs=False) for r in config.get("outbound_rules", [])]
@@ -331,32 +293,32 @@ def resolve_mx_wireless(defaults, backend, project_overrides=None):
         override_path = project_overrides.get("mx_wireless")
         if isinstance(override_path, str):
             try:
-                full_path = os.path.join(CONFIG_DIR, override_path)
-                with open(full_path, "r") as f:
-                    override = yaml.safe_load(f)
-                    config["ssids"] = override.get("ssids", config["ssids"])
-                    config["defaults"].update(override.get("defaults", {}))
+                override = backend.get_fragment(override_path)
+                config["ssids"] = override.get("ssids", config["ssids"])
+                config["defaults"].update(override.get("defaults", {}))
             except Exception as e:
                 logger.warning(f"⚠️ Failed to load project mx_wireless override from '{override_path}': {e}")
         elif isinstance(override_path, dict):
             config["ssids"] = override_path.get("ssids", config["ssids"])
             config["defaults"].update(override_path.get("defaults", {}))
 
+    config["ssids"] = [SSID.of(ssid) for ssid in config["ssids"]]
     return config
 
 # 📎 Resolve fixed IP assignments and inject into matching VLANs
 def resolve_fixed_assignments(fixed_assignments, resolved_vlans):
     import logging
     import ipaddress
-    from copy import deepcopy
     logger = logging.getLogger(__name__)
 
+    resolved_vlans = [VLAN.of(vlan) for vlan in resolved_vlans]
+
     # 1️⃣ Build quick lookup by VLAN name
-    vlan_map = {vlan["name"]: vlan for vlan in resolved_vlans}
+    vlan_map = {vlan.name: vlan for vlan in resolved_vlans}
 
     # 2️⃣ Initialize each with an empty fixedIpAssignments field
     for vlan in resolved_vlans:
-        vlan["fixedIpAssignments"] = {}
+        vlan.fixed_ip_assignments = {}
 
     # 3️⃣ Assign IPs based on offset
     for vlan_name, mac_map in fixed_assignments.items():
@@ -365,7 +327,7 @@ def resolve_fixed_assignments(fixed_assignments, resolved_vlans):
             continue
 
         target_vlan = vlan_map[vlan_name]
-        subnet = target_vlan.get("subnet")
+        subnet = target_vlan.subnet
 
         if not subnet:
             logger.warning(f"⚠️ VLAN '{vlan_name}' has no subnet — skipping fixed IPs.")
@@ -385,7 +347,7 @@ def resolve_fixed_assignments(fixed_assignments, resolved_vlans):
                 logger.error(f"❌ Invalid offset {offset} in subnet {subnet}: {e}")
                 continue
 
-            target_vlan["fixedIpAssignments"][mac] = {
+            target_vlan.fixed_ip_assignments[mac] = {
                 "ip": ip,
                 "name": entry.get("name", ""),
                 "tags": entry.get("tags", []),
@@ -393,12 +355,61 @@ def resolve_fixed_assignments(fixed_assignments, resolved_vlans):
 
     # ✅ Log final result
     for vlan in resolved_vlans:
-        if vlan["fixedIpAssignments"]:
-            logger.info(f"📌 Fixed IPs for VLAN {vlan['name']}: {vlan['fixedIpAssignments']}")
+        if vlan.fixed_ip_assignments:
+            logger.info(f"📌 Fixed IPs for VLAN {vlan.name}: {vlan.fixed_ip_assignments}")
 
     return resolved_vlans
 
+def _project_slug(project):
+    return project.get("slug") or project["name"].lower().replace(" ", "_")
+
+
+def _network_slug(net):
+    return net.get("slug") or net["base_name"].lower().replace(" ", "_")
+
+
+# 🚀 Every backend read the manifest will trigger, as (provider, method, args)
+def plan_prefetch(manifest, backend_for):
+    calls = [
+        (backend_for("vlans"), "get_vlans", ()),
+        (backend_for("exclusions"), "get_exclusions", ()),
+        (backend_for("firewall_rules"), "get_firewall_rules", ()),
+        (backend_for("static_routes"), "get_mx_static_routes", ()),
+        (backend_for("mx_ports"), "get_mx_ports", ()),
+        (backend_for("mx_wireless"), "get_mx_wireless", ()),
+        (backend_for("mx_autovpn"), "get_mx_autovpn_common", ()),
+    ]
+    # 📌 Providers with per-network fixed-assignment lookups are queried network by network instead
+    fixed_backend = backend_for("fixed_assignments")
+    per_network_fixed = hasattr(fixed_backend, "get_network_fixed_assignments")
+    for project in manifest.get("projects", []):
+        project_slug = _project_slug(project)
+        if not per_network_fixed:
+            calls.append((fixed_backend, "get_fixed_assignments", (project_slug,)))
+        calls += [
+            (backend_for("mx_ports"), "get_fragment", (f"projects/{project_slug}/ports/mx_ports.yaml",)),
+            (backend_for("mx_autovpn"), "get_mx_autovpn_project", (project_slug,)),
+        ]
+        for net in project.get("networks", []):
+            overrides = net.get("config", {})
+            for key, resource in (("firewall", "firewall_rules"), ("mx_static_routes", "static_routes"), ("mx_wireless", "mx_wireless")):
+                if isinstance(overrides.get(key), str):
+                    calls.append((backend_for(resource), "get_fragment", (overrides[key],)))
+
+    # 🧹 Same provider + same read → fetched once
+    unique = {}
+    for provider, method, args in calls:
+        unique.setdefault((id(provider), method, args), (provider, method, args))
+    return list(unique.values())
+
+
 # 🔧 Resolve and merge all config layers: defaults → org → network → device
+#
+# Returns {"resolved_networks": [...], "inventory": DeviceInventory | ProviderInventory}.
+# Look devices up through "inventory" (`for_tag`, `get`, iteration). The flat
+# "devices" list is only included for in-memory inventories; provider-backed
+# ones (SQLite) are never flattened here, so callers that need the whole list
+# iterate the inventory (as `main.py resolve` does).
 def resolve_project_configs(config_dir=CONFIG_DIR, backend=None):
     # 📦 Dynamic or injected backend resolver
     if backend is None:
@@ -415,14 +426,35 @@ def resolve_project_configs(config_dir=CONFIG_DIR, backend=None):
     firewall_backend = get_backend_for("firewall_rules", defaults_backend.get_defaults())
     static_routes_backend = get_backend_for("static_routes", defaults_backend.get_defaults())
     exclusions_backend = get_backend_for("exclusions", defaults_backend.get_defaults())
+    mx_ports_backend = get_backend_for("mx_ports", defaults_backend.get_defaults())
+    wireless_backend = get_backend_for("mx_wireless", defaults_backend.get_defaults())
+    autovpn_backend = get_backend_for("mx_autovpn", defaults_backend.get_defaults())
 
     defaults = defaults_backend.get_defaults()
     manifest = manifest_backend.get_manifest()
-    raw_devices = devices_backend.get_devices()
+    # ♻️ Sections (and the payloads built from them) from an earlier resolve are dropped
+    SECTION_POOL.clear()
+
+    # 🚀 Fetch everything the manifest needs concurrently (warms provider caches),
+    # while the device inventory streams in on the same pool
+    with ThreadPoolExecutor(max_workers=PREFETCH_WORKERS) as pool:
+        if ProviderInventory.supports(devices_backend):
+            # 🗄️ Indexed provider (SQLite): main.py queries each network's devices directly
+            inventory_future = None
+            inventory = ProviderInventory(devices_backend)
+        else:
+            inventory_future = pool.submit(lambda: DeviceInventory.from_groups(devices_backend.iter_device_groups()))
+        prefetch(plan_prefetch(manifest, lambda resource: get_backend_for(resource, defaults)), executor=pool)
+        if inventory_future is not None:
+            # 📇 One index for the run; main.py selects each network's devices from it
+            inventory = inventory_future.result()
+
     base_vlans = vlans_backend.get_vlans().get("vlans", [])
     exclusions = exclusions_backend.get_exclusions()
 
-    runtime = {}
+    # 🧠 Hub lookups for AutoVPN: manifest network_id, else the ID deploy recorded in the
+    # runtime store, else "TBD" (deploy fills it in once the hub exists)
+    runtime = load_runtime_snapshot()
 
     # 🧯 Setup shared IPAM allocator
     ipam_cfg = defaults.get("ipam", {})
@@ -439,33 +471,28 @@ def resolve_project_configs(config_dir=CONFIG_DIR, backend=None):
     default_vlan_cidr = int(alloc["vlan_prefix"])
 
     allocator = IPAMAllocator(ipam_supernet, used_subnets=reserved_blocks)
-    devices = flatten_devices(raw_devices)
     resolved = []
 
     for project in manifest.get("projects", []):
         project_name = project["name"]
         org_base = project["org_base_name"]
-        project_slug = project.get("slug") or project_name.lower().replace(" ", "_")
+        project_slug = _project_slug(project)
 
-        # 🔁 Load all fixed IPs across all networks in this project
+        # 🔁 Load all fixed IPs across all networks in this project (or per network, if the provider is indexed)
         fixed_ip_backend = get_backend_for("fixed_assignments", defaults)
-        fixed_ips_by_network_slug = fixed_ip_backend.get_fixed_assignments(project_slug)
+        per_network_fixed = hasattr(fixed_ip_backend, "get_network_fixed_assignments")
+        fixed_ips_by_network_slug = {} if per_network_fixed else fixed_ip_backend.get_fixed_assignments(project_slug)
 
         # 🧠 Pre-populate runtime["projects"][project_slug]["networks"] for all networks in this project
+        project_runtime = runtime["projects"].setdefault(project_slug, {"org": {}, "networks": {}})
         for net in project.get("networks", []):
-            net_base = net["base_name"]
-            network_slug = net.get("slug") or net_base.lower().replace(" ", "_")
-            if "projects" not in runtime:
-                runtime["projects"] = {}
-            if project_slug not in runtime["projects"]:
-                runtime["projects"][project_slug] = {"networks": {}}
-            runtime["projects"][project_slug]["networks"][network_slug] = {
-                "network_id": net.get("network_id", "TBD")
-            }
+            stored = project_runtime["networks"].get(_network_slug(net), {})
+            network_id = net.get("network_id") or stored.get("network_id") or "TBD"
+            project_runtime["networks"][_network_slug(net)] = {**stored, "network_id": network_id}
 
         for net in project.get("networks", []):
             net_base = net["base_name"]
-            network_slug = net.get("slug") or net_base.lower().replace(" ", "_")  # 👈 Static slug
+            network_slug = _network_slug(net)  # 👈 Static slug
             full_tag = f"{project_slug}-{network_slug}"
 
             # 🧰 Allocate fresh IPAM block
@@ -497,21 +524,33 @@ def resolve_project_configs(config_dir=CONFIG_DIR, backend=None):
 
                 vlan["subnet"] = subnet
                 vlan["gatewayIp"] = str(ipaddress.ip_network(subnet)[1])
-                processed_vlans.append(vlan)
+                processed_vlans.append(VLAN.from_dict(vlan))
 
             # 📎 Inject fixed IPs (only for this static network_slug)
-            network_fixed_ips = fixed_ips_by_network_slug.get(network_slug, {})
+            if per_network_fixed:
+                network_fixed_ips = fixed_ip_backend.get_network_fixed_assignments(project_slug, network_slug)
+            else:
+                network_fixed_ips = fixed_ips_by_network_slug.get(network_slug, {})
             processed_vlans = resolve_fixed_assignments(network_fixed_ips, processed_vlans)
 
+            # 🗂️ One VLAN index per network, shared by the firewall and route resolvers
+            vlan_index = VLANIndex(processed_vlans)
+
             # 📦 Assemble full config
             net_config["vlans"] = processed_vlans
-            net_config["firewall"] = resolve_firewall_rules(
+            firewall = resolve_firewall_rules(
                 defaults,
-                backend,
+                firewall_backend,
                 net.get("config", {}),
-                processed_vlans
+                processed_vlans,
+                vlan_index=vlan_index
             )
-            net_config["mx_static_routes"] = resolve_mx_static_routes(defaults, backend, net.get("config", {}), processed_vlans)["routes"]
+            # ♻️ Identical rule lists across networks share one immutable instance
+            net_config["firewall"] = {
+                direction: SECTION_POOL.intern(f"firewall.{direction}", rules)
+                for direction, rules in firewall.items()
+            }
+            net_config["mx_static_routes"] = resolve_mx_static_routes(defaults, static_routes_backend, net.get("config", {}), processed_vlans, vlan_index=vlan_index)["routes"]
             net_config["exclusions"] = exclusions
             net_config["fixed_assignments"] = network_fixed_ips
             logger.debug(f"[MX PORTS DEBUG] Calling resolve_mx_ports for network_slug={network_slug}")
@@ -522,46 +561,39 @@ def resolve_project_configs(config_dir=CONFIG_DIR, backend=None):
                 if "config" not in net:
                     net["config"] = {}
                 net["config"]["mx_ports"] = mx_ports_override
-            # 🔍 Attempt to load project-level mx_ports override from file
-            project_ports_path = os.path.join(config_dir, f"projects/{project_slug}/ports/mx_ports.yaml")
-            if os.path.exists(project_ports_path):
-                try:
-                    with open(project_ports_path, "r") as f:
-                        loaded_ports_yaml = yaml.safe_load(f)
-                        if "config" not in net:
-                            net["config"] = {}
-                        net["config"]["mx_ports"] = loaded_ports_yaml.get("mx_ports", {})
-                        logger.info(f"[MX PORTS DEBUG] Loaded mx_ports override for {network_slug} from file")
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to load mx_ports override from file: {e}")
-            resolved_mx_ports = resolve_mx_ports(defaults, backend, net.get("config", {}), network_slug)
-            mx_defaults = resolved_mx_ports.get("defaults", {})
-            mx_ports = resolved_mx_ports.get("ports", [])
-
-            # Merge defaults into each port
-            merged_ports = []
-            for port in mx_ports:
-                merged = merge_dicts(mx_defaults, port)
-                merged_ports.append(merged)
-
-            net_config["mx_ports"] = merged_ports
-            logger.debug(f"[MX PORTS DEBUG] resolved mx_ports: {net_config['mx_ports']}")
-            net_config["mx_wireless"] = resolve_mx_wireless(defaults, backend, net.get("config", {}))
-            # 🧠 Track runtime network ID mapping for AutoVPN resolution (now handled above)
-            # runtime["projects"][project_slug]["networks"][network_slug] = {
-            #     "network_id": net.get("network_id", "TBD")  # use actual ID if available earlier
-            # }
-            net_config["mx_autovpn"] = resolve_mx_autovpn(
-                backend,
+            # 🔍 Attempt to load project-level mx_ports override (cached; read once per project)
+            try:
+                loaded_ports_yaml = mx_ports_backend.get_fragment(f"projects/{project_slug}/ports/mx_ports.yaml")
+                if "config" not in net:
+                    net["config"] = {}
+                net["config"]["mx_ports"] = loaded_ports_yaml.get("mx_ports", {})
+                logger.info(f"[MX PORTS DEBUG] Loaded mx_ports override for {network_slug} from file")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to load mx_ports override from file: {e}")
+            net_config["mx_ports"] = SECTION_POOL.intern(
+                "mx_ports",
+                resolve_mx_ports(defaults, mx_ports_backend, net.get("config", {}), network_slug)
+            )
+            logger.debug(f"[MX PORTS DEBUG] resolved mx_ports: {net_config['mx_ports'].to_dict()}")
+            net_config["mx_wireless"] = SECTION_POOL.intern(
+                "mx_wireless",
+                resolve_mx_wireless(defaults, wireless_backend, net.get("config", {}))
+            )
+            mx_autovpn = resolve_mx_autovpn(
+                autovpn_backend,
                 project_slug,
                 network_slug,
                 net.get("config", {}),
                 processed_vlans,
                 runtime=runtime
             )
+            net_config["mx_autovpn"] = AutoVPNSettings.from_dict(mx_autovpn) if mx_autovpn else {}
 
             resolved.append({
                 "project_name": project_name,
+                "project_slug": project_slug,
                 "org_base_name": org_base,
                 "net_base_name": net_base,
                 "full_tag": full_tag,
@@ -569,7 +601,8 @@ def resolve_project_configs(config_dir=CONFIG_DIR, backend=None):
                 "network_slug": network_slug,
             })
 
-    return {
-        "resolved_networks": resolved,
-        "devices": devices,
-    }
+    result = {"resolved_networks": resolved}
+    if isinstance(inventory, DeviceInventory):
+        result["devices"] = inventory.devices  # provider-backed inventories are never flattened here
+    result["inventory"] = inventory
+    return result
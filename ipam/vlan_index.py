@@ -0,0 +1,110 @@
+# ipam/vlan_index.py
+
+import re
+import logging
+import ipaddress
+
+logger = logging.getLogger(__name__)
+
+# 🔎 Compiled once, one matcher per macro form:
+#   VLAN_REF   → VLAN(id) / VLAN(name) anywhere in a CIDR field (config resolver)
+#   VLAN_MACRO → a leading VLAN(id).* / VLAN(id).y (firewall configurator)
+VLAN_REF = re.compile(r"VLAN\(([^)]+)\)")
+VLAN_MACRO = re.compile(r"VLAN\((\d+)\)\.(\*|\d+)")
+
+
+class VLANIndex:
+    """
+    Lookup table over one network's resolved VLANs.
+
+    VLANs are keyed by ID (as a string, so 20 and "20" hit the same entry)
+    and by case-folded name, so gatewayRef values and VLAN(...) macros resolve
+    in O(1) instead of scanning the VLAN list for every rule or route.
+    """
+
+    def __init__(self, vlans=None):
+        self.vlans = list(vlans or [])
+        self.by_id = {}
+        self.by_name = {}
+        for vlan in self.vlans:
+            if vlan.get("id") is not None:
+                self.by_id.setdefault(str(vlan["id"]), vlan)
+            if vlan.get("name"):
+                self.by_name.setdefault(str(vlan["name"]).casefold(), vlan)
+
+    @classmethod
+    def of(cls, vlans):
+        """
+        Return `vlans` unchanged if it is already an index, otherwise build one.
+        Lets callers pass either a prebuilt index or a plain VLAN list.
+        """
+        return vlans if isinstance(vlans, cls) else cls(vlans)
+
+    def get(self, ref):
+        """
+        Resolve a VLAN reference (ID or name) to its VLAN dict, or None.
+        """
+        if ref is None:
+            return None
+        key = str(ref).strip()
+        return self.by_id.get(key) or self.by_name.get(key.casefold())
+
+    def expand(self, vlan, host_part=None):
+        """
+        Render a VLAN as a CIDR: the full subnet for `*`/no host part, or a /32
+        for host number `host_part` of the subnet (e.g. VLAN(20).5 → 10.x.20.5/32).
+        Raises ValueError if the host is outside the subnet.
+        """
+        subnet = vlan.get("subnet")
+        if not subnet or host_part in (None, "*"):
+            return subnet
+        network = ipaddress.ip_network(subnet, strict=False)
+        host = int(host_part)
+        if host >= network.num_addresses:
+            raise ValueError(f"host {host} is outside {subnet}")
+        return f"{network[host]}/32"
+
+    def resolve_refs(self, value):
+        """
+        Replace each VLAN(id) / VLAN(name) reference in `value` with the VLAN's subnet.
+        Unknown references (or VLANs without a subnet) are left untouched and logged.
+        """
+        if not isinstance(value, str) or "VLAN(" not in value:
+            return value
+
+        def replace(match):
+            vlan = self.get(match.group(1))
+            if not vlan or not vlan.get("subnet"):
+                logger.warning(f"⚠️ Could not resolve VLAN reference in CIDR field: {value}")
+                return match.group(0)
+            return vlan["subnet"]
+
+        return VLAN_REF.sub(replace, value)
+
+    def resolve_macros(self, value):
+        """
+        Resolve a CIDR field that starts with VLAN(id).* or VLAN(id).y to the
+        VLAN's subnet or host IP. Anything else is returned unchanged; unknown
+        VLANs, missing subnets and out-of-range hosts are logged.
+        """
+        if not isinstance(value, str):
+            return value
+        match = VLAN_MACRO.match(value)
+        if not match:
+            return value
+
+        vlan_id, host_part = match.groups()
+        vlan = self.by_id.get(str(int(vlan_id)))
+        if not vlan:
+            logger.warning(f"⚠️ No resolved VLAN found with ID {vlan_id} for macro '{value}'")
+            return value
+        try:
+            resolved = self.expand(vlan, host_part)
+        except ValueError as e:
+            logger.warning(f"⚠️ Invalid macro '{value}': {e}")
+            return value
+        if not resolved:
+            logger.warning(f"⚠️ VLAN {vlan_id} has no subnet defined for macro '{value}'")
+            return value
+        logger.debug(f"[DEBUG] Resolved macro '{value}' → '{resolved}'")
+        return resolved
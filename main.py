@@ -1,205 +1,463 @@
 import argparse
+import json
 import logging
 import os
-from utils.logging.config import setup_logging
-from utils.logging.summary import log_deployment_summary
-from utils.logging.summary import collect_deployment_summary, print_final_summary
-from utils.state.config import save_intended_state
-from utils.state.runtime import save_runtime_state
-from meraki_sdk.auth import get_dashboard_session
-from meraki_sdk.basic_network import ensure_network
-from meraki_sdk.device import remove_devices_from_network
-from meraki_sdk.devices import setup_devices
-from meraki_sdk.network.setup_network import setup_network
-from meraki_sdk.org import get_next_sequence_name, get_previous_org
-from config_resolver import resolve_project_configs
-
-# 💾 Use new backend abstraction layer
-from backend.local_yaml_backend import LocalYAMLBackend
-
-
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--api-key", default=os.getenv("MERAKI_API_KEY"), help="Meraki API key")
-    parser.add_argument("--destroy", action="store_true", help="Remove devices from previous orgs")
-    parser.add_argument("--tag", help="Deploy a single tag (org-network pair)")
-    args = parser.parse_args()
+import sys
+import time
 
-    # 🪵 Logging and Meraki session
-    logger = logging.getLogger(__name__)
-    # ✅ Setup Meraki session (Meraki logs will use default naming with timestamps)
-    dashboard = get_dashboard_session()
+# 💤 Keep module load light: the Meraki SDK, configurators, coloredlogs and dotenv
+# are imported inside the subcommands that talk to the Dashboard. `resolve` and
+# `plan` never import them.
 
-    # 🧠 Use backend abstraction to load configs
-    backend = LocalYAMLBackend()
-    manifest = backend.get_manifest()
-    defaults = backend.get_defaults()
-    all_devices = backend.get_devices()["groups"]  # Top-level key expected
 
-    # ⚙️ Resolve configs (merge defaults, apply overrides)
-    config_data = resolve_project_configs(backend=backend)
-    resolved_networks = config_data["resolved_networks"]
+def _resolve_configs():
+    from config_resolver import resolve_project_configs
+    from utils.logging.timing import span
 
-    # 🔁 Group networks by project/org_base_name
-    grouped = {}
-    for entry in resolved_networks:
-        grouped.setdefault(entry["org_base_name"], []).append(entry)
+    # ⚙️ Resolve configs (merge defaults, apply overrides); each resource comes from the
+    # provider selected in defaults.yaml `backend_providers` (see backend/router.py)
+    with span("resolve"):
+        return resolve_project_configs()
 
-    all_summaries = []
 
-    # 🚀 Deploy each project/org
-    for org_base, networks in grouped.items():
-        project_name = networks[0]["project_name"]
+def _defaults_section(name):
+    from backend.router import get_backend_for
 
-        # 🔧 Initialize runtime state for this org
-        runtime_state = {
-            "project_slug": project_name,
-            "org": {
-                "org_id": None,
-                "org_name": None
-            },
-            "networks": {}
-        }
+    return get_backend_for("defaults").get_defaults().get(name) or {}
 
-        # 🏢 Get all orgs and determine next available name
-        orgs = dashboard.organizations.getOrganizations()
-        org_name, next_seq = get_next_sequence_name(orgs, org_base)
-        new_org = dashboard.organizations.createOrganization(name=org_name)
-        org_id = new_org["id"]
-
-        runtime_state["org"]["org_id"] = org_id
-        runtime_state["org"]["org_name"] = org_name
-
-        # ✅ Set up org-specific logging
-        log_safe_name = org_name.lower().replace(" ", "").replace("-", "")
-        custom_log_name = f"custom-{log_safe_name}.log"
-        setup_logging(custom_log_name)
-        logger = logging.getLogger(__name__)
-
-        # 🔥 Cleanup old orgs
-        if args.destroy:
-            previous = get_previous_org(orgs, org_base)
-            if previous:
-                prev_org_id = previous["id"]
-                logger.info(f"🔍 Cleaning up previous org: {previous['name']} ({prev_org_id})")
-
-                try:
-                    prev_nets = dashboard.organizations.getOrganizationNetworks(prev_org_id)
-                    for net in prev_nets:
-                        logger.info(f"🗑️ Cleaning up network: {net['name']}")
-
-                        # 🔍 Get all devices in this network
-                        devices_in_net = dashboard.networks.getNetworkDevices(net["id"])
-
-                        # 🚫 Remove devices
-                        remove_devices_from_network(dashboard, net["id"], devices_in_net)
-
-                        # 🗑️ Delete network
-                        dashboard.networks.deleteNetwork(net["id"])
-                        logger.info(f"✅ Deleted network: {net['name']}")
-                except Exception as e:
-                    logger.error(f"❌ Error deleting networks from old org: {e}")
-
-                try:
-                    dead_name = f"DEAD - Delete old {previous['name']}"
-                    dashboard.organizations.updateOrganization(organizationId=prev_org_id, name=dead_name)
-                    logger.info(f"⚰️ Renamed old org to: {dead_name}")
-                except Exception as e:
-                    logger.error(f"❌ Failed to rename old org: {e}")
-
-        # 🌐 Deploy all networks inside the new org
+
+def _session_options():
+    """Dashboard session tuning from `dashboard_session:` in defaults.yaml (if any)."""
+    return _defaults_section("dashboard_session")
+
+
+def _group_by_org(resolved_networks):
+    # 🔁 Group networks by project/org_base_name
+    grouped = {}
+    for entry in resolved_networks:
+        grouped.setdefault(entry["org_base_name"], []).append(entry)
+    return grouped
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🧠 resolve — print the fully resolved intended config (offline)             │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def cmd_resolve(args):
+    from utils.jsonl import to_json
+
+    config_data = _resolve_configs()
+    config_data["devices"] = list(config_data.pop("inventory"))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(config_data, f, indent=2, default=to_json)
+        print(f"📦 Resolved config written to {args.output}")
+    else:
+        json.dump(config_data, sys.stdout, indent=2, default=to_json)
+        print()
+    return 0
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 📋 plan — what `deploy` would create, per org and network (offline)         │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def cmd_plan(args):
+    config_data = _resolve_configs()
+    inventory = config_data["inventory"]
+    problems = 0
+
+    for org_base, networks in _group_by_org(config_data["resolved_networks"]).items():
+        print(f"🌍 Org: {org_base} NNN ({networks[0]['project_name']})")
         for entry in networks:
             tag = entry["full_tag"]
             if args.tag and args.tag != tag:
                 continue
 
-            net_base = entry["net_base_name"]
             config = entry["network_config"]
-            logger.info(f"🚀 Starting deployment for: {project_name} / {tag}")
-
-            net_name = f"{net_base} {next_seq:03d}"
-            config["network"]["name"] = net_name
-            network_id = ensure_network(dashboard, org_id, config["network"])
-            config["base"] = entry.get("base", {})
-
-            # Flatten devices and inherit group-level tags
-            flat_devices = []
-            for group in all_devices:
-                group_tag = group.get("tag")
-                for device in group.get("devices", []):
-                    device_tags = device.get("tags", [])
-                    if isinstance(device_tags, str):
-                        device_tags = [device_tags]
-                    device["tags"] = list(set(device_tags + [group_tag]))
-                    flat_devices.append(device)
-
-            # Normalize tag comparison (handle underscores/hyphens)
-            def normalize(s):
-                return s.replace("_", "-")
-
-            tagged_devices = [
-                d for d in flat_devices
-                if normalize(tag) in [normalize(t) for t in d.get("tags", [])]
-            ]
-
-            if not tagged_devices:
-                raise ValueError(f"No devices found for tag '{tag}'. Check your devices.yaml.")
-
-            named_devices = setup_devices(dashboard, network_id, {
-                "devices": tagged_devices,
-                "base": config
-            })
-
-            # Inject wireless context for MX68CW support
-            config["named_devices"] = named_devices
-            config["project_name"] = project_name
-
-            # 💾 Accumulate runtime state for this network
-            runtime_state["networks"][entry["network_slug"]] = {
-                "network_id": network_id,
-                "network_name": config["network"]["name"]
-            }
-            # Store org_id and network_id in config for later retrieval/logging
-            config["org_id"] = org_id
-            config["network_id"] = network_id
-
-            save_runtime_state(
-                runtime_state["project_slug"],
-                runtime_state["org"]["org_id"],
-                runtime_state["org"]["org_name"],
-                runtime_state["networks"]
-            )
-
-            # 🧠 Resolve hubId for AutoVPN spoke configs
-            if "mx_autovpn" in config and config["mx_autovpn"].get("mode") == "spoke":
-                for hub in config["mx_autovpn"].get("hubs", []):
-                    if hub.get("hubId") == "TBD":
-                        hub_slug = config.get("mx_autovpn", {}).get("hub_slug", "studio_hub")
-                        resolved_hub_id = runtime_state["networks"].get(hub_slug, {}).get("network_id")
-                        logger.info(f"🔁 Resolving hubId for spoke VPN config: {hub_slug} -> {resolved_hub_id}")
-                        hub["hubId"] = resolved_hub_id
-
-            setup_network(dashboard, network_id, config)
-
-            # 📝 Save summary and full intended state for audit/debugging
-            log_safe_name = org_name.lower().replace(" ", "").replace("-", "")
-            summary_log_name = f"summary-{log_safe_name}.log"
-            summary_lines = [
-                f"🔹 Network: {config['network']['name']}",
-                f"🌍 Org: {org_name}",
-                f"📦 Devices: {len(named_devices)} device(s) configured"
-            ]
-            collect_deployment_summary(config, org_name, named_devices, summary_lines)
-            log_deployment_summary(config, org_name, named_devices, dashboard, summary_log_name)
+            devices = inventory.for_tag(tag)
+            firewall = config.get("firewall", {})
+            autovpn = config.get("mx_autovpn")
+
+            print(f"  🔹 Network: {entry['net_base_name']} NNN  [{tag}]")
+            print(f"     📦 Devices: {len(devices)} ({', '.join(sorted(d.get('model', '?') for d in devices)) or 'none'})")
+            print(f"     🌐 VLANs: {', '.join(f'{v.id}:{v.subnet}' for v in config.get('vlans', []))}")
+            print(f"     🔌 MX ports: {len(config.get('mx_ports') or [])}")
+            print(f"     🛣️ Static routes: {len(config.get('mx_static_routes', []))}")
+            print(f"     🔥 Firewall: {len(firewall.get('outbound_rules', []))} outbound / {len(firewall.get('inbound_rules', []))} inbound")
+            print(f"     📶 SSIDs: {len(config.get('mx_wireless', {}).get('ssids', []))}")
+            print(f"     🔐 AutoVPN: {(autovpn.mode if autovpn else None) or 'off'}")
+            if not devices:
+                print(f"     ❌ No devices found for tag '{tag}'. Check your devices.yaml.")
+                problems += 1
+
+    return 1 if problems else 0
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🔥 destroy — clean up the previous org for each project                      │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def _cleanup_previous_org(dashboard, orgs, org_base, logger, workers=None):
+    from meraki_sdk.cleanup import CLEANUP_WORKERS, destroy_org_networks
+    from meraki_sdk.org import get_previous_org
+
+    previous = get_previous_org(orgs, org_base)
+    if not previous:
+        logger.info(f"ℹ️ No previous org found for {org_base}.")
+        return
+
+    prev_org_id = previous["id"]
+    logger.info(f"🔍 Cleaning up previous org: {previous['name']} ({prev_org_id})")
+
+    try:
+        # 🗑️ Bulk teardown: one inventory snapshot, networks removed concurrently
+        results = destroy_org_networks(dashboard, prev_org_id, workers=workers or CLEANUP_WORKERS)
+        failed = [r for r in results if not r["deleted"]]
+        logger.info(f"🧾 Deleted {len(results) - len(failed)}/{len(results)} networks from {previous['name']}")
+    except Exception as e:
+        logger.error(f"❌ Error deleting networks from old org: {e}")
+
+    try:
+        dead_name = f"DEAD - Delete old {previous['name']}"
+        dashboard.organizations.updateOrganization(organizationId=prev_org_id, name=dead_name)
+        logger.info(f"⚰️ Renamed old org to: {dead_name}")
+    except Exception as e:
+        logger.error(f"❌ Failed to rename old org: {e}")
+
+
+def cmd_destroy(args):
+    from utils.logging.config import setup_logging
+    from utils.state.runtime import close_runtime_store
+    from meraki_sdk.auth import get_dashboard_session, close_dashboard_sessions
+    from backend.router import get_backend_for
+
+    from meraki_sdk.cleanup import CLEANUP_WORKERS
+    from utils.logging.timing import instrument_dashboard
+
+    setup_logging()
+    logger = logging.getLogger(__name__)
+    options = {"workers": CLEANUP_WORKERS, **_session_options()}
+    try:
+        dashboard = instrument_dashboard(get_dashboard_session(**options))
 
-            # 💾 Save intended state (JSON representation of this config)
-            state_path = save_intended_state(config, org_name)
-            logger.info(f"📦 Intended state saved to {state_path}")
+        orgs = dashboard.organizations.getOrganizations()
+        manifest = get_backend_for("manifest", get_backend_for("defaults").get_defaults()).get_manifest()
+        org_bases = dict.fromkeys(p["org_base_name"] for p in manifest.get("projects", []))
+        for org_base in org_bases:
+            _cleanup_previous_org(dashboard, orgs, org_base, logger, workers=options["workers"])
+    finally:
+        close_dashboard_sessions()
+        close_runtime_store()
+    return 0
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🚀 deploy — create the next org and build every network in it               │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def cmd_deploy(args):
+    from utils.logging.config import setup_logging
+    from utils.logging.summary import log_deployment_summary, print_final_summary
+    from utils.state.config import save_intended_state
+    from utils.state.runtime import close_runtime_store, get_network_id_by_slug, record_runtime_network, record_runtime_org
+    from utils.state.journal import NETWORK_SECTIONS, DeploymentJournal, load_checkpoint
+    from meraki_sdk.auth import get_dashboard_session, close_dashboard_sessions
+    from meraki_sdk.basic_network import ensure_network
+    from meraki_sdk.devices import setup_devices
+    from meraki_sdk.network.setup_network import setup_network
+    from meraki_sdk.org import get_next_sequence_name
+    from utils.logging.timing import instrument_dashboard, span
+    from utils.logging.metrics import NETWORK_DURATION, start_metrics_exporter
+
+    # 🪵 Logging and Meraki session options
+    logger = logging.getLogger(__name__)
+    session_options = _session_options()
+
+    # 📊 Live metrics (text file and/or local port) when `metrics:` is configured
+    exporter = start_metrics_exporter(_defaults_section("metrics"))
+
+    try:
+        config_data = _resolve_configs()
+        resolved_networks = config_data["resolved_networks"]
+        inventory = config_data["inventory"]  # 📇 Devices by tag/serial (one index, or indexed provider queries)
+
+        # 🚀 Deploy each project/org
+        for org_base, networks in _group_by_org(resolved_networks).items():
+            project_name = networks[0]["project_name"]
+            project_slug = networks[0]["project_slug"]
+
+            # ✅ One shared, tuned Meraki session per org worker (⏱️ every call timed)
+            dashboard = instrument_dashboard(get_dashboard_session(org=org_base, **session_options))
+
+            # 🏢 Get all orgs; resume the last unfinished one or create the next in sequence
+            orgs = dashboard.organizations.getOrganizations()
+            checkpoint = load_checkpoint(project_slug) if args.resume else None
+            if checkpoint:
+                org_id, org_name, next_seq = checkpoint["org_id"], checkpoint["org_name"], checkpoint["sequence"]
+                journal = DeploymentJournal(project_slug, org_id, org_name)
+                logger.info(f"⏯️ Resuming {org_name} ({org_id}) from the deployment journal")
+            else:
+                org_name, next_seq = get_next_sequence_name(orgs, org_base)
+                new_org = dashboard.organizations.createOrganization(name=org_name)
+                org_id = new_org["id"]
+                # 📓 Every completed step from here on goes to the journal
+                journal = DeploymentJournal(project_slug, org_id, org_name)
+                journal.record("org", org_name=org_name, sequence=next_seq)
+
+            # 🗃️ Runtime store: org now, each network as soon as it exists
+            record_runtime_org(project_slug, org_id, org_name)
+
+            # ✅ Set up org-specific logging
+            log_safe_name = org_name.lower().replace(" ", "").replace("-", "")
+            custom_log_name = f"custom-{log_safe_name}.log"
+            setup_logging(custom_log_name)
+            logger = logging.getLogger(__name__)
+
+            # 🔥 Cleanup old orgs
+            if args.destroy and not (checkpoint and checkpoint["destroyed"]):
+                with span("destroy", org=org_name):
+                    # A resumed org is already in `orgs`; it is never its own predecessor
+                    previous_orgs = [o for o in orgs if o["id"] != org_id]
+                    _cleanup_previous_org(dashboard, previous_orgs, org_base, logger, workers=session_options.get("workers"))
+                journal.record("destroy")
+
+            # 🌐 Deploy all networks inside the new org
+            org_complete = True
+            for entry in networks:
+                tag = entry["full_tag"]
+                if args.tag and args.tag != tag:
+                    continue
+
+                net_base = entry["net_base_name"]
+                config = entry["network_config"]
+                slug = entry["network_slug"]
+                done = checkpoint["networks"].get(slug, {}) if checkpoint else {}
+                steps = set(done.get("steps", []))
+                if "network" in steps:
+                    logger.info(f"⏭️ {project_name} / {tag} already deployed in {org_name}, skipping.")
+                    continue
+                logger.info(f"🚀 Starting deployment for: {project_name} / {tag}")
+
+                net_name = f"{net_base} {next_seq:03d}"
+                config["network"]["name"] = net_name
+                network_started = time.perf_counter()
+                if done.get("network_id"):
+                    network_id = done["network_id"]
+                else:
+                    with span("create_network", org=org_name, network=net_name):
+                        network_id = ensure_network(dashboard, org_id, config["network"])
+                    journal.record("network_created", network=slug, network_id=network_id, network_name=net_name)
+                config["base"] = entry.get("base", {})
+
+                # O(1) lookup; tags compare with underscores/hyphens treated as equal
+                tagged_devices = inventory.for_tag(tag)
+
+                if not tagged_devices:
+                    raise ValueError(f"No devices found for tag '{tag}'. Check your devices.yaml.")
+
+                if "devices" in steps:
+                    named_devices = done["devices"]
+                else:
+                    with span("devices", org=org_name, network=net_name):
+                        named_devices = setup_devices(dashboard, network_id, {
+                            "devices": tagged_devices,
+                            "base": config
+                        })
+                    journal.record("devices", network=slug, devices=named_devices)
+
+                # Inject wireless context for MX68CW support
+                config["named_devices"] = named_devices
+                config["project_name"] = project_name
+
+                # 💾 One-row update for this network
+                record_runtime_network(project_slug, slug, network_id, config["network"]["name"])
+                # Store org_id and network_id in config for later retrieval/logging
+                config["org_id"] = org_id
+                config["network_id"] = network_id
+
+                # 🧠 Resolve hubId for AutoVPN spoke configs
+                autovpn = config.get("mx_autovpn")
+                if autovpn and autovpn.mode == "spoke":
+                    for hub in autovpn.hubs or []:
+                        if hub.hub_id == "TBD":
+                            hub_slug = (autovpn.extra or {}).get("hub_slug", "studio_hub")
+                            resolved_hub_id = get_network_id_by_slug(project_slug, hub_slug)
+                            logger.info(f"🔁 Resolving hubId for spoke VPN config: {hub_slug} -> {resolved_hub_id}")
+                            hub.hub_id = resolved_hub_id
+
+                with span("network", org=org_name, network=net_name):
+                    complete = setup_network(dashboard, network_id, config,
+                                  on_section_done=journal.section_recorder(slug),
+                                  **{f"do_{section}": section not in steps for section in NETWORK_SECTIONS})
+
+                # 📝 Save summary and full intended state for audit/debugging
+                summary_log_name = f"summary-{log_safe_name}.log"
+                log_deployment_summary(config, org_name, named_devices, dashboard, summary_log_name)
+
+                # 💾 Save intended state (JSON representation of this config)
+                state_path = save_intended_state(config, org_name)
+                logger.info(f"📦 Intended state saved to {state_path}")
+                NETWORK_DURATION.observe(time.perf_counter() - network_started, org=org_name)
+                if complete:
+                    journal.record("network", network=slug)
+                    logger.info(f"✅ Deployment for {org_name} complete.")
+                else:
+                    # ⏯️ Failed sections stay out of the journal; `deploy --resume` redoes them
+                    org_complete = False
+                    logger.warning(f"⚠️ {project_name} / {tag} finished with errors; rerun with --resume.")
+
+            if not args.tag and org_complete:
+                journal.record("org_done")
+
+        print_final_summary()
+    finally:
+        close_dashboard_sessions()
+        close_runtime_store()
+        if exporter:
+            exporter.stop()
+    return 0
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🔎 drift — compare live VLANs with the resolved intent for deployed networks │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def cmd_drift(args):
+    from meraki_sdk.auth import get_dashboard_session, close_dashboard_sessions
+    from utils.logging.timing import instrument_dashboard
+    from utils.state.runtime import close_runtime_store, get_network_id_by_slug
+
+    config_data = _resolve_configs()
+    drifted = 0
+
+    try:
+        dashboard = instrument_dashboard(get_dashboard_session(**_session_options()))
+
+        for entry in config_data["resolved_networks"]:
+            tag = entry["full_tag"]
+            if args.tag and args.tag != tag:
+                continue
 
-            logger.info(f"✅ Deployment for {org_name} complete.")
+            network_id = get_network_id_by_slug(entry["project_slug"], entry["network_slug"])
+            if not network_id:
+                print(f"⚪ {tag}: not deployed (no network ID in runtime state)")
+                continue
 
-    print_final_summary()
+            intended = {str(v.id): v for v in entry["network_config"].get("vlans", [])}
+            live = {str(v["id"]): v for v in dashboard.appliance.getNetworkApplianceVlans(network_id)}
+
+            differences = []
+            for vlan_id in sorted(intended.keys() | live.keys(), key=int):
+                want, have = intended.get(vlan_id), live.get(vlan_id)
+                if have is None:
+                    differences.append(f"VLAN {vlan_id} missing")
+                elif want is None:
+                    differences.append(f"VLAN {vlan_id} not in config")
+                else:
+                    for key, expected in (("name", want.name), ("subnet", want.subnet), ("applianceIp", want.gateway_ip)):
+                        if have.get(key) != expected:
+                            differences.append(f"VLAN {vlan_id} {key}: live {have.get(key)!r} ≠ intended {expected!r}")
+
+            if differences:
+                drifted += 1
+                print(f"🟠 {tag} ({network_id}): {len(differences)} difference(s)")
+                for line in differences:
+                    print(f"     • {line}")
+            else:
+                print(f"🟢 {tag} ({network_id}): in sync")
+    finally:
+        close_dashboard_sessions()
+        close_runtime_store()
+
+    return 1 if drifted else 0
+
+
+def _add_profile_arguments(parser, default=None):
+    parser.add_argument("--profile", default=default, metavar="PHASES",
+                        help="Profile phases with cProfile, comma-separated (e.g. resolve,devices,vlans); output in logs/profiles/")
+    parser.add_argument("--profile-memory", action="store_true", default=default or False,
+                        help="Also record top allocations with tracemalloc for the profiled phases")
+
+
+def _add_cassette_arguments(parser, default=None):
+    parser.add_argument("--record", default=default, metavar="CASSETTE",
+                        help="Record every Dashboard request/response to a cassette (.jsonl.gz)")
+    parser.add_argument("--replay", default=default, metavar="CASSETTE",
+                        help="Serve Dashboard responses from a recorded cassette instead of the API")
+    parser.add_argument("--replay-speed", type=float, default=1.0 if default is None else default, metavar="FACTOR",
+                        help="Scale recorded latencies during --replay (1 = original, the default; 0 = instant)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Meraki lab automation: resolve, plan and deploy org/network configs.")
+    _add_profile_arguments(parser)
+    _add_cassette_arguments(parser)
+    # Legacy flags: `python main.py [--destroy] [--tag X]` still runs a deploy
+    parser.add_argument("--api-key", default=os.getenv("MERAKI_API_KEY"), help="Meraki API key")
+    parser.add_argument("--destroy", action="store_true", help="Remove devices from previous orgs")
+    parser.add_argument("--tag", help="Deploy a single tag (org-network pair)")
+    parser.add_argument("--resume", action="store_true", help="Continue the last unfinished org from state/journal/")
+    parser.set_defaults(func=cmd_deploy)
+
+    sub = parser.add_subparsers(dest="command", metavar="{resolve,plan,deploy,destroy,drift}")
+    # 🔬 --profile, --tag etc. work before or after the subcommand (SUPPRESS keeps the top-level value)
+    profile_options = argparse.ArgumentParser(add_help=False)
+    _add_profile_arguments(profile_options, default=argparse.SUPPRESS)
+    # 📼 Only commands that talk to the Dashboard take cassettes
+    live_options = argparse.ArgumentParser(add_help=False)
+    _add_cassette_arguments(live_options, default=argparse.SUPPRESS)
+
+    p = sub.add_parser("resolve", parents=[profile_options], help="Print the resolved config as JSON (offline)")
+    p.add_argument("-o", "--output", help="Write to a file instead of stdout")
+    p.set_defaults(func=cmd_resolve)
+
+    p = sub.add_parser("plan", parents=[profile_options], help="Show what deploy would build (offline)")
+    p.add_argument("--tag", default=argparse.SUPPRESS, help="Only plan a single tag (org-network pair)")
+    p.set_defaults(func=cmd_plan)
+
+    p = sub.add_parser("deploy", parents=[profile_options, live_options], help="Create the next org and deploy every network")
+    p.add_argument("--destroy", action="store_true", default=argparse.SUPPRESS, help="Remove devices from previous orgs")
+    p.add_argument("--tag", default=argparse.SUPPRESS, help="Deploy a single tag (org-network pair)")
+    p.add_argument("--resume", action="store_true", default=argparse.SUPPRESS,
+                   help="Continue the last unfinished org from state/journal/")
+    p.set_defaults(func=cmd_deploy)
+
+    p = sub.add_parser("destroy", parents=[profile_options, live_options], help="Clean up the previous org of each project")
+    p.set_defaults(func=cmd_destroy)
+
+    p = sub.add_parser("drift", parents=[profile_options, live_options], help="Compare live VLANs with the resolved config")
+    p.add_argument("--tag", default=argparse.SUPPRESS, help="Only check a single tag (org-network pair)")
+    p.set_defaults(func=cmd_drift)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.profile:
+        from utils.logging.profiling import enable_profiling
+
+        try:
+            enable_profiling([p.strip() for p in args.profile.split(",") if p.strip()], memory=args.profile_memory)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be combined")
+    if args.record or args.replay:
+        from meraki_sdk.cassette import disable_cassette, enable_recording, enable_replay
+
+        try:
+            if args.record:
+                enable_recording(args.record)
+            else:
+                enable_replay(args.replay, args.replay_speed)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        try:
+            return args.func(args)
+        finally:
+            disable_cassette()
+    return args.func(args)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
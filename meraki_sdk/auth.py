@@ -1,26 +1,174 @@
 # meraki_sdk/auth.py
 import os
+import inspect
+import logging
+import threading
 from dotenv import load_dotenv
 from meraki import DashboardAPI
 from pathlib import Path
 
 load_dotenv()
 
-def get_dashboard_session():
+logger = logging.getLogger(__name__)
+
+# ⚙️ Session defaults; override per run via `dashboard_session:` in defaults.yaml
+DEFAULT_SESSION_OPTIONS = {
+    "workers": 1,                       # concurrent callers sharing a session → HTTP pool size
+    "timeout": 60,                      # seconds per request
+    "maximum_retries": 5,
+    "wait_on_rate_limit": True,
+    "nginx_429_retry_wait_time": 60,
+    "retry_4xx_error": False,
+    "suppress_logging": False,          # True: no SDK console/file logging at all
+    "log_path": "logs/meraki_logs",
+}
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def _size_connection_pool(dashboard, pool_size, certificate_path=None):
+    """
+    Match the SDK's HTTP connection pool to the number of concurrent workers,
+    so parallel calls reuse warm connections instead of opening new ones.
+    `certificate_path` (if any) becomes the TLS trust store of the new pool.
+    """
+    rest = getattr(dashboard, "_session", None)
+    client = getattr(rest, "_client", None)
+    if client is not None:
+        # httpx-based SDK: build a replacement client from public httpx.Client arguments,
+        # carrying over the SDK's headers, timeout and proxy, before any request is sent
+        import ssl
+        import httpx
+
+        client_kwargs = {
+            "headers": client.headers,
+            "timeout": client.timeout,
+            "proxy": getattr(rest, "_requests_proxy", None) or None,
+            "trust_env": client.trust_env,
+        }
+        if certificate_path:
+            client_kwargs["verify"] = ssl.create_default_context(cafile=certificate_path)
+        if pool_size > 1:
+            client_kwargs["limits"] = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        rest._client = httpx.Client(**client_kwargs)
+        client.close()
+        return True
+
+    req_session = getattr(rest, "_req_session", None)
+    if req_session is not None:
+        # requests-based SDK: mount a pool-sized adapter
+        from requests.adapters import HTTPAdapter
+
+        if pool_size > 1:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            req_session.mount("https://", adapter)
+            req_session.mount("http://", adapter)
+        if certificate_path:
+            req_session.verify = certificate_path
+        return True
+
+    logger.debug("⚠️ Unknown Meraki SDK session layout; keeping the default connection pool.")
+    return False
+
+
+def _attach_response_hook(dashboard):
+    """Count every HTTP attempt (429s, re-sent requests) in the metrics registry."""
+    from utils.logging.metrics import record_http_response
+
+    rest = getattr(dashboard, "_session", None)
+    client = getattr(rest, "_client", None)
+    if client is not None:
+        client.event_hooks["response"].append(
+            lambda response: record_http_response(response.request.method, response.status_code, response.request.url))
+        return True
+
+    req_session = getattr(rest, "_req_session", None)
+    if req_session is not None:
+        req_session.hooks["response"].append(
+            lambda response, *args, **kwargs: record_http_response(
+                response.request.method, response.status_code, response.request.url))
+        return True
+    return False
+
+
+def build_dashboard_session(api_key=None, base_url=None, **options):
     """
-    Initializes and returns a Meraki Dashboard API session using the API key from .env or environment.
+    Build a new, tuned Meraki Dashboard API session.
+    `options` override DEFAULT_SESSION_OPTIONS.
     """
-    api_key = os.getenv("MERAKI_API_KEY")
+    from meraki_sdk.cassette import REPLAY_API_KEY, install_cassette, replaying
+
+    api_key = api_key or os.getenv("MERAKI_API_KEY") or (REPLAY_API_KEY if replaying() else None)
     if not api_key:
         raise ValueError("MERAKI_API_KEY not found in environment variables or .env file.")
 
-    # Ensure Meraki log directory exists
-    meraki_log_dir = Path("logs") / "meraki_logs"
-    meraki_log_dir.mkdir(parents=True, exist_ok=True)
+    settings = {**DEFAULT_SESSION_OPTIONS, **options}
+    kwargs = {
+        "api_key": api_key,
+        "single_request_timeout": settings["timeout"],
+        "maximum_retries": settings["maximum_retries"],
+        "wait_on_rate_limit": settings["wait_on_rate_limit"],
+        "nginx_429_retry_wait_time": settings["nginx_429_retry_wait_time"],
+        "retry_4xx_error": settings["retry_4xx_error"],
+        "suppress_logging": settings["suppress_logging"],
+    }
+    # 🧪 MERAKI_BASE_URL points the SDK elsewhere (e.g. benchmarks/fake_dashboard.py)
+    base_url = base_url or os.getenv("MERAKI_BASE_URL")
+    if base_url:
+        kwargs["base_url"] = base_url
+    # 🔐 HTTPS proxy (e.g. behind a corporate proxy) goes straight to the SDK; the TLS
+    # certificate is applied when the connection pool is built below
+    if settings.get("requests_proxy"):
+        kwargs["requests_proxy"] = settings["requests_proxy"]
+
+    if replaying() and "smart_flow_org_rate" in inspect.signature(DashboardAPI).parameters:
+        # 📼 Recorded latencies and 429s drive the pace during replay, not the SDK's own limiter
+        kwargs["smart_flow_org_rate"] = kwargs["smart_flow_global_rate"] = 1_000_000
+
+    if settings["suppress_logging"]:
+        # 🔇 No per-call log file I/O
+        kwargs["output_log"] = False
+        kwargs["print_console"] = False
+    else:
+        # Ensure Meraki log directory exists
+        meraki_log_dir = Path(settings["log_path"])
+        meraki_log_dir.mkdir(parents=True, exist_ok=True)
+        kwargs["log_path"] = str(meraki_log_dir)  # <--- Redirects Meraki logs
+
+    dashboard = DashboardAPI(**kwargs)
+
+    pool_size = int(settings["workers"])
+    certificate_path = settings.get("certificate_path")
+    if pool_size > 1 or certificate_path:
+        _size_connection_pool(dashboard, pool_size, certificate_path)
+    _attach_response_hook(dashboard)
+    install_cassette(dashboard)
+    return dashboard
+
+
+def get_dashboard_session(org=None, **options):
+    """
+    Return the shared Meraki Dashboard API session for `org` (one per org
+    worker; `None` is the process-wide default), building it on first use.
+    Sessions are shared per org *and* options: asking again with different
+    `options` builds a separate session instead of silently reusing the first.
+    The API key comes from .env or the environment.
+    """
+    key = (org, tuple(sorted((name, repr(value)) for name, value in options.items())))
+    with _lock:
+        dashboard = _sessions.get(key)
+        if dashboard is None:
+            dashboard = _sessions[key] = build_dashboard_session(**options)
+        return dashboard
+
 
-    dashboard = DashboardAPI(
-        api_key=api_key,
-        suppress_logging=False,
-        log_path=str(meraki_log_dir)  # <--- Redirects Meraki logs
-    )
-    return dashboard
\ No newline at end of file
+def close_dashboard_sessions():
+    """Close and forget every shared session (end of run, or tests)."""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for dashboard in sessions:
+        close = getattr(getattr(dashboard, "_session", None), "close", None)
+        if close:
+            close()
@@ -0,0 +1,300 @@
+# meraki_sdk/cassette.py
+
+import gzip
+import json
+import logging
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 📼 Record / replay Dashboard traffic                                        │
+# └─────────────────────────────────────────────────────────────────────────────┘
+#   python main.py deploy --record logs/cassettes/prod.jsonl.gz
+#   python main.py deploy --replay logs/cassettes/prod.jsonl.gz                   # recorded pace
+#   python main.py deploy --replay logs/cassettes/prod.jsonl.gz --replay-speed 0  # instant
+#   python -m meraki_sdk.cassette diff sequential.jsonl.gz concurrent.jsonl.gz
+#
+# A cassette is gzipped JSON Lines: one header line, then one line per HTTP
+# attempt (429s and retries included) with the request, the response and how
+# long it took. The API key and request headers are never stored.
+#
+# Replay swaps the SDK's HTTP transport, so everything above it (retries,
+# smart_flow, timing spans, metrics) runs unchanged. Requests are matched by
+# method, path and body, then by method and path, so a concurrent run can
+# consume a sequential recording in a different order. `--replay-speed`
+# scales the recorded latencies (1 = original, the default; 0 = instant).
+
+CASSETTE_DIR = "logs/cassettes"
+CASSETTE_VERSION = 1
+REPLAY_API_KEY = "0" * 40
+_API_PREFIX = re.compile(r"^/api/v\d+")
+_KEPT_HEADERS = ("content-type", "retry-after", "link")
+
+_state = {"recorder": None, "player": None}
+
+
+def _split_url(url):
+    """httpx.URL → (path without /api/vN, query string)."""
+    path = _API_PREFIX.sub("", url.path)
+    query = url.query.decode() if isinstance(url.query, bytes) else (url.query or "")
+    return path, query
+
+
+def _decode(content):
+    if not content:
+        return None
+    try:
+        return json.loads(content)
+    except ValueError:
+        return content.decode("utf-8", "replace")
+
+
+def _body_key(body):
+    return json.dumps(body, sort_keys=True, separators=(",", ":"))
+
+
+class CassetteRecorder:
+    """Appends every interaction to the cassette as it completes (safe across threads)."""
+
+    def __init__(self, path):
+        import os
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"version": CASSETTE_VERSION, "recorded_at": datetime.now().isoformat(timespec="seconds")})
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def record(self, request, response, started, elapsed):
+        path, query = _split_url(request.url)
+        entry = {
+            "t": round(started - self._started, 4),
+            "method": request.method,
+            "path": path,
+            "query": query,
+            "body": _decode(request.content),
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in _KEPT_HEADERS},
+            "response": _decode(response.content),
+            "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            entry["seq"] = self.count
+            self.count += 1
+            self._write(entry)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def load_cassette(path):
+    """Return (header, interactions) from a cassette file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    if not lines or lines[0].get("version") != CASSETTE_VERSION:
+        raise ValueError(f"❌ {path} is not a version {CASSETTE_VERSION} cassette")
+    return lines[0], lines[1:]
+
+
+class CassettePlayer:
+    """Serves recorded responses back, optionally sleeping the recorded latency × speed."""
+
+    def __init__(self, path, speed=1.0, sleep=time.sleep):
+        self.path = path
+        self.speed = speed
+        self.misses = 0
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._exact = defaultdict(deque)
+        self._loose = defaultdict(deque)
+        _, interactions = load_cassette(path)
+        for entry in interactions:
+            exact = (entry["method"], entry["path"], entry["query"], _body_key(entry["body"]))
+            self._exact[exact].append(entry)
+            self._loose[(entry["method"], entry["path"])].append(entry)
+        self.remaining = len(interactions)
+
+    def _take(self, method, path, query, body):
+        with self._lock:
+            for queue in (self._exact.get((method, path, query, _body_key(body))), self._loose.get((method, path))):
+                # An entry sits in both indexes; skip ones already served through the other
+                while queue and queue[0].get("_served"):
+                    queue.popleft()
+                if queue:
+                    entry = queue.popleft()
+                    entry["_served"] = True
+                    self.remaining -= 1
+                    return entry
+            self.misses += 1
+            return None
+
+    def respond(self, request):
+        import httpx
+
+        path, query = _split_url(request.url)
+        entry = self._take(request.method, path, query, _decode(request.content))
+        if entry is None:
+            logger.warning(f"⚠️ No recorded response for {request.method} {path}")
+            return httpx.Response(404, json={"errors": [f"Not in cassette: {request.method} {path}"]}, request=request)
+        if self.speed:
+            self._sleep(entry["elapsed"] * self.speed)
+        content = b"" if entry["response"] is None else (
+            entry["response"].encode() if isinstance(entry["response"], str) else json.dumps(entry["response"]).encode())
+        return httpx.Response(entry["status"], headers=entry["headers"], content=content, request=request)
+
+
+def _transport_class():
+    import httpx
+
+    class CassetteTransport(httpx.BaseTransport):
+        """Wraps (record) or replaces (replay) the SDK client's transport."""
+
+        def __init__(self, inner=None, recorder=None, player=None):
+            self.inner = inner
+            self.recorder = recorder
+            self.player = player
+
+        def handle_request(self, request):
+            if self.player:
+                return self.player.respond(request)
+            started = time.perf_counter()
+            response = self.inner.handle_request(request)
+            response.read()
+            self.recorder.record(request, response, started, time.perf_counter() - started)
+            return response
+
+        def close(self):
+            if self.inner:
+                self.inner.close()
+
+    return CassetteTransport
+
+
+def enable_recording(path):
+    disable_cassette()
+    _state["recorder"] = CassetteRecorder(path)
+    logger.info(f"📼 Recording Dashboard traffic to {path}")
+
+
+def enable_replay(path, speed=1.0):
+    disable_cassette()
+    _state["player"] = CassettePlayer(path, speed)
+    logger.info(f"📼 Replaying Dashboard traffic from {path} ({_state['player'].remaining} interactions, speed {speed})")
+
+
+def replaying():
+    return _state["player"] is not None
+
+
+def disable_cassette():
+    """Stop recording/replay; closes the cassette file and reports what was left over."""
+    recorder, player = _state["recorder"], _state["player"]
+    _state.update(recorder=None, player=None)
+    if recorder:
+        recorder.close()
+        logger.info(f"📼 Recorded {recorder.count} interactions to {recorder.path}")
+    if player and (player.remaining or player.misses):
+        logger.warning(f"⚠️ Replay finished with {player.remaining} unused and {player.misses} unmatched request(s)")
+
+
+def install_cassette(dashboard):
+    """Hook the active recorder/player into a new SDK session (no-op when neither is on)."""
+    if not (_state["recorder"] or _state["player"]):
+        return False
+    client = getattr(getattr(dashboard, "_session", None), "_client", None)
+    if client is None:
+        logger.warning("⚠️ Cassettes need the httpx-based Meraki SDK; traffic is not recorded/replayed.")
+        return False
+    transport = _transport_class()
+    client._transport = transport(inner=client._transport, recorder=_state["recorder"], player=_state["player"])
+    return True
+
+
+# 🔍 Comparing write sequences
+def _scope(path):
+    """Group writes by the object they touch: /networks/L_1/appliance/vlans → networks/L_1."""
+    parts = path.strip("/").split("/")
+    return "/".join(parts[:2])
+
+
+def write_sequence(path):
+    """Successful writes in cassette order, grouped by org/network/device: {scope: [(method, path, body)]}."""
+    _, interactions = load_cassette(path)
+    writes = defaultdict(list)
+    for entry in interactions:
+        if entry["method"] != "GET" and 200 <= entry["status"] < 300:
+            writes[_scope(entry["path"])].append((entry["method"], entry["path"], entry["body"]))
+    return dict(writes)
+
+
+def compare_writes(a, b):
+    """
+    Return a list of differences between two cassettes' writes. Order is compared
+    per scope, so interleaving across networks (concurrent engines) is allowed.
+    """
+    left, right = write_sequence(a), write_sequence(b)
+    diffs = []
+    for scope in sorted(set(left) | set(right)):
+        x, y = left.get(scope, []), right.get(scope, [])
+        for i in range(max(len(x), len(y))):
+            before = x[i] if i < len(x) else None
+            after = y[i] if i < len(y) else None
+            if before != after:
+                diffs.append(f"{scope} #{i}: {_describe(before)}  ≠  {_describe(after)}")
+                break
+    return diffs
+
+
+def _describe(write):
+    return "—" if write is None else f"{write[0]} {write[1]} {_body_key(write[2])}"
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect and compare Dashboard cassettes.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("summary", help="Requests per endpoint and total recorded time")
+    p.add_argument("cassette")
+    p = sub.add_parser("diff", help="Compare the write sequences of two cassettes")
+    p.add_argument("a")
+    p.add_argument("b")
+    args = parser.parse_args()
+
+    if args.command == "summary":
+        from collections import Counter
+
+        header, interactions = load_cassette(args.cassette)
+        counts = Counter(f"{e['method']} {re.sub(r'/[A-Z]_[0-9]+|/[0-9]+|/Q[0-9A-Z-]+', '/{id}', e['path'])}"
+                         for e in interactions)
+        print(f"📼 {args.cassette}: {len(interactions)} interactions recorded {header['recorded_at']}, "
+              f"{sum(e['elapsed'] for e in interactions):.1f}s in flight")
+        for endpoint, count in counts.most_common():
+            print(f"   {count:>6}  {endpoint}")
+        return 0
+
+    diffs = compare_writes(args.a, args.b)
+    if diffs:
+        print(f"❌ Write sequences differ in {len(diffs)} scope(s):")
+        for line in diffs:
+            print(f"   • {line}")
+        return 1
+    print("✅ Same writes, in the same order per org/network/device")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,76 @@
+# meraki_sdk/cleanup.py
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from meraki_sdk.device import remove_device_from_network
+from meraki_sdk.rate_governor import get_rate_governor
+
+logger = logging.getLogger(__name__)
+
+CLEANUP_WORKERS = 8
+
+
+def snapshot_network_devices(dashboard, org_id, governor=None):
+    """
+    One paginated inventory read for the whole org → {network_id: [device, ...]}.
+    Replaces a getNetworkDevices + getDevice round-trip per network and device.
+    """
+    call = governor.call if governor else (lambda fn, *a, **kw: fn(*a, **kw))
+    inventory = call(dashboard.organizations.getOrganizationInventoryDevices, org_id, total_pages="all")
+
+    by_network = {}
+    for device in inventory:
+        if device.get("networkId"):
+            by_network.setdefault(device["networkId"], []).append(device)
+    return by_network
+
+
+def destroy_org_networks(dashboard, org_id, workers=CLEANUP_WORKERS, governor=None):
+    """
+    Remove every device and delete every network in `org_id`. All calls go
+    through the org's rate governor and one worker pool:
+    1. every device removal, across all networks (the API takes one serial
+       per removeNetworkDevices call, so these are spread over the pool);
+    2. every network deletion.
+    Returns [{"network": name, "devices": n, "deleted": bool, "error": str|None}, ...] sorted by network.
+    """
+    governor = governor or get_rate_governor(org_id)
+    networks = governor.call(dashboard.organizations.getOrganizationNetworks, org_id, total_pages="all")
+    if not networks:
+        logger.info(f"ℹ️ No networks to clean up in org {org_id}.")
+        return []
+
+    devices_by_network = snapshot_network_devices(dashboard, org_id, governor)
+    total = len(networks)
+    done = 0
+    done_lock = threading.Lock()
+
+    def delete(net):
+        nonlocal done
+        devices = devices_by_network.get(net["id"], [])
+        result = {"network": net["name"], "devices": len(devices), "deleted": False, "error": None}
+        try:
+            governor.call(dashboard.networks.deleteNetwork, net["id"])
+            result["deleted"] = True
+        except Exception as e:
+            result["error"] = str(e)
+
+        with done_lock:
+            done += 1
+            position = done
+        if result["deleted"]:
+            logger.info(f"✅ [{position}/{total}] Deleted network: {net['name']} ({len(devices)} devices)")
+        else:
+            logger.error(f"❌ [{position}/{total}] Failed to delete network {net['name']}: {result['error']}")
+        return result
+
+    removals = [(net["id"], device) for net in networks for device in devices_by_network.get(net["id"], [])]
+    logger.info(f"🗑️ Tearing down {total} networks ({len(removals)} devices) in org {org_id} with {workers} workers")
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, max(total, len(removals))))) as pool:
+        # 🧹 Devices first: a network is only deleted once nothing is left in it
+        wait([pool.submit(remove_device_from_network, dashboard, network_id, device, governor)
+              for network_id, device in removals])
+        results = list(pool.map(delete, networks))
+    return sorted(results, key=lambda r: r["network"])
@@ -21,25 +21,35 @@ def claim_devices(dashboard, network_id, serials):
         except Exception as e:
             logger.error(f"❌ Unexpected error for {serial}: {e}")
 
-def remove_devices_from_network(dashboard, network_id, devices):
+def remove_device_from_network(dashboard, network_id, device, governor=None):
+    """
+    Remove one device from `network_id` (the Dashboard API takes a single serial per call).
+    Errors are logged, not raised, so a teardown carries on with the rest.
+    """
+    call = governor.call if governor else (lambda fn, *a, **kw: fn(*a, **kw))
+    serial = device["serial"]
+    if device.get("networkId", network_id) != network_id:
+        logger.info(f"✅ {serial} already not in the target network.")
+        return
+    try:
+        call(dashboard.networks.removeNetworkDevices, network_id, serial)
+        logger.info(f"✅ Removed {serial} from network.")
+    except APIError as e:
+        if "Device does not belong to a network" in str(e):
+            logger.info(f"✅ {serial} already removed from a network.")
+        else:
+            logger.error(f"❌ Failed to remove {serial}: {e}")
+    except Exception as e:
+        logger.error(f"❌ Unexpected error removing {serial}: {e}")
+
+def remove_devices_from_network(dashboard, network_id, devices, governor=None):
+    """
+    Remove `devices` from `network_id`. Membership comes from the caller's
+    inventory snapshot (see meraki_sdk/cleanup.py), so no per-device lookup is made.
+    """
     logger.info(f"🧹 Attempting to remove devices from network: {network_id}")
     for device in devices:
-        serial = device["serial"]
-        try:
-            dev_info = dashboard.devices.getDevice(serial)
-            if dev_info.get("networkId") != network_id:
-                logger.info(f"✅ {serial} already not in the target network.")
-                continue
-
-            dashboard.networks.removeNetworkDevices(network_id, serial)
-            logger.info(f"✅ Removed {serial} from network.")
-        except APIError as e:
-            if "Device does not belong to a network" in str(e):
-                logger.info(f"✅ {serial} already removed from a network.")
-            else:
-                logger.error(f"❌ Failed to remove {serial}: {e}")
-        except Exception as e:
-            logger.error(f"❌ Unexpected error removing {serial}: {e}")
+        remove_device_from_network(dashboard, network_id, device, governor=governor)
 
 def set_device_address(dashboard, serials, address="18 Percy Street, London, W1T 1DX"):
     logger.info(f"📍 Setting address for all devices to: {address}")
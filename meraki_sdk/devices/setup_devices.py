@@ -7,6 +7,7 @@ from meraki_sdk.device import (
     set_device_names,
     generate_device_names,
 )
+from utils.logging.timing import span
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +26,26 @@ def setup_devices(dashboard, network_id, inputs):
 
     # 1. Claim devices to the new network using their serials
     serials = [d["serial"] for d in devices]
-    claim_devices(dashboard, network_id, serials)
+    with span("claim"):
+        claim_devices(dashboard, network_id, serials)
 
     # 2. Set location address for all claimed devices
-    set_device_address(dashboard, serials)
+    with span("address"):
+        set_device_address(dashboard, serials)
 
     # 3. Generate device names (e.g., "LON-PERCY-MX-01") based on the config
-    named_devices = generate_device_names(devices, naming)
+    with span("naming"):
+        named_devices = generate_device_names(devices, naming)
 
-    # 4. Apply those names to the devices in the dashboard
-    set_device_names(dashboard, network_id, named_devices)
+        # 4. Apply those names to the devices in the dashboard
+        set_device_names(dashboard, network_id, named_devices)
 
     logger.info("✅ Post-claim device configuration completed successfully.")
 
     # 🧬 Enrich with Meraki API metadata
     try:
-        full_device_list = dashboard.networks.getNetworkDevices(network_id)
+        with span("enrich"):
+            full_device_list = dashboard.networks.getNetworkDevices(network_id)
         serial_to_meta = {d["serial"]: d for d in full_device_list}
         for device in named_devices:
             meta = serial_to_meta.get(device["serial"], {})
@@ -2,6 +2,8 @@
 
 import logging
 from meraki.exceptions import APIError
+from ipam.vlan_index import VLANIndex
+from models import StaticRoute
 
 logger = logging.getLogger(__name__)
 
@@ -12,43 +14,49 @@ def configure_static_routes(dashboard, network_id, static_routes, resolved_vlans
     Args:
         dashboard: Authenticated Meraki Dashboard API session.
         network_id: Meraki network ID.
-        static_routes: List of static route dicts.
-        resolved_vlans: List of VLANs (from resolved config) including gateway IPs.
+        static_routes: List of StaticRoute records (or plain route dicts).
+        resolved_vlans: List of VLANs (from resolved config) including gateway IPs,
+            or a prebuilt VLANIndex over them.
+
+    Returns True only if every route that could be resolved was created.
     """
     logger.info(f"🛣️ Starting static route configuration for network {network_id}...")
 
     if not static_routes:
         logger.info("ℹ️ No static routes defined. Skipping.")
-        return
+        return True
+
+    vlan_index = VLANIndex.of(resolved_vlans)
+    ok = True
 
     for route in static_routes:
+        route = StaticRoute.of(route)
+
         # Handle dynamic gateway resolution
-        gw_ref = route.get("gatewayRef")  # e.g. "mgmt", "guest", or VLAN ID
-        gateway_ip = route.get("gatewayIp")
+        gw_ref = route.gateway_ref  # e.g. "mgmt", "guest", or VLAN ID
+        gateway_ip = route.gateway_ip
 
         if gw_ref and not gateway_ip:
-            matched = next((v for v in resolved_vlans if v.get("id") == gw_ref or v.get("name") == gw_ref), None)
+            matched = vlan_index.get(gw_ref)
             if matched:
                 gateway_ip = matched["gatewayIp"]
             else:
-                logger.warning(f"⚠️ Could not resolve gatewayRef '{gw_ref}' — skipping route '{route['name']}'")
+                logger.warning(f"⚠️ Could not resolve gatewayRef '{gw_ref}' — skipping route '{route.name}'")
                 continue
 
         try:
-            logger.info(f"➕ Creating static route: {route['name']} → {gateway_ip}")
+            logger.info(f"➕ Creating static route: {route.name} → {gateway_ip}")
             dashboard.appliance.createNetworkApplianceStaticRoute(
-                networkId     = network_id,
-                name          = route["name"],
-                subnet        = route["subnet"],
-                gatewayIp     = gateway_ip,
-                active        = route.get("active", True),
-                defaultGateway= route.get("defaultGateway", False),
-                ipVersion     = route.get("ipVersion")
+                networkId=network_id,
+                **route.to_payload(gateway_ip)
             )
-            logger.info(f"✅ Static route '{route['name']}' created.")
+            logger.info(f"✅ Static route '{route.name}' created.")
         except APIError as e:
-            logger.error(f"❌ Failed to create static route '{route.get('name', 'Unnamed')}': {e}")
+            logger.error(f"❌ Failed to create static route '{route.name or 'Unnamed'}': {e}")
+            ok = False
         except Exception as e:
             logger.error(f"❌ Unexpected error while creating static route: {e}")
+            ok = False
 
-    logger.info(f"🏁 Static route configuration complete for network {network_id}.")
\ No newline at end of file
+    logger.info(f"🏁 Static route configuration complete for network {network_id}.")
+    return ok
\ No newline at end of file
@@ -8,6 +8,8 @@ from meraki_sdk.network.ports.mx_ports import configure_mx_ports
 from meraki_sdk.network.firewall.mx_firewall import configure_outbound_rules, configure_inbound_rules
 from meraki_sdk.network.wireless.mx_wireless import apply_mx_wireless
 from meraki_sdk.network.vpn.mx_autovpn import configure_mx_autovpn
+from ipam.vlan_index import VLANIndex
+from utils.logging.timing import span
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,7 @@ def setup_network(
     do_vpn=True,
     do_ospf=False,
     do_bgp=False,
+    on_section_done=None,
 ):
     """
     Apply all logical Meraki network configuration:
@@ -32,27 +35,47 @@ def setup_network(
     - Static routes
     - Firewall rules
     - (Optional stubs for VPN, OSPF, BGP)
+    `on_section_done(section)` is called after each enabled section succeeds; a
+    section whose configurator reports a failure is not marked done, so
+    `deploy --resume` retries it. Returns True only if every enabled section succeeded.
     """
+    done = on_section_done or (lambda section: None)
+    failed = []
+
+    def finish(section, ok):
+        if ok:
+            done(section)
+        else:
+            failed.append(section)
 
     # 1. VLAN Configuration
     if do_vlans:
         logger.info("🌐 Configuring MX VLANs...")
-        configure_mx_vlans(dashboard, network_id, config)
+        with span("vlans"):
+            ok = configure_mx_vlans(dashboard, network_id, config)
+        finish("vlans", ok)
 
     # 2.1. Load MX Port Config for This Network
     mx_ports = config.get("mx_ports")
     logger.debug(f"[MX PORTS DEBUG] raw mx_ports config for network {network_id}: {mx_ports}")
     if do_ports and mx_ports:
         logger.info("🔌 Configuring MX ports...")
-        configure_mx_ports(dashboard, network_id, mx_ports)
+        with span("ports"):
+            ok = configure_mx_ports(dashboard, network_id, mx_ports)
         logger.debug(f"[MX PORTS DEBUG] MX port configuration applied for network {network_id}")
+        finish("ports", ok)
     else:
         logger.info("⚠️ No MX port configuration found, skipping.")
 
+    # 🗂️ Index VLANs once for route gatewayRef and firewall VLAN() macro lookups
+    vlan_index = VLANIndex(config.get("vlans", []))
+
     # 3. Static Routes
     if do_static_routes and config.get("mx_static_routes"):
         logger.info("🛣️ Configuring Static Routes...")
-        configure_static_routes(dashboard, network_id, config["mx_static_routes"], config["vlans"])
+        with span("static_routes"):
+            ok = configure_static_routes(dashboard, network_id, config["mx_static_routes"], vlan_index)
+        finish("static_routes", ok)
     else:
         logger.info("⚠️ No static routes defined, skipping.")
 
@@ -62,24 +85,31 @@ def setup_network(
     logger.debug(f"[DEBUG] Outbound Firewall Rules: {firewall_config.get('outbound_rules', [])}")
     logger.debug(f"[DEBUG] Inbound Firewall Rules: {firewall_config.get('inbound_rules', [])}")
     
-    outbound_rules = firewall_config.get("outbound_rules", [])
+    firewall_ok = True
+    outbound_rules = firewall_config.get("outbound_rules", []) if do_firewall else []
     if outbound_rules:
         logger.info("🚪 Configuring Outbound Firewall Rules...")
-        configure_outbound_rules(dashboard, network_id, outbound_rules, config["vlans"])
+        with span("firewall_outbound"):
+            firewall_ok = configure_outbound_rules(dashboard, network_id, outbound_rules, vlan_index)
     else:
         logger.info("⚠️ No outbound firewall rules found, skipping.")
     
-    inbound_rules = firewall_config.get("inbound_rules", [])
+    inbound_rules = firewall_config.get("inbound_rules", []) if do_firewall else []
     if inbound_rules:
         logger.info("🚪 Configuring Inbound Firewall Rules...")
-        configure_inbound_rules(dashboard, network_id, inbound_rules, config["vlans"])
+        with span("firewall_inbound"):
+            firewall_ok = configure_inbound_rules(dashboard, network_id, inbound_rules, vlan_index) and firewall_ok
     else:
         logger.info("⚠️ No inbound firewall rules found, skipping.")
+    if do_firewall and (outbound_rules or inbound_rules):
+        finish("firewall", firewall_ok)
     
     # 5. AutoVPN Configuration
     if do_vpn and config.get("mx_autovpn"):
         logger.info("🔒 Configuring AutoVPN...")
-        configure_mx_autovpn(dashboard, network_id, config["mx_autovpn"])
+        with span("autovpn"):
+            ok = configure_mx_autovpn(dashboard, network_id, config["mx_autovpn"])
+        finish("vpn", ok)
     else:
         logger.info("⚠️ No AutoVPN configuration found or VPN flag not enabled.")
     
@@ -88,7 +118,9 @@ def setup_network(
         wireless_config = config.get("mx_wireless", {})
         if wireless_config.get("ssids"):
             logger.info("📶 Configuring MX wireless SSIDs...")
-            apply_mx_wireless(dashboard, network_id, wireless_config)
+            with span("wireless"):
+                ok = apply_mx_wireless(dashboard, network_id, wireless_config)
+            finish("wireless", ok)
         else:
             logger.info("⚠️ No SSID configuration found under 'mx_wireless', skipping.")
     else:
@@ -98,4 +130,8 @@ def setup_network(
     if do_ospf:
         logger.info("📡 OSPF configuration not yet implemented.")
     if do_bgp:
-        logger.info("🌍 BGP configuration not yet implemented.")
\ No newline at end of file
+        logger.info("🌍 BGP configuration not yet implemented.")
+
+    if failed:
+        logger.warning(f"⚠️ Sections with errors on {network_id}: {', '.join(failed)}")
+    return not failed
\ No newline at end of file
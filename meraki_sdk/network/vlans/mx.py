@@ -6,6 +6,7 @@ import ipaddress
 from meraki.exceptions import APIError
 from meraki_sdk.network.vlans.exclusions import load_exclusion_overrides, get_vlan_exclusion
 from meraki_sdk.network.vlans.fixed_assignments import load_fixed_assignments, get_vlan_fixed_assignments
+from models import VLAN
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ def ensure_vlans_enabled(dashboard, network_id):
         logger.error(f"❌ APIError while managing VLANs for network {network_id}: {e}")
     except Exception as e:
         logger.error(f"❌ Unexpected error while managing VLANs: {e}")
+    return None
 
 def merge_fixed_assignments(vlan, fixed_assignments_data):
     if "fixedIpAssignments" not in vlan:
@@ -139,53 +141,51 @@ def generate_auto_fixed_assignments_from_reserved(devices, vlan):
     return auto_assignments
 
 def configure_mx_vlans(dashboard, network_id, config):
+    """Create and update every VLAN. Returns True only if nothing failed."""
     try:
         logger.info("🧑‍🔬 Starting MX VLAN configuration...")
-        ensure_vlans_enabled(dashboard, network_id)
+        ok = ensure_vlans_enabled(dashboard, network_id) is not None
 
         # 🚀 Load overrides and fixed assignments
         exclusion_overrides = load_exclusion_overrides()
         fixed_assignments_data = load_fixed_assignments()
 
+        # 🧱 Work on VLAN records in place so later summaries see the final assignments
+        config["vlans"] = [VLAN.of(vlan) for vlan in config["vlans"]]
+
         for vlan in config["vlans"]:
-            vlan_id = str(vlan["id"])
-            name = vlan["name"]
-            subnet = vlan["subnet"]
-            gateway = vlan["gatewayIp"]
+            vlan_id = str(vlan.id)
+            name = vlan.name
 
             # 🔗 Merge manual fixed assignments
             merge_fixed_assignments(vlan, fixed_assignments_data)
 
             # 🔥 Reserved IPs must be created BEFORE assigning fixed IPs
-            if not vlan.get("reservedIpRanges"):
+            if not vlan.reserved_ip_ranges:
                 logger.info(f"🔧 Auto-generating reserved IPs for VLAN {name}")
-                vlan["reservedIpRanges"] = get_vlan_exclusion(vlan, default_ratio=0.25, per_vlan_overrides=exclusion_overrides)
+                vlan.reserved_ip_ranges = get_vlan_exclusion(vlan, default_ratio=0.25, per_vlan_overrides=exclusion_overrides)
             else:
                 logger.info(f"📜 Using manually defined reserved IPs for VLAN {name}")
 
             # 🚀 Auto-assign infra devices IF this is the management VLAN
             management_vlan_name = config["base"].get("management_vlan", {}).get("name", "").lower()
-            if vlan.get("name", "").lower() == management_vlan_name:
-                logger.info(f"🧠 Auto-assigning fixed IPs to network infrastructure devices on {vlan['name']}...")
+            if (name or "").lower() == management_vlan_name:
+                logger.info(f"🧠 Auto-assigning fixed IPs to network infrastructure devices on {name}...")
                 try:
                     all_devices = dashboard.networks.getNetworkDevices(network_id)
                     infra_devices = [d for d in all_devices if any(m in d.get("model", "") for m in ["MX", "MV", "MG"])]
                     auto_assignments = generate_auto_fixed_assignments_from_reserved(infra_devices, vlan)
 
                     for mac, details in auto_assignments.items():
-                        vlan["fixedIpAssignments"][mac] = details  # Always overwrite
+                        vlan.fixed_ip_assignments[mac] = details  # Always overwrite
 
                     logger.info(f"✅ Auto-assigned {len(auto_assignments)} Meraki infrastructure devices.")
                 except Exception as e:
                     logger.error(f"❌ Failed to auto-generate infra assignments: {e}")
+                    ok = False
 
             # 🏗️ Step 1: Create minimal VLAN
-            create_payload = {
-                "id": vlan_id,
-                "name": name,
-                "subnet": subnet,
-                "applianceIp": gateway
-            }
+            create_payload = vlan.to_create_payload()
 
             try:
                 dashboard.appliance.createNetworkApplianceVlan(
@@ -198,19 +198,11 @@ def configure_mx_vlans(dashboard, network_id, config):
                     logger.warning(f"⚠️ VLAN {vlan_id} already exists. Proceeding to update.")
                 else:
                     logger.error(f"❌ Failed to create VLAN {vlan_id}: {e}")
+                    ok = False
                     continue  # Skip to next VLAN
 
             # 🏗️ Step 2: Update VLAN with full config
-            update_payload = {
-                "name": name,
-                "subnet": subnet,
-                "applianceIp": gateway,
-                "dhcpHandling": vlan.get("dhcpHandling", "Run a DHCP server"),
-                "dnsNameservers": vlan.get("dnsNameservers", "upstream_dns"),
-                "dhcpLeaseTime": vlan.get("dhcpLeaseTime", "12 hours"),
-                "reservedIpRanges": vlan.get("reservedIpRanges", []),
-                "fixedIpAssignments": vlan.get("fixedIpAssignments", {})
-            }
+            update_payload = vlan.to_update_payload()
 
             logger.debug(f"🔍 VLAN {vlan_id} update payload:\n{json.dumps(update_payload, indent=2)}")
 
@@ -223,10 +215,17 @@ def configure_mx_vlans(dashboard, network_id, config):
                 logger.info(f"✅ Updated VLAN {vlan_id} with full config.")
             except APIError as e:
                 logger.error(f"❌ Failed to update VLAN {vlan_id}: {e}")
+                ok = False
             except Exception as e:
                 logger.error(f"❌ Unexpected error while updating VLAN {vlan_id}: {e}")
+                ok = False
 
-        logger.info("✅ MX VLAN configuration applied successfully.")
+        if ok:
+            logger.info("✅ MX VLAN configuration applied successfully.")
+        else:
+            logger.warning("⚠️ MX VLAN configuration finished with errors.")
+        return ok
 
     except Exception as e:
-        logger.error(f"❌ Failed to apply MX VLAN configurations: {e}")
\ No newline at end of file
+        logger.error(f"❌ Failed to apply MX VLAN configurations: {e}")
+        return False
\ No newline at end of file
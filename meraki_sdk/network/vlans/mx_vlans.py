@@ -29,6 +29,7 @@ def ensure_vlans_enabled(dashboard, network_id):
         logger.error(f"❌ APIError while managing VLANs for network {network_id}: {e}")
     except Exception as e:
         logger.error(f"❌ Unexpected error while managing VLANs: {e}")
+    return None
 
 def merge_fixed_assignments(vlan, fixed_assignments_data):
     if "fixedIpAssignments" not in vlan:
@@ -139,10 +140,11 @@ def generate_auto_fixed_assignments_from_reserved(devices, vlan):
     return auto_assignments
 
 def configure_mx_vlans(dashboard, network_id, config):
+    """Create and update every VLAN. Returns True only if nothing failed."""
     import traceback
     try:
         logger.info("🧑‍🔬 Starting MX VLAN configuration...")
-        ensure_vlans_enabled(dashboard, network_id)
+        ok = ensure_vlans_enabled(dashboard, network_id) is not None
 
         # 🚀 Load overrides and fixed assignments
         exclusion_overrides = load_exclusion_overrides()
@@ -159,18 +161,18 @@ def configure_mx_vlans(dashboard, network_id, config):
             project_vlans = raw_vlans.get(network_slug, [])
             if not isinstance(common_vlans, list) or not isinstance(project_vlans, list):
                 logger.error(f"❌ Invalid mx_vlans structure. Expected lists under 'common' and '{network_slug}' keys.")
-                return
+                return False
             merged_vlans.extend(common_vlans)
             merged_vlans.extend(project_vlans)
         elif isinstance(raw_vlans, list):
             merged_vlans = raw_vlans
         else:
             logger.warning(f"⚠️ mx_vlans config format not recognized. Skipping VLAN config.")
-            return
+            return False
 
         if not merged_vlans:
             logger.warning(f"⚠️ No VLANs found after merge for network_slug '{network_slug}'. Skipping VLAN config.")
-            return
+            return True
 
         for vlan in merged_vlans:
 
@@ -206,6 +208,7 @@ def configure_mx_vlans(dashboard, network_id, config):
                     logger.info(f"✅ Auto-assigned {len(auto_assignments)} Meraki infrastructure devices.")
                 except Exception as e:
                     logger.error(f"❌ Failed to auto-generate infra assignments: {e}")
+                    ok = False
 
             # 🏗️ Step 1: Create minimal VLAN
             create_payload = {
@@ -226,6 +229,7 @@ def configure_mx_vlans(dashboard, network_id, config):
                     logger.warning(f"⚠️ VLAN {vlan_id} already exists. Proceeding to update.")
                 else:
                     logger.error(f"❌ Failed to create VLAN {vlan_id}: {e}")
+                    ok = False
                     continue  # Skip to next VLAN
 
             # 🏗️ Step 2: Update VLAN with full config
@@ -251,11 +255,18 @@ def configure_mx_vlans(dashboard, network_id, config):
                 logger.info(f"✅ Updated VLAN {vlan_id} with full config.")
             except APIError as e:
                 logger.error(f"❌ Failed to update VLAN {vlan_id}: {e}")
+                ok = False
             except Exception as e:
                 logger.error(f"❌ Unexpected error while updating VLAN {vlan_id}: {e}")
+                ok = False
 
-        logger.info("✅ MX VLAN configuration applied successfully.")
+        if ok:
+            logger.info("✅ MX VLAN configuration applied successfully.")
+        else:
+            logger.warning("⚠️ MX VLAN configuration finished with errors.")
+        return ok
 
     except Exception as e:
         logger.error(f"❌ Failed to apply MX VLAN configurations: {type(e).__name__} - {e}")
-        logger.debug(traceback.format_exc())
\ No newline at end of file
+        logger.debug(traceback.format_exc())
+        return False
\ No newline at end of file
@@ -1,4 +1,5 @@
 import logging
+from models import AutoVPNSettings
 
 logger = logging.getLogger(__name__)
 
@@ -9,20 +10,25 @@ def configure_mx_autovpn(dashboard, network_id, config):
     Args:
         dashboard: Authenticated Meraki SDK client
         network_id: The target network's Meraki ID
-        config: The resolved mx_autovpn config dict for this network
+        config: The resolved AutoVPNSettings (or plain dict) for this network
+
+    Returns False if the Dashboard call failed.
     """
 
     if not config or "mode" not in config:
         logger.info(f"🔕 Skipping AutoVPN config for {network_id}: no config or mode specified.")
-        return
+        return True
 
-    logger.info(f"🔐 Applying AutoVPN config to network {network_id} with mode: {config['mode']}")
+    settings = AutoVPNSettings.of(config)
+    logger.info(f"🔐 Applying AutoVPN config to network {network_id} with mode: {settings.mode}")
 
     try:
         dashboard.appliance.updateNetworkApplianceVpnSiteToSiteVpn(
             networkId=network_id,
-            **config
+            **settings.to_payload()
         )
         logger.info(f"✅ AutoVPN config applied to {network_id}")
+        return True
     except Exception as e:
-        logger.error(f"❌ Failed to apply AutoVPN config to {network_id}: {e}")
\ No newline at end of file
+        logger.error(f"❌ Failed to apply AutoVPN config to {network_id}: {e}")
+        return False
\ No newline at end of file
@@ -3,17 +3,33 @@
 import logging
 import json
 from meraki.exceptions import APIError
+from utils.intern import SECTION_POOL
+from models import SSID
 
 logger = logging.getLogger(__name__)
 
+def _build_ssid_payloads(config):
+    """
+    Merge `defaults` into each SSID and return [(ssid_number, payload), ...].
+    """
+    defaults = config.get("defaults", {})
+    payloads = []
+    for i, ssid in enumerate(config.get("ssids", [])):
+        ssid = SSID.of(ssid)
+        ssid_number = i if ssid.number is None else ssid.number
+
+        # Merge defaults with override
+        payloads.append((ssid_number, ssid.to_payload(defaults)))
+    return payloads
+
 def apply_mx_wireless(dashboard, network_id, config):
     """
     Apply MX wireless SSID settings using `config`, expected to contain:
     - `defaults`: base config applied to all SSIDs
     - `ssids`: list of individual SSID configs
+    Returns True only if every SSID was applied (or the network has no wireless MX).
     """
 
-    defaults = config.get("defaults", {})
     ssids = config.get("ssids", [])
 
     # Check for wireless-capable MX devices before proceeding
@@ -23,23 +39,20 @@ def apply_mx_wireless(dashboard, network_id, config):
         if not wireless_capable:
             models = [d.get("model", "Unknown") for d in devices if "MX" in d.get("model", "")]
             logger.warning(f"⚠️ No wireless-capable MX device found in network {network_id}. Skipping wireless config as the following devices are not wireless capable: {', '.join(models)}.")
-            return
+            return True
     except Exception as e:
         logger.error(f"❌ Failed to retrieve devices for wireless capability check: {e}")
-        return
+        return False
 
     if not ssids:
         logger.warning(f"⚠️ No SSIDs defined in config for network {network_id}. Skipping.")
-        return
+        return True
 
-    for i, ssid in enumerate(ssids):
-        ssid_number = ssid.get("number", i)
-
-        # Merge defaults with override
-        final = defaults.copy()
-        final.update(ssid)
+    # ♻️ Built once per shared SSID set, reused by every network that resolves to it
+    ssid_payloads = SECTION_POOL.payload(config, "ssid_payloads", _build_ssid_payloads)
+    ok = True
 
-        payload = {k: v for k, v in final.items() if k != "number"}
+    for ssid_number, payload in ssid_payloads:
         name = payload.get("name", f"SSID {ssid_number}")
 
         try:
@@ -56,7 +69,13 @@ def apply_mx_wireless(dashboard, network_id, config):
 
         except APIError as e:
             logger.error(f"❌ APIError on SSID '{name}' (slot {ssid_number}): {e}")
+            ok = False
         except Exception as e:
             logger.error(f"❌ Unexpected error on SSID '{name}' (slot {ssid_number}): {e}")
+            ok = False
 
-    logger.info("✅ All SSIDs applied successfully.")
\ No newline at end of file
+    if ok:
+        logger.info("✅ All SSIDs applied successfully.")
+    else:
+        logger.warning(f"⚠️ Some SSIDs failed on network {network_id}.")
+    return ok
\ No newline at end of file
@@ -0,0 +1,54 @@
+# meraki_sdk/rate_governor.py
+
+import threading
+import time
+
+# 🚦 Dashboard API budget: 10 requests/second per organization (burst of 10)
+DEFAULT_RATE = 10
+DEFAULT_BURST = 10
+
+_governors = {}
+_lock = threading.Lock()
+
+
+class RateGovernor:
+    """
+    Token bucket shared by every worker calling the Dashboard for one org.
+    `acquire()` blocks until a call is allowed, so concurrent workers stay
+    under the per-org rate limit instead of tripping 429 retries.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1 - 1e-9:  # tolerate float drift
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+    def call(self, fn, *args, **kwargs):
+        """Run `fn(*args, **kwargs)` once a token is available."""
+        self.acquire()
+        return fn(*args, **kwargs)
+
+
+def get_rate_governor(org=None, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+    """Return the shared governor for `org`, creating it on first use."""
+    with _lock:
+        governor = _governors.get(org)
+        if governor is None:
+            governor = _governors[org] = RateGovernor(rate, burst)
+        return governor
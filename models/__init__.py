@@ -0,0 +1,8 @@
+from .network import VLAN, MXPort, StaticRoute, FirewallRule, SSID, AutoVPNHub, AutoVPNSettings
+from .ports import MXPortSpec
+from .inventory import DeviceInventory, ProviderInventory, normalize_tag
+
+__all__ = [
+    "VLAN", "MXPort", "MXPortSpec", "StaticRoute", "FirewallRule", "SSID", "AutoVPNHub", "AutoVPNSettings",
+    "DeviceInventory", "ProviderInventory", "normalize_tag",
+]
@@ -0,0 +1,104 @@
+# models/inventory.py
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_tag(tag):
+    """Tags are compared with underscores and hyphens treated as equal."""
+    return str(tag).replace("_", "-")
+
+
+class DeviceInventory:
+    """
+    Flattened devices.yaml, indexed once per run.
+
+    Every device inherits its group `tag` on top of any device-level `tags`.
+    Devices are indexed by normalised tag and by serial, so selecting the
+    devices for a network is a dict lookup instead of a scan of every device.
+    Devices listed in several groups appear once per group.
+    """
+
+    def __init__(self, grouped=None):
+        self.devices = []       # flattened device dicts, in file order
+        self.by_serial = {}     # serial → device (last listing wins)
+        self.by_tag = {}        # normalised tag → [device]
+
+        self.add_groups((grouped or {}).get("groups", []))
+
+    @classmethod
+    def from_groups(cls, groups):
+        """Build an inventory from an iterable of groups (e.g. a streaming reader)."""
+        inventory = cls()
+        inventory.add_groups(groups)
+        return inventory
+
+    @classmethod
+    def of(cls, value):
+        """Return `value` if it is already an inventory, else index a grouped devices.yaml dict."""
+        return value if isinstance(value, cls) else cls(value)
+
+    def add_groups(self, groups):
+        for group in groups:
+            group_tag = group.get("tag")
+            for device in group.get("devices") or []:
+                self.add(device, group_tag)
+
+    def add(self, device, group_tag=None):
+        device_tags = device.get("tags", [])
+        if isinstance(device_tags, str):
+            device_tags = [device_tags]
+
+        tags = list(dict.fromkeys([*device_tags, group_tag] if group_tag else device_tags))
+        device = {**device, "tags": tags}
+
+        self.devices.append(device)
+        if "serial" in device:
+            self.by_serial[device["serial"]] = device
+        for tag in {normalize_tag(t) for t in tags}:
+            self.by_tag.setdefault(tag, []).append(device)
+        return device
+
+    def for_tag(self, tag):
+        """Devices carrying `tag` (underscore/hyphen insensitive)."""
+        return list(self.by_tag.get(normalize_tag(tag), []))
+
+    def get(self, serial, default=None):
+        return self.by_serial.get(serial, default)
+
+    def __len__(self):
+        return len(self.devices)
+
+    def __iter__(self):
+        return iter(self.devices)
+
+
+class ProviderInventory:
+    """
+    DeviceInventory interface over a backend with indexed lookups
+    (`get_devices_for_tag` / `get_device`, e.g. SQLiteBackend).
+
+    Nothing is loaded up front: each network's devices are one query.
+    Iterating walks every group, for callers that need the whole list.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+
+    @classmethod
+    def supports(cls, provider):
+        return hasattr(provider, "get_devices_for_tag") and hasattr(provider, "get_device")
+
+    def for_tag(self, tag):
+        return self.provider.get_devices_for_tag(tag)
+
+    def get(self, serial, default=None):
+        device = self.provider.get_device(serial)
+        return default if device is None else device
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __iter__(self):
+        return iter(DeviceInventory.from_groups(self.provider.iter_device_groups()).devices)
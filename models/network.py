@@ -0,0 +1,327 @@
+# models/network.py
+#
+# 🧱 Typed, slotted model for resolved network configuration
+#
+# The resolver used to hand out deeply nested plain dicts. These records keep
+# the same data in `__slots__` objects (no per-instance __dict__), expose it as
+# attributes for the configurators, and convert cheaply to API payloads
+# (`to_payload()`) and JSON (`to_dict()`).
+#
+# Each record also supports dict-style `record["key"]` / `.get("key")` using
+# the Meraki API key names, for code that still handles raw YAML dicts and
+# records alike (e.g. the resolver's AutoVPN and VLAN helpers).
+#
+# Keys without an attribute go to `extra`, which stays None unless a record
+# actually has some; frozen records get a read-only `extra`.
+
+from dataclasses import dataclass
+
+from utils.intern import FrozenDict
+
+
+class _Record:
+    __slots__ = ()
+
+    # API/YAML key → attribute name; unknown keys are kept in `extra`
+    _KEYS = {}
+
+    @classmethod
+    def from_dict(cls, data):
+        known, extra = {}, {}
+        for key, value in (data or {}).items():
+            attr = cls._KEYS.get(key)
+            if attr:
+                known[attr] = value
+            else:
+                extra[key] = value
+        return cls(**known, extra=extra or None)
+
+    def __post_init__(self):
+        # 🔒 A frozen record's leftovers are read-only too
+        if self.extra and self.__dataclass_params__.frozen and not isinstance(self.extra, FrozenDict):
+            object.__setattr__(self, "extra", FrozenDict(self.extra))
+
+    @classmethod
+    def of(cls, value):
+        """Return `value` if it is already this record type, else build one from a dict."""
+        return value if isinstance(value, cls) else cls.from_dict(value)
+
+    def to_dict(self):
+        data = {}
+        for key, attr in self._KEYS.items():
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    # 🔁 Dict-style access (API key names) for consumers not yet on attributes
+    def __getitem__(self, key):
+        attr = self._KEYS.get(key)
+        if attr is None:
+            if self.extra is None:
+                raise KeyError(key)
+            return self.extra[key]
+        value = getattr(self, attr)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        attr = self._KEYS.get(key)
+        if attr is None:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+        else:
+            setattr(self, attr, value)
+
+    def __contains__(self, key):
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return self.extra is not None and key in self.extra
+        return getattr(self, attr) is not None
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+@dataclass(slots=True)
+class VLAN(_Record):
+    id: int
+    name: str
+    subnet: str = None
+    gateway_ip: str = None
+    dhcp_handling: str = None
+    dns_nameservers: str = None
+    dhcp_lease_time: str = None
+    reserved_ip_ranges: list = None
+    fixed_ip_assignments: dict = None
+    extra: dict = None
+
+    _KEYS = {
+        "id": "id",
+        "name": "name",
+        "subnet": "subnet",
+        "gatewayIp": "gateway_ip",
+        "dhcpHandling": "dhcp_handling",
+        "dnsNameservers": "dns_nameservers",
+        "dhcpLeaseTime": "dhcp_lease_time",
+        "reservedIpRanges": "reserved_ip_ranges",
+        "fixedIpAssignments": "fixed_ip_assignments",
+    }
+
+    def to_create_payload(self):
+        return {
+            "id": str(self.id),
+            "name": self.name,
+            "subnet": self.subnet,
+            "applianceIp": self.gateway_ip,
+        }
+
+    def to_update_payload(self):
+        return {
+            "name": self.name,
+            "subnet": self.subnet,
+            "applianceIp": self.gateway_ip,
+            "dhcpHandling": self.dhcp_handling or "Run a DHCP server",
+            "dnsNameservers": self.dns_nameservers or "upstream_dns",
+            "dhcpLeaseTime": self.dhcp_lease_time or "12 hours",
+            "reservedIpRanges": self.reserved_ip_ranges or [],
+            "fixedIpAssignments": self.fixed_ip_assignments or {},
+        }
+
+
+@dataclass(slots=True)
+class MXPort(_Record):
+    number: int = None
+    name: str = None
+    enabled: bool = None
+    type: str = None
+    vlan: object = None
+    allowed_vlans: str = None
+    drop_untagged_traffic: bool = None
+    poe_enabled: bool = None
+    access_policy: str = None
+    extra: dict = None
+
+    _KEYS = {
+        "port": "number",
+        "name": "name",
+        "enabled": "enabled",
+        "type": "type",
+        "vlan": "vlan",
+        "allowedVlans": "allowed_vlans",
+        "dropUntaggedTraffic": "drop_untagged_traffic",
+        "poeEnabled": "poe_enabled",
+        "accessPolicy": "access_policy",
+    }
+
+    def to_payload(self):
+        """
+        Build the updateNetworkAppliancePort payload. WAN ports only take
+        name/enabled; allowedVlans is only sent for trunk ports.
+        """
+        if self.type == "wan":
+            fields = (("name", self.name), ("enabled", self.enabled))
+        else:
+            fields = (
+                ("name", self.name),
+                ("enabled", self.enabled),
+                ("type", self.type),
+                ("vlan", self.vlan),
+                ("allowedVlans", self.allowed_vlans if self.type == "trunk" else None),
+                ("dropUntaggedTraffic", self.drop_untagged_traffic),
+                ("poeEnabled", self.poe_enabled),
+                ("accessPolicy", self.access_policy),
+            )
+        return {key: value for key, value in fields if value is not None}
+
+
+@dataclass(slots=True)
+class StaticRoute(_Record):
+    name: str = None
+    subnet: str = None
+    gateway_ip: str = None
+    gateway_ref: object = None
+    ip_version: str = None
+    active: bool = None
+    default_gateway: bool = None
+    extra: dict = None
+
+    _KEYS = {
+        "name": "name",
+        "subnet": "subnet",
+        "gatewayIp": "gateway_ip",
+        "gatewayRef": "gateway_ref",
+        "ipVersion": "ip_version",
+        "active": "active",
+        "defaultGateway": "default_gateway",
+    }
+
+    def to_payload(self, gateway_ip=None):
+        return {
+            "name": self.name,
+            "subnet": self.subnet,
+            "gatewayIp": gateway_ip or self.gateway_ip,
+            "active": True if self.active is None else self.active,
+            "defaultGateway": bool(self.default_gateway),
+            "ipVersion": self.ip_version,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class FirewallRule(_Record):
+    policy: str = None
+    protocol: str = None
+    src_cidr: str = None
+    src_port: str = None
+    dest_cidr: str = None
+    dest_port: str = None
+    comment: str = None
+    syslog_enabled: bool = None
+    extra: dict = None
+
+    _KEYS = {
+        "comment": "comment",
+        "policy": "policy",
+        "protocol": "protocol",
+        "srcPort": "src_port",
+        "srcCidr": "src_cidr",
+        "destPort": "dest_port",
+        "destCidr": "dest_cidr",
+        "syslogEnabled": "syslog_enabled",
+    }
+
+    def to_payload(self, inbound=False):
+        """
+        Build one rule of the L3 (outbound) or inbound firewall payload.
+        policy, srcCidr and destCidr are required (and protocol for inbound
+        rules); a missing one raises KeyError, as the dict-based code did.
+        """
+        for key in ("policy", "protocol", "srcCidr", "destCidr") if inbound else ("policy", "srcCidr", "destCidr"):
+            if key not in self:
+                raise KeyError(key)
+        return {
+            "comment": self.comment or "",
+            "policy": self.policy,
+            "protocol": self.protocol or "any",
+            "srcCidr": self.src_cidr,
+            "srcPort": self.src_port or "any",
+            "destCidr": self.dest_cidr,
+            "destPort": self.dest_port or "any",
+            "syslogEnabled": bool(self.syslog_enabled),
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class SSID(_Record):
+    number: int = None
+    name: str = None
+    default_vlan_id: int = None
+    extra: dict = None
+
+    _KEYS = {
+        "number": "number",
+        "name": "name",
+        "defaultVlanId": "default_vlan_id",
+    }
+
+    def to_payload(self, defaults=None):
+        """Merge shared SSID `defaults` with this SSID's settings (slot number excluded)."""
+        payload = dict(defaults or {})
+        if self.extra:
+            payload.update(self.extra)
+        if self.name is not None:
+            payload["name"] = self.name
+        if self.default_vlan_id is not None:
+            payload["defaultVlanId"] = self.default_vlan_id
+        return payload
+
+
+@dataclass(slots=True)
+class AutoVPNHub(_Record):
+    hub_id: str = None
+    use_default_route: bool = None
+    extra: dict = None
+
+    _KEYS = {
+        "hubId": "hub_id",
+        "useDefaultRoute": "use_default_route",
+    }
+
+
+@dataclass(slots=True)
+class AutoVPNSettings(_Record):
+    mode: str = None
+    hubs: list = None
+    subnets: list = None
+    subnet: dict = None
+    extra: dict = None
+
+    _KEYS = {
+        "mode": "mode",
+        "hubs": "hubs",
+        "subnets": "subnets",
+        "subnet": "subnet",
+    }
+
+    @classmethod
+    def from_dict(cls, data):
+        settings = super(AutoVPNSettings, cls).from_dict(data)
+        if settings.hubs is not None:
+            settings.hubs = [AutoVPNHub.of(hub) for hub in settings.hubs]
+        return settings
+
+    def to_dict(self):
+        data = super(AutoVPNSettings, self).to_dict()
+        if self.hubs is not None:
+            data["hubs"] = [hub.to_dict() for hub in self.hubs]
+        return data
+
+    def to_payload(self):
+        return self.to_dict()
@@ -0,0 +1,131 @@
+# models/ports.py
+#
+# 🔌 Compact, range-aware MX port configuration (MXPortSpec) over MXPort records
+
+import logging
+
+from .network import MXPort
+
+logger = logging.getLogger(__name__)
+
+
+def _overlay(base, override):
+    """
+    Nested merge of `override` onto `base` without deep-copying leaf values.
+    Materialised payloads are read-only, so sharing leaves between ports is safe.
+    """
+    result = dict(base)
+    for key, value in override.items():
+        if isinstance(result.get(key), dict) and isinstance(value, dict):
+            result[key] = _overlay(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def parse_port_range(port_field):
+    """
+    Turn a `portId`/`port` value into an inclusive (start, end) tuple.
+    Accepts 3, "3" and "3-10". Raises ValueError on anything else.
+    """
+    if isinstance(port_field, str) and "-" in port_field:
+        start, end = map(int, port_field.split("-"))
+    else:
+        start = end = int(port_field)
+    if end < start:
+        raise ValueError(f"range end {end} is before start {start}")
+    return start, end
+
+
+class MXPortSpec:
+    """
+    Compact, range-aware MX port configuration.
+
+    Holds the shared `defaults` once plus one entry per port profile as written
+    in YAML (ranges such as "3-10" are kept, not expanded). Port numbers map to
+    their profile in O(1); records and API payloads are only materialised when
+    a port is asked for, and the payload is built once per profile.
+    """
+
+    def __init__(self, defaults=None, ports=None):
+        self.defaults = defaults or {}
+        self.profiles = []      # [(start, end, port_def)]
+        self._by_number = {}    # port number → profile index (last definition wins)
+        self._merged = {}       # profile index → defaults merged with profile
+        self._payloads = {}     # profile index → updateNetworkAppliancePort payload
+
+        for port_def in ports or []:
+            port_field = port_def.get("portId") or port_def.get("port")
+            if port_field is None:
+                logger.warning(f"⚠️ MX port definition without portId skipped: {port_def}")
+                continue
+            try:
+                start, end = parse_port_range(port_field)
+            except Exception as e:
+                logger.warning(f"⚠️ Invalid port range '{port_field}': {e}")
+                continue
+
+            idx = len(self.profiles)
+            self.profiles.append((start, end, port_def))
+            for number in range(start, end + 1):
+                self._by_number[number] = idx
+
+    @classmethod
+    def of(cls, ports_config):
+        """
+        Return `ports_config` unchanged if it is already a spec; otherwise
+        wrap a list of fully resolved port dicts (legacy shape).
+        """
+        return ports_config if isinstance(ports_config, cls) else cls(ports=ports_config)
+
+    def __len__(self):
+        return len(self._by_number)
+
+    def __contains__(self, port_number):
+        return self._lookup(port_number) is not None
+
+    def __iter__(self):
+        """Yield materialised MXPort records in port-number order."""
+        for number in sorted(self._by_number):
+            yield self.port(number)
+
+    def _lookup(self, port_number):
+        try:
+            return self._by_number.get(int(port_number))
+        except (TypeError, ValueError):
+            return None
+
+    def _profile(self, idx):
+        """Defaults merged with profile `idx` (port number excluded), built once."""
+        if idx not in self._merged:
+            port_def = {k: v for k, v in self.profiles[idx][2].items() if k not in ("portId", "port")}
+            self._merged[idx] = _overlay(self.defaults, port_def)
+        return self._merged[idx]
+
+    def port(self, port_number):
+        """
+        Return the resolved MXPort record for one port, or None if unconfigured.
+        """
+        idx = self._lookup(port_number)
+        if idx is None:
+            return None
+        return MXPort.from_dict({**self._profile(idx), "port": int(port_number)})
+
+    def payload(self, port_number):
+        """
+        Return the updateNetworkAppliancePort payload for one port, or None if
+        unconfigured. Every port of a profile shares one (read-only) payload dict.
+        """
+        idx = self._lookup(port_number)
+        if idx is None:
+            return None
+        if idx not in self._payloads:
+            self._payloads[idx] = MXPort.from_dict(self._profile(idx)).to_payload()
+        return self._payloads[idx]
+
+    def to_dict(self):
+        """Compact JSON form: shared defaults plus the un-expanded port profiles."""
+        return {
+            "defaults": self.defaults,
+            "ports": [port_def for _, _, port_def in self.profiles],
+        }
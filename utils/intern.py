@@ -0,0 +1,128 @@
+# utils/intern.py
+
+import hashlib
+import threading
+from copy import deepcopy
+
+from utils.jsonl import canonical_json
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ ♻️ Hash-consed resolved sections                                            │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# Most networks resolve to byte-identical firewall rule lists, SSID sets and
+# port profiles. Interning them by content hash lets every network point at one
+# shared, immutable instance, and lets the push layer build the API payload for
+# that instance once and reuse it for every network that shares it.
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict. Still a real dict, so `.get()`, iteration and `json.dump`
+    work unchanged; any attempt to mutate it raises TypeError. `copy()` and
+    `copy.deepcopy()` return plain, mutable copies (see `thaw`).
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Interned config sections are read-only; copy before modifying.")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self):
+        return dict(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return thaw(self, memo)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value):
+    """Recursively convert dicts → FrozenDict and lists → tuples."""
+    if isinstance(value, dict):
+        return FrozenDict({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value, memo=None):
+    """Inverse of `freeze`: a deep, mutable copy with plain dicts and lists."""
+    if isinstance(value, dict):
+        return {k: thaw(v, memo) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v, memo) for v in value]
+    return deepcopy(value, memo)
+
+
+def content_hash(value):
+    """Stable SHA-1 of a section's JSON form (key order independent)."""
+    return hashlib.sha1(canonical_json(value)).hexdigest()
+
+
+class _Entry:
+    """One interned section and the payloads derived from it; they live and die together."""
+
+    __slots__ = ("section", "payloads")
+
+    def __init__(self, section):
+        self.section = section
+        self.payloads = {}
+
+
+class SectionPool:
+    """
+    Interns resolved config sections by (kind, content hash) and memoises the
+    payloads the push layer derives from them. Entries last until `clear()`,
+    which the resolver calls at the start of every run.
+    """
+
+    def __init__(self):
+        self._sections = {}  # (kind, digest) → _Entry
+        self._entries = {}   # id(section) → _Entry; the entry holds the section, so the id stays its own
+        self._lock = threading.Lock()
+
+    def intern(self, kind, value):
+        """
+        Return the shared instance for `value`. Plain dicts/lists are frozen;
+        objects exposing `to_dict()` (e.g. MXPortSpec) are shared as-is.
+        """
+        key = (kind, content_hash(value))
+        with self._lock:
+            entry = self._sections.get(key)
+            if entry is None:
+                entry = _Entry(value if hasattr(value, "to_dict") else freeze(value))
+                self._sections[key] = self._entries[id(entry.section)] = entry
+            return entry.section
+
+    def payload(self, section, name, build):
+        """
+        Return `build(section)`, computed once per interned section.
+        Sections that were never interned (or were cleared since) are built fresh every time.
+        """
+        with self._lock:
+            entry = self._entries.get(id(section))
+            if entry is None or entry.section is not section:
+                entry = None
+            elif name in entry.payloads:
+                return entry.payloads[name]
+        built = build(section)
+        if entry is None:
+            return built
+        with self._lock:
+            return entry.payloads.setdefault(name, built)
+
+    def __len__(self):
+        return len(self._sections)
+
+    def clear(self):
+        with self._lock:
+            self._sections.clear()
+            self._entries.clear()
+
+
+# 🧠 Shared by the resolver and the push layer for the whole run
+SECTION_POOL = SectionPool()
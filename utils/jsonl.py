@@ -0,0 +1,53 @@
+# utils/jsonl.py
+
+import json
+import os
+
+# 📜 JSON helpers shared by the state store and the section pool, and
+# append-only JSON Lines files (deployment journal, summary streams)
+#
+# Each record is a single os.write() on an O_APPEND descriptor, so concurrent
+# writers never interleave. A writer killed mid-append leaves a torn last line;
+# before appending, the writer ends that line first, so the fragment stays on a
+# line of its own (readers skip it) instead of swallowing the next record.
+
+
+def to_json(obj):
+    """`json.dump(default=...)` fallback for resolver objects that expose `to_dict()` (e.g. MXPortSpec)."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def canonical_json(value):
+    """Compact, key-sorted JSON bytes: equal content always encodes (and hashes) the same."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=to_json).encode("utf-8")
+
+
+def _ends_with_newline(fd):
+    size = os.fstat(fd).st_size
+    return size == 0 or os.pread(fd, 1, size - 1) == b"\n"
+
+
+def append_jsonl(path, record, fsync=False):
+    """Append `record` as one JSON line, terminating a torn last line first."""
+    line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if not _ends_with_newline(fd):
+            line = b"\n" + line
+        os.write(fd, line)
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_jsonl(path):
+    """Yield each record in file order; torn and blank lines are skipped."""
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
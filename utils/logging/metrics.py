@@ -0,0 +1,251 @@
+# utils/logging/metrics.py
+
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 📊 Metrics registry (Prometheus text exposition)                            │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# Live visibility for long rollouts without tailing logs. Every Dashboard call
+# made through an instrumented session (utils/logging/timing.py) is counted here,
+# and the session's HTTP hook counts 429s and the requests the SDK re-sends.
+#
+# Export either as a text file for node_exporter's textfile collector, rewritten
+# every `interval` seconds, or on a local port:
+#
+#   metrics:
+#     textfile: logs/metrics/python_meraki.prom
+#     interval: 15
+#     port: 9464
+
+DEFAULT_TEXTFILE = "logs/metrics/python_meraki.prom"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+NETWORK_BUCKETS = (5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)] + [f'{n}="{v}"' for n, v in extra]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class CounterMetric:
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(n, "") for n in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels.get(n, "") for n in self.labels), 0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labels, key)} {value}")
+        return lines
+
+
+class HistogramMetric:
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # labels → [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, **labels):
+        key = tuple(labels.get(n, "") for n in self.labels)
+        with self._lock:
+            series = self._series.setdefault(key, [0] * len(self.buckets) + [0.0, 0])
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[i] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def count(self, **labels):
+        series = self._series.get(tuple(labels.get(n, "") for n in self.labels))
+        return series[-1] if series else 0
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, hits in zip(self.buckets, series):
+                    lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, [('le', bound)])} {hits}")
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, [('le', '+Inf')])} {series[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {series[-2]:.6f}")
+                lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {series[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        for metric in self._metrics:
+            with metric._lock:
+                (metric._values if isinstance(metric, CounterMetric) else metric._series).clear()
+
+
+REGISTRY = Registry()
+
+API_CALLS = REGISTRY.register(CounterMetric(
+    "meraki_api_calls_total", "Dashboard API calls by endpoint and outcome status.", ("endpoint", "status")))
+API_RETRIES = REGISTRY.register(CounterMetric(
+    "meraki_api_retries_total", "HTTP requests re-sent by the SDK after a 429 or 5xx.", ("method",)))
+API_RATE_LIMITED = REGISTRY.register(CounterMetric(
+    "meraki_api_rate_limited_total", "HTTP 429 responses from the Dashboard.", ("method",)))
+OBJECTS_WRITTEN = REGISTRY.register(CounterMetric(
+    "meraki_objects_written_total", "Successful create/update/claim/remove/delete calls per section.", ("section",)))
+API_LATENCY = REGISTRY.register(HistogramMetric(
+    "meraki_api_call_seconds", "Dashboard API call latency, including SDK retries.", ("endpoint",)))
+NETWORK_DURATION = REGISTRY.register(HistogramMetric(
+    "meraki_network_deploy_seconds", "Wall time to deploy one network.", ("org",), NETWORK_BUCKETS))
+
+_WRITE_PREFIXES = ("create", "update", "claim", "remove", "delete", "bind", "unbind")
+
+# 🔁 Per thread: the (method, url) of the last 429/5xx response, until the SDK re-sends it.
+# A heuristic, not a record of the SDK's retry loop: the hook only sees responses,
+# so "the next request on this thread has the same method and URL" is taken to be
+# the retry. It relies on the SDK retrying synchronously on the calling thread;
+# an identical request the caller itself sends right after a 429/5xx would also
+# count. record_api_call() resets it at the end of every call.
+_pending_retry = threading.local()
+
+
+def record_api_call(endpoint, seconds, error=None, section=None):
+    """Feed one Dashboard call (called by timing.timed_call)."""
+    status = "ok" if error is None else str(getattr(error, "status", None) or type(error).__name__)
+    API_CALLS.inc(endpoint=endpoint, status=status)
+    API_LATENCY.observe(seconds, endpoint=endpoint)
+    method = endpoint.rsplit(".", 1)[-1]
+    if error is None and method.startswith(_WRITE_PREFIXES):
+        OBJECTS_WRITTEN.inc(section=section or "other")
+    _pending_retry.request = None  # a 429/5xx the call gave up on was never retried
+
+
+def record_http_response(method, status_code, url=None):
+    """
+    Feed one HTTP attempt (installed as a session response hook in meraki_sdk/auth.py).
+    A retry is counted only when the same request is actually sent again after a
+    429/5xx, so the last failed attempt of a call (and each page of a paginated
+    read) is not one.
+    """
+    if status_code == 429:
+        API_RATE_LIMITED.inc(method=method)
+    request = (method, str(url))
+    if getattr(_pending_retry, "request", None) == request:
+        API_RETRIES.inc(method=method)
+    _pending_retry.request = request if status_code == 429 or status_code >= 500 else None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 📤 Exporters                                                                │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def write_textfile(path=DEFAULT_TEXTFILE, registry=REGISTRY):
+    """Atomically rewrite `path` with the current exposition text."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(registry.render())
+    os.replace(tmp, path)
+    return path
+
+
+class MetricsExporter:
+    """Flushes the registry to a text file every `interval` seconds and/or serves it on `port`."""
+
+    def __init__(self, textfile=None, interval=15, port=None, host="127.0.0.1", registry=REGISTRY):
+        self.textfile = textfile
+        self.interval = interval
+        self.port = port
+        self.host = host
+        self.registry = registry
+        self.server = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self.textfile:
+            self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._thread.start()
+            logger.info(f"📊 Writing metrics to {self.textfile} every {self.interval}s")
+        if self.port is not None:
+            registry = self.registry
+
+            class _Handler(BaseHTTPRequestHandler):
+                def log_message(self, format, *args):
+                    pass
+
+                def do_GET(self):
+                    body = registry.render().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; version=0.0.4")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+            self.server = ThreadingHTTPServer((self.host, self.port), _Handler)
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            logger.info(f"📊 Serving metrics on http://{self.host}:{self.server.server_address[1]}/metrics")
+        return self
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        if self.textfile:
+            try:
+                write_textfile(self.textfile, self.registry)
+            except OSError as e:
+                logger.warning(f"⚠️ Failed to write metrics file {self.textfile}: {e}")
+
+    def stop(self):
+        """Final flush, then stop the flush thread and HTTP server."""
+        self._stop.set()
+        self.flush()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+def start_metrics_exporter(options=None):
+    """Start an exporter from the `metrics:` block in defaults.yaml. Returns None if not configured."""
+    options = options or {}
+    if not options.get("textfile") and options.get("port") is None:
+        return None
+    return MetricsExporter(
+        textfile=options.get("textfile"),
+        interval=options.get("interval", 15),
+        port=options.get("port"),
+        host=options.get("host", "127.0.0.1"),
+    ).start()
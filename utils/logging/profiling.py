@@ -0,0 +1,114 @@
+# utils/logging/profiling.py
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🔬 Opt-in phase profiling                                                   │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# `python main.py deploy --profile=vlans,devices [--profile-memory]`
+#
+# Every phase is a timing span (utils/logging/timing.py); when a span's name is
+# selected here it also runs under cProfile (and tracemalloc with --profile-memory).
+# Output per phase, org and network:
+#   logs/profiles/<phase>-<org>-<network>-<timestamp>.pstats      → snakeviz / pstats
+#   logs/profiles/<phase>-<org>-<network>-<timestamp>.txt         → top functions by cumulative time
+#   logs/profiles/<phase>-<org>-<network>-<timestamp>.alloc.txt   → top allocations (memory only)
+#
+# cProfile only sees the thread that entered the phase.
+
+PROFILE_DIR = "logs/profiles"
+PROFILE_PHASES = (
+    "resolve", "destroy", "create_network",
+    "devices", "claim", "address", "naming", "enrich",
+    "network", "vlans", "ports", "static_routes", "firewall_outbound", "firewall_inbound", "autovpn", "wireless",
+)
+
+_settings = {"phases": frozenset(), "memory": False, "folder": PROFILE_DIR}
+_active = threading.local()
+
+
+def enable_profiling(phases, memory=False, folder=PROFILE_DIR):
+    unknown = set(phases) - set(PROFILE_PHASES)
+    if unknown:
+        raise ValueError(f"❌ Unknown profile phase(s): {', '.join(sorted(unknown))}. Choose from: {', '.join(PROFILE_PHASES)}")
+    _settings.update(phases=frozenset(phases), memory=memory, folder=folder)
+
+
+def disable_profiling():
+    _settings.update(phases=frozenset(), memory=False, folder=PROFILE_DIR)
+
+
+def _safe(name):
+    return str(name).lower().replace(" ", "").replace("-", "")
+
+
+def _write_reports(base, profiler, snapshots, top=40):
+    import io
+    import pstats
+
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    profiler.dump_stats(f"{base}.pstats")
+
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+    with open(f"{base}.txt", "w") as f:
+        f.write(out.getvalue())
+
+    if snapshots:
+        before, after, peak = snapshots
+        lines = [f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB", ""]
+        lines += [str(stat) for stat in after.compare_to(before, "lineno")[:top]]
+        with open(f"{base}.alloc.txt", "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+@contextmanager
+def profile_phase(phase, labels=None):
+    """Profile the enclosed block if `phase` was selected with --profile (no-op otherwise)."""
+    if phase not in _settings["phases"] or getattr(_active, "on", False):
+        yield
+        return
+
+    import cProfile
+
+    labels = labels or {}
+    parts = [phase, _safe(labels.get("org") or "all")]
+    if labels.get("network"):
+        parts.append(_safe(labels["network"]))
+    parts.append(datetime.now().strftime("%Y%m%d-%H%M%S"))
+    base = os.path.join(_settings["folder"], "-".join(parts))
+
+    memory = _settings["memory"]
+    if memory:
+        import tracemalloc
+
+        owns_tracing = not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start(25)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+
+    profiler = cProfile.Profile()
+    _active.on = True
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _active.on = False
+        snapshots = None
+        if memory:
+            snapshots = (before, tracemalloc.take_snapshot(), tracemalloc.get_traced_memory()[1])
+            if owns_tracing:
+                tracemalloc.stop()
+        try:
+            _write_reports(base, profiler, snapshots)
+            logger.info(f"🔬 Profile for '{phase}' saved to {base}.pstats")
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to write profile for '{phase}': {e}")
@@ -1,206 +1,240 @@
-deployment_summaries = {}
 import os
 import logging
+import threading
 from collections import Counter
-import json
+from datetime import datetime
+
+from models import AutoVPNSettings
+from utils.jsonl import append_jsonl, read_jsonl
 
 logger = logging.getLogger(__name__)
 
-def log_deployment_summary(config, org_name, named_devices, dashboard, summary_filename=None):
-    """
-    Logs and saves a summary of the deployment.
-    """
-    logger.info("\U0001F4CA Summary of this deployment:")
+# 🧾 Summaries are an append-only JSON Lines stream per org, one structured record
+# per network: logs/summary_log/summary-<org>.jsonl (see utils/jsonl.py).
+# The human-readable summary-<org>.log next to it is rendered from the same
+# record and appended with one write(), so concurrent networks never interleave.
+SUMMARY_FOLDER = "logs/summary_log"
+_streams = {}  # org name → stream written during this run
+_streams_lock = threading.Lock()
 
-    summary_folder = "logs/summary_log"
-    os.makedirs(summary_folder, exist_ok=True)
 
-    if summary_filename is None:
-        safe_org = org_name.lower().replace(" ", "").replace("-", "")
-        summary_filename = f"summary-{safe_org}.log"
+def _safe_name(org_name):
+    return org_name.lower().replace(" ", "").replace("-", "")
 
-    summary_path = os.path.join(summary_folder, summary_filename)
 
-    if not os.path.exists(summary_path):
-        header_lines = [
-            f"\n🧾 This file contains a full summary of the deployment actions taken for the Meraki organization '{org_name}'.",
-            f"\n🌍 Organization: {org_name}",
-            f"🏢 Networks in this organization will be listed below as they are deployed.",
-            "\n"
-        ]
-        with open(summary_path, "a") as f:
-            for line in header_lines:
-                f.write(line + "\n")
+def _append_text(path, text, header=None):
+    """Append `text` with a single write(); `header` is written first only by whoever creates the file."""
+    if header is not None:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
+            try:
+                os.write(fd, header.encode("utf-8"))
+            finally:
+                os.close(fd)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, text.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def read_deployment_summaries(path):
+    """
+    Aggregate a summary stream: {org name: [network records in write order]}.
+    A torn line (writer killed mid-append) is skipped.
+    """
+    by_org = {}
+    if not os.path.exists(path):
+        return by_org
+    for record in read_jsonl(path):
+        by_org.setdefault(record.get("organization"), []).append(record)
+    return by_org
+
 
+def build_summary_record(config, org_name, named_devices):
+    """One network's deployment summary as plain data (what the JSONL stream stores)."""
+    fw = config.get("firewall", {})
+    autovpn = config.get("mx_autovpn") or AutoVPNSettings()
+    return {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "organization": org_name,
+        "org_id": config.get("org_id"),
+        "network": config.get("network", {}).get("name"),
+        "network_id": config.get("network_id"),
+        "device_count": len(named_devices),
+        "named_devices": named_devices,
+        "locations": sorted({d["address"] for d in named_devices if d.get("address")}),
+        "ports": [{"port": port.number, "vlan": port.vlan, "type": port.type}
+                  for port in config.get("mx_ports") or []],
+        "vlans": [{"id": vlan.id, "name": vlan.name, "subnet": vlan.subnet,
+                   "fixed_assignments": {mac: {"ip": details.get("ip"), "name": details.get("name")}
+                                         for mac, details in (vlan.fixed_ip_assignments or {}).items()}}
+                  for vlan in config.get("vlans", [])],
+        "static_routes": [{"name": route.name, "subnet": route.subnet, "gatewayIp": route.gateway_ip}
+                          for route in config.get("mx_static_routes", [])],
+        "firewall": {direction: ["Unnamed" if rule.comment is None else rule.comment
+                                 for rule in fw.get(f"{direction}_rules") or []]
+                     for direction in ("inbound", "outbound")},
+        "autovpn": {"mode": autovpn.mode,
+                    "hubs": [{"hubId": hub.hub_id, "useDefaultRoute": hub.use_default_route}
+                             for hub in autovpn.hubs or []],
+                    "subnets": [{"localSubnet": subnet.get("localSubnet"), "useVpn": subnet.get("useVpn")}
+                                for subnet in autovpn.subnets or []]},
+        "ssids": [{"name": ssid.name, "vlan": ssid.default_vlan_id}
+                  for ssid in config.get("mx_wireless", {}).get("ssids", [])],
+    }
+
+
+def render_summary_lines(record):
+    """Human-readable lines for one summary record (console and .log file)."""
     # ======= Structured, user-readable summaries for each category =======
     summary_lines = []
 
     # Org and Network
-    summary_lines.append(f"    - ✅ Organization: {org_name}")
-    summary_lines.append(f"    - ✅ Network Name: {config['network']['name']}")
-    summary_lines.append(f"    - ✅ Network ID: {config.get('network_id', '❌ Not Found')}")
+    summary_lines.append(f"    - ✅ Organization: {record['organization']}")
+    summary_lines.append(f"    - ✅ Network Name: {record['network']}")
+    summary_lines.append(f"    - ✅ Network ID: {record.get('network_id') or '❌ Not Found'}")
 
     # Location Info
-    locations = set((d.get("address") for d in named_devices if d.get("address")))
-    if locations:
+    if record["locations"]:
         summary_lines.append("    - 📍 Location(s):")
-        for loc in locations:
+        for loc in record["locations"]:
             summary_lines.append(f"        • {loc}")
     else:
         summary_lines.append("    - 📍 No location info available.")
 
     # Devices
     summary_lines.append("    - 📦 Devices Claimed and Named:")
-    for device in named_devices:
+    for device in record["named_devices"]:
         summary_lines.append(f"        • {device['model']} {device['name']} — {device['serial']}")
 
     # Ports
     summary_lines.append("    - 🔌 MX Ports:")
-    for port in config.get("mx_ports", []):
-        summary_lines.append(f"        • Port {port.get('port') or port.get('portId')} → VLAN {port.get('vlan', 'N/A')} ({port.get('type', 'N/A')})")
+    for port in record["ports"]:
+        summary_lines.append(f"        • Port {port['port']} → VLAN {port['vlan'] or 'N/A'} ({port['type'] or 'N/A'})")
 
     # VLANs
     summary_lines.append("    - 🌐 VLANs:")
-    for vlan in config.get("vlans", []):
+    for vlan in record["vlans"]:
         summary_lines.append(f"        • VLAN {vlan['id']} '{vlan['name']}' → {vlan['subnet']}")
 
     # Fixed Assignments
     summary_lines.append("    - 📌 Fixed IP Assignments:")
-    for vlan in config.get("vlans", []):
-        vlan_id = vlan.get("id")
-        name = vlan.get("name", "Unnamed VLAN")
-        assignments = vlan.get("fixedIpAssignments", {})
-        if assignments:
-            summary_lines.append(f"        • VLAN {vlan_id} ({name}):")
-            for mac, details in assignments.items():
-                summary_lines.append(f"            - {mac} → {details.get('ip')} ({details.get('name')})")
+    for vlan in record["vlans"]:
+        if vlan["fixed_assignments"]:
+            summary_lines.append(f"        • VLAN {vlan['id']} ({vlan['name']}):")
+            for mac, details in vlan["fixed_assignments"].items():
+                summary_lines.append(f"            - {mac} → {details['ip']} ({details['name']})")
         else:
-            summary_lines.append(f"        • VLAN {vlan_id} ({name}): No fixed IP assignments.")
+            summary_lines.append(f"        • VLAN {vlan['id']} ({vlan['name']}): No fixed IP assignments.")
 
     # Static Routes
     summary_lines.append("    - 🛣️ Static Routes:")
-    for route in config.get("mx_static_routes", []):
+    for route in record["static_routes"]:
         summary_lines.append(f"        • {route['name']} → {route['subnet']} via {route['gatewayIp']}")
 
     # Firewall Rules
-    fw = config.get("firewall", {})
     summary_lines.append("    - 🔥 Firewall Rules:")
-    if fw.get("inbound_rules"):
-        summary_lines.append("        • Inbound:")
-        for rule in fw["inbound_rules"]:
-            summary_lines.append(f"            - {rule.get('comment', 'Unnamed')}")
-    else:
-        summary_lines.append("        • Inbound: None")
-    if fw.get("outbound_rules"):
-        summary_lines.append("        • Outbound:")
-        for rule in fw["outbound_rules"]:
-            summary_lines.append(f"            - {rule.get('comment', 'Unnamed')}")
-    else:
-        summary_lines.append("        • Outbound: None")
+    for direction, comments in record["firewall"].items():
+        if comments:
+            summary_lines.append(f"        • {direction.capitalize()}:")
+            for comment in comments:
+                summary_lines.append(f"            - {comment}")
+        else:
+            summary_lines.append(f"        • {direction.capitalize()}: None")
 
     # AutoVPN
-    autovpn = config.get("mx_autovpn", {})
+    autovpn = record["autovpn"]
     summary_lines.append("    - 🔐 AutoVPN Configuration:")
-    summary_lines.append(f"        • Mode: {autovpn.get('mode', '❌ Not Specified')}")
-    hubs = autovpn.get("hubs", [])
-    if autovpn.get("mode") == "spoke" and hubs:
+    summary_lines.append(f"        • Mode: {autovpn['mode'] or '❌ Not Specified'}")
+    if autovpn["mode"] == "spoke" and autovpn["hubs"]:
         summary_lines.append("        • Hubs:")
-        for hub in hubs:
-            summary_lines.append(f"            - Hub ID: {hub.get('hubId', '❌ Missing')} | Default Route: {hub.get('useDefaultRoute')}")
-    elif autovpn.get("mode") == "hub":
+        for hub in autovpn["hubs"]:
+            summary_lines.append(f"            - Hub ID: {hub['hubId'] or '❌ Missing'} | Default Route: {hub['useDefaultRoute']}")
+    elif autovpn["mode"] == "hub":
         summary_lines.append("        • This network is acting as a VPN hub.")
     else:
         summary_lines.append("        • No hub configuration found.")
 
-    if autovpn.get("subnets"):
+    if autovpn["subnets"]:
         summary_lines.append("        • VPN-Enabled Subnets:")
         for subnet in autovpn["subnets"]:
-            summary_lines.append(f"            - {subnet.get('localSubnet')} (Use VPN: {subnet.get('useVpn')})")
+            summary_lines.append(f"            - {subnet['localSubnet']} (Use VPN: {subnet['useVpn']})")
     else:
         summary_lines.append("        • No subnets configured for VPN.")
 
     # Wireless SSIDs
-    ssids = config.get("mx_wireless", {}).get("ssids", [])
     summary_lines.append("    - 📶 Wireless SSIDs:")
-    if ssids:
-        for ssid in ssids:
-            summary_lines.append(f"        • {ssid['name']} (VLAN {ssid.get('defaultVlanId')})")
+    if record["ssids"]:
+        for ssid in record["ssids"]:
+            summary_lines.append(f"        • {ssid['name']} (VLAN {ssid['vlan']})")
     else:
         summary_lines.append("        • None configured")
 
     # Insert network header line before verified configuration overview
-    summary_lines.insert(0, f"\n📡 Network: {config['network']['name']} — Deployment Summary Begins")
+    summary_lines.insert(0, f"\n📡 Network: {record['network']} — Deployment Summary Begins")
     summary_lines.append("")  # adds a blank line
 
-    summary_lines.append(f"\n✅ End of configuration summary for network '{config['network']['name']}'")
+    summary_lines.append(f"\n✅ End of configuration summary for network '{record['network']}'")
+    return summary_lines
+
+
+def log_deployment_summary(config, org_name, named_devices, dashboard, summary_filename=None):
+    """
+    Logs and saves a summary of the deployment.
+    """
+    logger.info("\U0001F4CA Summary of this deployment:")
+
+    summary_folder = SUMMARY_FOLDER
+    os.makedirs(summary_folder, exist_ok=True)
+
+    if summary_filename is None:
+        summary_filename = f"summary-{_safe_name(org_name)}.log"
+
+    summary_path = os.path.join(summary_folder, summary_filename)
+
+    record = build_summary_record(config, org_name, named_devices)
+    summary_lines = render_summary_lines(record)
 
     # Log all lines
     for line in summary_lines:
         logger.info(line)
 
-    # Save to file using safe filename format
     # Append to the summary file for the same org instead of overwriting
-    with open(summary_path, "a") as f:
-        for line in summary_lines:
-            f.write(line + "\n")
-
-    # Save summary as JSON, appending new networks under each org
-    json_summary_path = os.path.join(summary_folder, summary_filename.replace(".log", ".json"))
-    # Try to load existing JSON, if present
-    if os.path.exists(json_summary_path):
-        try:
-            with open(json_summary_path, "r") as jf:
-                existing = json.load(jf)
-        except Exception:
-            existing = {}
-    else:
-        existing = {}
-    # Ensure structure: { "organization": org_name, "networks": [ ... ] }
-    if not existing or existing.get("organization") != org_name:
-        existing = {
-            "organization": org_name,
-            "networks": []
-        }
-    existing["networks"].append({
-        "network": config.get("network", {}).get("name"),
-        "named_devices": named_devices,
-        "summary_lines": summary_lines
-    })
-    with open(json_summary_path, "w") as jf:
-        json.dump(existing, jf, indent=2)
-    logger.info(f"\U0001F4BE JSON summary saved to {json_summary_path}")
+    header_lines = [
+        f"\n🧾 This file contains a full summary of the deployment actions taken for the Meraki organization '{org_name}'.",
+        f"\n🌍 Organization: {org_name}",
+        f"🏢 Networks in this organization will be listed below as they are deployed.",
+        "\n"
+    ]
+    _append_text(summary_path, "".join(line + "\n" for line in summary_lines),
+                 header="".join(line + "\n" for line in header_lines))
+
+    # One JSONL record for this network; nothing already written is re-read
+    stream_path = os.path.join(summary_folder, summary_filename.replace(".log", ".jsonl"))
+    append_jsonl(stream_path, record)
+    with _streams_lock:
+        _streams[org_name] = stream_path
+    logger.info(f"\U0001F4BE JSON summary appended to {stream_path}")
 
     logger.info(f"\U0001F4DD Deployment summary saved to {summary_path}")
 
 
-# === Deployment summary collection and printing ===
-
-def collect_deployment_summary(config, org_name, named_devices, summary_lines):
-    if org_name not in deployment_summaries:
-        deployment_summaries[org_name] = []
-    deployment_summaries[org_name].append({
-        "network": config.get("network", {}).get("name", "Unknown Network"),
-        "org_id": config.get("org_id", "❌ Not Provided"),
-        "network_id": config.get("network_id", "❌ Not Provided"),
-        "device_count": len(named_devices),
-        "summary_lines": summary_lines
-    })
-
-from datetime import datetime
+# === Deployment summary printing ===
 
 def print_final_summary():
     logger.info("📋 FINAL DEPLOYMENT SUMMARY\n")
     logger.info("=" * 50)
 
-    # Support for artifact logging
-    # Get first org and network for safe_org and timestamp
-    if deployment_summaries:
-        first_entry = next(iter(deployment_summaries.values()))[0]
-        safe_org = next(iter(deployment_summaries)).lower().replace(" ", "").replace("-", "")
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    else:
-        safe_org = "unknownorg"
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    # 📚 Aggregate the streams this run wrote (a resumed org includes its earlier networks)
+    with _streams_lock:
+        streams = dict(_streams)
+    deployment_summaries = {}
+    for org_name, path in streams.items():
+        deployment_summaries[org_name] = read_deployment_summaries(path).get(org_name, [])
 
     for org_name, networks in deployment_summaries.items():
         logger.info(f"🌍 Organization: {org_name}")
@@ -211,14 +245,34 @@ def print_final_summary():
         for idx, entry in enumerate(networks, 1):
             logger.info(f"🔹 Network: {entry['network']}")
             logger.info(f"🌍 Org: {org_name}")
-            logger.info(f"🆔 Org ID: {entry.get('org_id', '❌ Not Provided')}")
-            logger.info(f"🆔 Network ID: {entry.get('network_id', '❌ Not Provided')}")
+            logger.info(f"🆔 Org ID: {entry.get('org_id') or '❌ Not Provided'}")
+            logger.info(f"🆔 Network ID: {entry.get('network_id') or '❌ Not Provided'}")
             logger.info(f"📦 Devices: {entry.get('device_count', '0')} device(s) configured")
             logger.info("-" * 50)
             logger.info("")  # Blank line between networks
 
+    # ⏱️ Performance reports (spans + per-endpoint latency), one per org deployed this run
+    from utils.logging.timing import build_performance_report, recorded_orgs, write_performance_report
+
+    perf_paths = []
+    for org_name in recorded_orgs():
+        label = org_name or "run"  # calls outside any org (resolve, org lookup)
+        perf_path, report = write_performance_report(_safe_name(label), report=build_performance_report(org_name))
+        perf_paths.append(perf_path)
+        logger.info(f"⏱️ PERFORMANCE — {label}: {report['total_calls']} Dashboard call(s)")
+        for section, entry in report["sections"].items():
+            logger.info(f"   🧩 {section}: {entry['wall_seconds']:.2f}s wall ({entry['count']}×)")
+        for endpoint, stats in list(report["endpoints"].items())[:10]:
+            logger.info(f"   🌐 {endpoint}: {stats['count']} call(s), p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, max {stats['max_ms']}ms")
+        for network, entry in report["networks"].items():
+            logger.info(f"   📡 {network}: {entry['calls']} call(s)")
+        logger.info("")
+
     logger.info("🗂️ Deployment artifacts saved:")
-    logger.info(f"💾 JSON summary saved to logs/summary_log/summary-{safe_org}.json")
-    logger.info(f"📝 Deployment summary saved to logs/summary_log/summary-{safe_org}.log")
-    logger.info(f"📦 Intended state saved to state/intended_state/intended-{safe_org}-{timestamp}.json")
+    for org_name, path in streams.items():
+        logger.info(f"💾 {org_name} JSON summary stream: {path}")
+        logger.info(f"📝 {org_name} deployment summary saved to {os.path.splitext(path)[0]}.log")
+    for perf_path in perf_paths:
+        logger.info(f"⏱️ Performance report saved to {perf_path}")
+    logger.info("📦 Intended state snapshots indexed in state/intended_state/index.jsonl")
     logger.info("")
@@ -0,0 +1,232 @@
+# utils/logging/timing.py
+
+import contextvars
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+from utils.logging.metrics import record_api_call
+from utils.logging.profiling import profile_phase
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ ⏱️ Timing spans                                                             │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# `span()` times a phase (claim, vlans, firewall, ...) and `instrument_dashboard()`
+# times every Dashboard call. Labels (org, network, section) set by an outer span
+# are inherited by everything inside it, including calls made on worker threads
+# started with contextvars.copy_context().
+#
+#   with span("network", org=org_name, network=net_name):
+#       with span("vlans"):
+#           dashboard.appliance.createNetworkApplianceVlan(...)
+#
+# Every span and call is folded into running aggregates as it completes: per
+# endpoint a count, sum, max and a bounded reservoir of latencies (p50/p95),
+# wall time per section and calls per network. Memory grows with endpoints,
+# sections and networks, not with the number of calls. Aggregates are kept per org and for the whole run, so
+# `build_performance_report(org=...)` gives each org its own report.
+
+_labels = contextvars.ContextVar("span_labels", default={})
+
+RESERVOIR_SIZE = 1024  # latency samples kept per endpoint; percentiles are exact up to this many calls
+_ALL = object()        # key of the whole-run aggregate
+
+
+class _Latencies:
+    """count / sum / max plus a uniform reservoir sample (Algorithm R) of one endpoint's latencies."""
+
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = []
+
+    def add(self, seconds, rng):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(seconds)
+        else:
+            slot = rng.randrange(self.count)
+            if slot < RESERVOIR_SIZE:
+                self.samples[slot] = seconds
+
+
+class _Aggregate:
+    """Running totals behind one performance report."""
+
+    def __init__(self):
+        self.endpoints = {}  # endpoint → _Latencies
+        self.sections = {}   # section → {"count", "wall_seconds"}
+        self.networks = {}   # network → {"org", "calls", "by_section"}
+
+    def add(self, kind, name, seconds, labels, rng):
+        if kind == "call":
+            self.endpoints.setdefault(name, _Latencies()).add(seconds, rng)
+            network = labels.get("network")
+            if network:
+                counts = self.networks.setdefault(network, {"org": labels.get("org"), "calls": 0, "by_section": {}})
+                counts["calls"] += 1
+                section = labels.get("section", "other")
+                counts["by_section"][section] = counts["by_section"].get(section, 0) + 1
+        else:
+            entry = self.sections.setdefault(name, {"count": 0, "wall_seconds": 0.0})
+            entry["count"] += 1
+            entry["wall_seconds"] += seconds
+
+
+_aggregates = {}       # org label (None: outside any org) or _ALL → _Aggregate
+_lock = threading.Lock()
+_rng = random.Random()
+
+
+def _record(kind, name, seconds, labels):
+    with _lock:
+        for key in (_ALL, labels.get("org")):
+            aggregate = _aggregates.get(key)
+            if aggregate is None:
+                aggregate = _aggregates[key] = _Aggregate()
+            aggregate.add(kind, name, seconds, labels, _rng)
+
+
+def current_labels():
+    return dict(_labels.get())
+
+
+@contextmanager
+def span(section, **labels):
+    """
+    Time the enclosed block as `section`; `labels` apply to everything inside it.
+    🔬 Runs under cProfile when `section` was selected with --profile.
+    """
+    merged = {**_labels.get(), **labels, "section": section}
+    token = _labels.set(merged)
+    started = time.perf_counter()
+    try:
+        with profile_phase(section, merged):
+            yield
+    finally:
+        _record("span", section, time.perf_counter() - started, merged)
+        _labels.reset(token)
+
+
+def timed_call(endpoint, fn, *args, **kwargs):
+    """Call `fn` and record its latency under `endpoint` (📊 also fed to the metrics registry)."""
+    started = time.perf_counter()
+    error = None
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        seconds = time.perf_counter() - started
+        labels = _labels.get()
+        _record("call", endpoint, seconds, labels)
+        record_api_call(endpoint, seconds, error, labels.get("section"))
+
+
+class _TimedScope:
+    """Wraps one SDK scope (`dashboard.networks`, ...) so its methods are timed."""
+
+    def __init__(self, scope, name):
+        self._scope = scope
+        self._name = name
+
+    def __getattr__(self, attr):
+        value = getattr(self._scope, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+        endpoint = f"{self._name}.{attr}"
+        return lambda *args, **kwargs: timed_call(endpoint, value, *args, **kwargs)
+
+
+class TimedDashboard:
+    """Transparent proxy over a DashboardAPI that records every API call."""
+
+    def __init__(self, dashboard):
+        self._dashboard = dashboard
+        self._scopes = {}
+
+    def __getattr__(self, attr):
+        value = getattr(self._dashboard, attr)
+        if attr.startswith("_") or inspect.isroutine(value):
+            return value
+        scope = self._scopes.get(attr)
+        if scope is None:
+            scope = self._scopes[attr] = _TimedScope(value, attr)
+        return scope
+
+
+def instrument_dashboard(dashboard):
+    if isinstance(dashboard, TimedDashboard):
+        return dashboard
+    return TimedDashboard(dashboard)
+
+
+def reset_spans():
+    with _lock:
+        _aggregates.clear()
+
+
+def recorded_orgs():
+    """Org labels seen so far, in first-seen order; None collects work outside any org (resolve, org lookup)."""
+    with _lock:
+        return [key for key in _aggregates if key is not _ALL]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 📈 Performance report                                                       │
+# └─────────────────────────────────────────────────────────────────────────────┘
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
+def build_performance_report(org=_ALL):
+    """p50/p95/max per endpoint, wall time per section and calls per network, for `org` or the whole run."""
+    with _lock:
+        aggregate = _aggregates.get(org) or _Aggregate()
+        latencies = {name: (stats.count, stats.total, stats.max, sorted(stats.samples))
+                     for name, stats in aggregate.endpoints.items()}
+        sections = {name: dict(entry) for name, entry in aggregate.sections.items()}
+        networks = {name: {**entry, "by_section": dict(entry["by_section"])} for name, entry in aggregate.networks.items()}
+
+    endpoints = {}
+    for name, (count, total, slowest, samples) in latencies.items():
+        endpoints[name] = {
+            "count": count,
+            "p50_ms": round(_percentile(samples, 50) * 1000, 2),
+            "p95_ms": round(_percentile(samples, 95) * 1000, 2),
+            "max_ms": round(slowest * 1000, 2),
+            "total_seconds": round(total, 4),
+        }
+    for entry in sections.values():
+        entry["wall_seconds"] = round(entry["wall_seconds"], 4)
+
+    return {
+        "total_calls": sum(e["count"] for e in endpoints.values()),
+        "endpoints": dict(sorted(endpoints.items(), key=lambda kv: -kv[1]["total_seconds"])),
+        "sections": dict(sorted(sections.items(), key=lambda kv: -kv[1]["wall_seconds"])),
+        "networks": networks,
+    }
+
+
+def write_performance_report(safe_org, folder="logs/summary_log", report=None):
+    """Write the report as `perf-{safe_org}.json` next to the JSON summary. Returns (path, report)."""
+    report = build_performance_report() if report is None else report
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"perf-{safe_org}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path, report
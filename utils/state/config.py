@@ -1,7 +1,13 @@
 import os
+import gzip
 import json
-import datetime
+import hashlib
+from datetime import datetime, timezone
+import functools
 import subprocess
+import threading
+
+from utils.jsonl import append_jsonl, canonical_json, read_jsonl
 
 # ┌─────────────────────────────────────────────────────────────────────────────┐
 # │ 🧠 Intended State                                                           │
@@ -23,15 +29,26 @@ import subprocess
 #   - later build a comparison engine vs the *actual* Meraki state
 #   - support dry-runs, auditing, and config assurance pipelines
 #
-# Output files go here:
-#   - `state/intended_state/intended-{safe_org_name}.json`
+# Output files go here (content-addressed, like git objects):
+#   - `state/intended_state/blobs/ab/<sha256>.json.gz`  → one per distinct section (vlans, firewall, ...)
+#                                                         and one "tree" per snapshot pointing at them
+#   - `state/intended_state/index.jsonl`                 → org, network, timestamp, git hash → tree
+#
+# Sections that did not change (the same firewall on every network, the same
+# VLANs run after run) are stored once. `load_intended_state(tree)` rebuilds a
+# full config; `find_intended_states(org=..., since=...)` searches the index.
 #
 # NOTE: This is not fetched from Meraki—it’s our *local intent*.
 
+INTENDED_DIR = "state/intended_state"
+_index_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
 def get_git_commit_hash():
     """
     Attempts to retrieve the current Git commit hash to tag the state file.
     Falls back to 'unknown' if not in a Git repo or on error.
+    Runs `git` once per process; later calls reuse the result.
     """
     try:
         result = subprocess.run(
@@ -44,33 +61,84 @@ def get_git_commit_hash():
     except Exception:
         return "unknown"
 
-def save_intended_state(config, org_name):
+def _blob_path(digest, folder=INTENDED_DIR):
+    return os.path.join(folder, "blobs", digest[:2], f"{digest}.json.gz")
+
+def _put_blob(data, folder=INTENDED_DIR):
+    """
+    Store `data` (canonical JSON bytes) under its SHA-256 and return the hash.
+    Existing blobs are never rewritten; new ones appear atomically (temp file + rename).
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    path = _blob_path(digest, folder)
+    if os.path.exists(path):
+        return digest
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(gzip.compress(data, mtime=0))
+    os.replace(tmp, path)
+    return digest
+
+def _get_blob(digest, folder=INTENDED_DIR):
+    with open(_blob_path(digest, folder), "rb") as f:
+        return json.loads(gzip.decompress(f.read()))
+
+def save_intended_state(config, org_name, folder=INTENDED_DIR):
     """
-    Dumps the full resolved config for this org as an 'intended state' JSON file.
-    
-    📁 These files represent the declarative intent behind your infrastructure.
-    They are stored under: state/intended_state/
-    
-    ✨ Each file is uniquely named using:
-      - the sanitized org name (no spaces/dashes)
-      - a UTC timestamp for uniqueness
-      - the current Git commit hash (if available) for traceability
+    Stores the full resolved config for one network as a content-addressed snapshot.
+
+    📁 Each non-empty top-level section becomes a blob keyed by its hash; a small
+    "tree" blob maps section names to those hashes (scalars are kept inline).
+    One index line records org, network, UTC timestamp and Git commit → tree.
+
+    Returns the tree blob's path.
     """
-    # Sanitize org name → lowercase, no spaces or dashes
-    safe_name = org_name.lower().replace(" ", "").replace("-", "")
+    tree = {}
+    for key, value in config.items():
+        if isinstance(value, (dict, list)) and value:
+            tree[key] = {"blob": _put_blob(canonical_json(value), folder)}
+        else:
+            tree[key] = {"value": json.loads(canonical_json(value))}
+    tree_hash = _put_blob(canonical_json(tree), folder)
 
-    # Generate timestamp and Git hash
-    timestamp = datetime.datetime.utcnow().strftime("%Y%m%d-%H%M%S")
-    git_hash = get_git_commit_hash()
+    network = config.get("network", {})
+    entry = {
+        "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "org": org_name,
+        "network": network.get("name") if isinstance(network, dict) else None,
+        "network_id": config.get("network_id"),
+        "git": get_git_commit_hash(),
+        "tree": tree_hash,
+    }
+    with _index_lock:
+        append_jsonl(os.path.join(folder, "index.jsonl"), entry)
 
-    # Build filename: e.g., intended-percystreet007-20240502-132210-ab12cd3.json
-    filename = f"intended-{safe_name}-{timestamp}-{git_hash[:7]}.json"
-    folder = "state/intended_state"
-    os.makedirs(folder, exist_ok=True)
+    return _blob_path(tree_hash, folder)
 
-    # Save the config as pretty JSON
-    path = os.path.join(folder, filename)
-    with open(path, "w") as f:
-        json.dump(config, f, indent=2)
+def load_intended_state(tree_hash, folder=INTENDED_DIR):
+    """
+    Rebuild the config saved as `tree_hash` (as plain JSON types).
+    """
+    tree = _get_blob(tree_hash, folder)
+    return {key: _get_blob(ref["blob"], folder) if "blob" in ref else ref["value"] for key, ref in tree.items()}
 
-    return path  # Optionally used for logging
\ No newline at end of file
+def find_intended_states(org=None, network=None, since=None, until=None, folder=INTENDED_DIR):
+    """
+    Index entries matching org / network name and an ISO timestamp range, oldest first.
+    """
+    path = os.path.join(folder, "index.jsonl")
+    if not os.path.exists(path):
+        return []
+    matches = []
+    for entry in read_jsonl(path):
+        if org and entry["org"] != org:
+            continue
+        if network and entry["network"] != network:
+            continue
+        if since and entry["ts"] < since:
+            continue
+        if until and entry["ts"] > until:
+            continue
+        matches.append(entry)
+    return matches
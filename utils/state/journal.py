@@ -0,0 +1,85 @@
+# utils/state/journal.py
+
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from utils.jsonl import append_jsonl, read_jsonl
+
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 📓 Deployment journal                                                       │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# Append-only JSON Lines, one file per project: state/journal/<project>.jsonl
+#
+# Every completed step is appended (and fsynced) as it finishes:
+#   org          → org created (org_id, org_name, sequence)
+#   destroy      → previous org cleaned up
+#   network_created, devices (with the named devices), one line per
+#   setup_network section, and network (fully done, summary + state saved)
+#   org_done     → every network of the org deployed
+#
+# `python main.py deploy --resume` reads the last org that has no `org_done`
+# and continues from there, reusing its org and network IDs.
+
+JOURNAL_DIR = "state/journal"
+# setup_network sections, in order; each maps to its do_<section> flag
+NETWORK_SECTIONS = ("vlans", "ports", "static_routes", "firewall", "vpn", "wireless")
+
+_lock = threading.Lock()
+
+
+def get_journal_file(project_slug):
+    return Path(f"{JOURNAL_DIR}/{project_slug}.jsonl")
+
+
+class DeploymentJournal:
+    """Appends steps for one org of one project; safe to share between threads."""
+
+    def __init__(self, project_slug, org_id=None, org_name=None):
+        self.path = get_journal_file(project_slug)
+        self.run = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.org_id = org_id
+        self.org_name = org_name
+
+    def record(self, step, network=None, **data):
+        entry = {"ts": datetime.now().isoformat(timespec="seconds"), "run": self.run, "step": step,
+                 "org_id": self.org_id, **({"network": network} if network else {}), **data}
+        with _lock:
+            os.makedirs(self.path.parent, exist_ok=True)
+            append_jsonl(self.path, entry, fsync=True)  # ends a torn line left by a crash first
+
+    def section_recorder(self, network):
+        """Callback for setup_network(on_section_done=...)."""
+        return lambda section: self.record(section, network=network)
+
+
+def load_checkpoint(project_slug):
+    """
+    Return the last unfinished org for the project, or None:
+    {"org_id", "org_name", "sequence", "destroyed", "networks": {slug: {"network_id", "network_name", "steps", "devices"}}}
+    """
+    path = get_journal_file(project_slug)
+    if not path.exists():
+        return None
+
+    checkpoint = None
+    for entry in read_jsonl(path):  # torn lines from a crash mid-write are skipped
+        step = entry.get("step")
+        if step == "org":
+            checkpoint = {"org_id": entry["org_id"], "org_name": entry["org_name"],
+                          "sequence": entry["sequence"], "destroyed": False, "networks": {}}
+            continue
+        if checkpoint is None or entry.get("org_id") != checkpoint["org_id"]:
+            continue
+        if step == "org_done":
+            checkpoint = None
+        elif step == "destroy":
+            checkpoint["destroyed"] = True
+        elif entry.get("network"):
+            network = checkpoint["networks"].setdefault(entry["network"], {"steps": []})
+            network["steps"].append(step)
+            for key in ("network_id", "network_name", "devices"):
+                if key in entry:
+                    network[key] = entry[key]
+    return checkpoint
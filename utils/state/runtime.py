@@ -1,51 +1,220 @@
 import os
 import json
+import sqlite3
+import threading
+from datetime import datetime
 from pathlib import Path
 
+# ┌─────────────────────────────────────────────────────────────────────────────┐
+# │ 🗃️ Runtime state                                                            │
+# └─────────────────────────────────────────────────────────────────────────────┘
+# Org and network IDs created by deploy, keyed by project slug, in one SQLite
+# database (WAL mode): state/runtime.db
+#
+# Every write is a single transaction, so a crash never leaves a half-written
+# file, and updating one network is one row upsert no matter how many networks
+# the project has. Threads each get their own connection, kept in one registry
+# so close_runtime_store() closes them all; other processes (drift, a second
+# deploy) read consistent snapshots while deploy writes.
+#
+# Read API, shared by config_resolver.py and main.py:
+#   load_runtime_state(project)   → {"project_slug", "org": {...}, "networks": {slug: {...}}}
+#   load_runtime_snapshot()       → {"projects": {project: <same as above>}}
+#   get_org_id / get_network_id_by_slug
+#
+# Legacy state/runtime/<project>.json files are imported once, the first time
+# their project is read and has nothing in the database.
+
+RUNTIME_DB = "state/runtime.db"
+LEGACY_DIR = "state/runtime"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orgs (
+    project    TEXT PRIMARY KEY,
+    org_id     TEXT,
+    org_name   TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS networks (
+    project      TEXT NOT NULL,
+    slug         TEXT NOT NULL,
+    network_id   TEXT,
+    network_name TEXT,
+    updated_at   TEXT,
+    PRIMARY KEY (project, slug)
+);
+"""
+
+_connections = {}  # (thread ident, absolute db path) → connection
+_connections_lock = threading.Lock()
+
+
 def get_runtime_state_file(project_slug):
-    return Path(f"state/runtime/{project_slug}.json")
+    """Legacy per-project JSON file (read once for migration)."""
+    return Path(f"{LEGACY_DIR}/{project_slug}.json")
+
+
+def _connect(path=RUNTIME_DB):
+    path = os.path.abspath(path)
+    key = (threading.get_ident(), path)
+    conn = _connections.get(key)
+    if conn is None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Only the owning thread uses it; check_same_thread=False lets close_runtime_store() close it
+        conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        with _connections_lock:
+            _connections[key] = conn
+    return conn
+
+
+class _transaction:
+    """BEGIN … COMMIT/ROLLBACK on the calling thread's connection (IMMEDIATE takes the write lock up front)."""
+
+    def __init__(self, path=RUNTIME_DB, mode="IMMEDIATE"):
+        self.conn = _connect(path)
+        self.mode = mode
+
+    def __enter__(self):
+        self.conn.execute(f"BEGIN {self.mode}")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _upsert_org(conn, project_slug, org_id, org_name):
+    previous = conn.execute("SELECT org_id FROM orgs WHERE project = ?", (project_slug,)).fetchone()
+    if previous and previous[0] != org_id:
+        # 🆕 New org for the project: the old org's network IDs no longer apply
+        conn.execute("DELETE FROM networks WHERE project = ?", (project_slug,))
+    conn.execute(
+        "INSERT INTO orgs (project, org_id, org_name, updated_at) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(project) DO UPDATE SET org_id = excluded.org_id, org_name = excluded.org_name, "
+        "updated_at = excluded.updated_at",
+        (project_slug, org_id, org_name, _now()),
+    )
+
 
-def save_runtime_state(project_slug, org_id, org_name, networks: dict):
+def _upsert_network(conn, project_slug, slug, network_id, network_name):
+    conn.execute(
+        "INSERT INTO networks (project, slug, network_id, network_name, updated_at) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(project, slug) DO UPDATE SET network_id = excluded.network_id, "
+        "network_name = excluded.network_name, updated_at = excluded.updated_at",
+        (project_slug, slug, network_id, network_name, _now()),
+    )
+
+
+def record_runtime_org(project_slug, org_id, org_name, path=RUNTIME_DB):
+    """Set the project's current org (clears network IDs when the org changes)."""
+    with _transaction(path) as conn:
+        _upsert_org(conn, project_slug, org_id, org_name)
+
+
+def record_runtime_network(project_slug, slug, network_id, network_name, path=RUNTIME_DB):
+    """Insert or update one network's IDs — O(1), safe from any thread or process."""
+    with _transaction(path) as conn:
+        _upsert_network(conn, project_slug, slug, network_id, network_name)
+
+
+def save_runtime_state(project_slug, org_id, org_name, networks: dict, path=RUNTIME_DB):
     """
-    Overwrites the runtime state file with the current run's deployment values.
-    Supports one project/org per run with multiple named networks.
+    Replace the project's runtime state in one transaction.
     `networks` should be a dict where key = network slug, value = dict with id & name.
     """
-    runtime_file = get_runtime_state_file(project_slug)
-    os.makedirs(runtime_file.parent, exist_ok=True)
+    with _transaction(path) as conn:
+        _upsert_org(conn, project_slug, org_id, org_name)
+        conn.execute("DELETE FROM networks WHERE project = ?", (project_slug,))
+        for slug, network in networks.items():
+            _upsert_network(conn, project_slug, slug, network.get("network_id"), network.get("network_name"))
+
+
+def _import_legacy(project_slug, path):
+    legacy = get_runtime_state_file(project_slug)
+    if not legacy.exists():
+        # Older runs named the file after the project name ("Percy Street.json")
+        matches = [f for f in Path(LEGACY_DIR).glob("*.json") if f.stem.lower().replace(" ", "_") == project_slug]
+        if not matches:
+            return False
+        legacy = matches[0]
+    try:
+        with open(legacy, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return False
+    org = data.get("org", {})
+    save_runtime_state(project_slug, org.get("org_id"), org.get("org_name"), data.get("networks", {}), path)
+    return True
+
 
-    runtime_data = {
-        "project_slug": project_slug,
-        "org": {
-            "org_id": org_id,
-            "org_name": org_name
-        },
-        "networks": networks
-    }
+def _read(conn, project_slug=None):
+    where, args = ("WHERE project = ?", (project_slug,)) if project_slug else ("", ())
+    projects = {}
+    for project, org_id, org_name in conn.execute(f"SELECT project, org_id, org_name FROM orgs {where}", args):
+        projects[project] = {"project_slug": project, "org": {"org_id": org_id, "org_name": org_name}, "networks": {}}
+    for project, slug, network_id, network_name in conn.execute(
+            f"SELECT project, slug, network_id, network_name FROM networks {where} ORDER BY rowid", args):
+        state = projects.setdefault(project, {"project_slug": project, "org": {"org_id": None, "org_name": None},
+                                              "networks": {}})
+        state["networks"][slug] = {"network_id": network_id, "network_name": network_name}
+    return projects
 
-    with open(runtime_file, "w") as f:
-        json.dump(runtime_data, f, indent=2)
 
-def load_runtime_state(project_slug) -> dict:
+def load_runtime_state(project_slug, path=RUNTIME_DB) -> dict:
     """
-    Returns the current runtime state for the given project if the file exists.
+    Returns the current runtime state for the given project, or {} if nothing was deployed.
     """
-    runtime_file = get_runtime_state_file(project_slug)
-    if runtime_file.exists():
-        with open(runtime_file, "r") as f:
-            return json.load(f)
-    return {}
+    conn = _connect(path)
+    state = _read(conn, project_slug).get(project_slug)
+    if state is None and _import_legacy(project_slug, path):
+        state = _read(conn, project_slug).get(project_slug)
+    return state or {}
 
-def get_org_id(project_slug) -> str | None:
+
+def load_runtime_snapshot(path=RUNTIME_DB) -> dict:
+    """Every project's runtime state, as runtime_view() shapes it (empty if nothing was deployed yet)."""
+    if not os.path.exists(path):
+        return runtime_view({})  # 💤 offline commands never create the database
+    with _transaction(path, mode="DEFERRED") as conn:  # one consistent read across both tables
+        return runtime_view(_read(conn))
+
+
+def runtime_view(projects: dict) -> dict:
+    """{project: state} → {"projects": {project: {"org": ..., "networks": {slug: {"network_id": ...}}}}}"""
+    return {"projects": {
+        project: {"org": state.get("org", {}), "networks": dict(state.get("networks", {}))}
+        for project, state in projects.items()
+    }}
+
+
+def get_org_id(project_slug, path=RUNTIME_DB) -> str | None:
     """
     Returns the org_id from the runtime state.
     """
-    state = load_runtime_state(project_slug)
-    return state.get("org", {}).get("org_id")
+    row = _connect(path).execute("SELECT org_id FROM orgs WHERE project = ?", (project_slug,)).fetchone()
+    return row[0] if row else load_runtime_state(project_slug, path).get("org", {}).get("org_id")
+
 
-def get_network_id_by_slug(project_slug, slug: str) -> str | None:
+def get_network_id_by_slug(project_slug, slug: str, path=RUNTIME_DB) -> str | None:
     """
     Returns the network_id for the given network slug from the runtime state.
     """
-    state = load_runtime_state(project_slug)
-    return state.get("networks", {}).get(slug, {}).get("network_id")
+    row = _connect(path).execute(
+        "SELECT network_id FROM networks WHERE project = ? AND slug = ?", (project_slug, slug)).fetchone()
+    return row[0] if row else load_runtime_state(project_slug, path).get("networks", {}).get(slug, {}).get("network_id")
+
+
+def close_runtime_store():
+    """Close every thread's connections (tests, end of run) — once no other thread is using the store."""
+    with _connections_lock:
+        connections = list(_connections.values())
+        _connections.clear()
+    for conn in connections:
+        conn.close()
@@ -0,0 +1,58 @@
+# tests/auth/test_session_factory.py
+
+import pytest
+from meraki_sdk import auth
+
+@pytest.fixture(autouse=True)
+def fresh_sessions(monkeypatch):
+    monkeypatch.setenv("MERAKI_API_KEY", "0" * 40)
+    auth.close_dashboard_sessions()
+    yield
+    auth.close_dashboard_sessions()
+
+@pytest.fixture
+def built_clients(monkeypatch):
+    import httpx
+
+    built = []
+    class RecordingClient(httpx.Client):
+        def __init__(self, **kwargs):
+            built.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "Client", RecordingClient)
+    return built
+
+def test_sessions_are_shared_per_org():
+    first = auth.get_dashboard_session(org="Lab", suppress_logging=True)
+    assert auth.get_dashboard_session(org="Lab", suppress_logging=True) is first
+    assert auth.get_dashboard_session(org="Prod", suppress_logging=True) is not first
+
+def test_different_options_get_their_own_session():
+    first = auth.get_dashboard_session(org="Lab", suppress_logging=True)
+    tuned = auth.get_dashboard_session(org="Lab", suppress_logging=True, workers=4)
+    assert tuned is not first
+    assert auth.get_dashboard_session(org="Lab", suppress_logging=True, workers=4) is tuned
+
+def test_connection_pool_matches_workers(tmp_path, built_clients):
+    dashboard = auth.build_dashboard_session(workers=6, suppress_logging=True, log_path=str(tmp_path / "logs"))
+    limits = built_clients[-1]["limits"]
+    assert (limits.max_connections, limits.max_keepalive_connections) == (6, 6)
+    assert dashboard._session._client.headers["Authorization"].endswith("0" * 40)
+    assert not (tmp_path / "logs").exists()
+
+def test_pool_sizing_keeps_tls_and_proxy_settings(built_clients):
+    import ssl
+    import warnings
+
+    import certifi
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)  # no verify=<str>
+        dashboard = auth.build_dashboard_session(workers=4, suppress_logging=True, certificate_path=certifi.where(),
+                                                requests_proxy="http://proxy.internal:3128")
+    kwargs = built_clients[-1]
+    assert kwargs["limits"].max_connections == 4
+    assert kwargs["proxy"] == "http://proxy.internal:3128"
+    assert isinstance(kwargs["verify"], ssl.SSLContext)
+    assert dashboard._session._client.headers["Authorization"].endswith("0" * 40)
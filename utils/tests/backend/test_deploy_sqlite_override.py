@@ -0,0 +1,56 @@
+# tests/backend/test_deploy_sqlite_override.py
+
+import pytest
+import yaml
+
+import main
+from backend import router
+from backend.sqlite_backend import SQLiteBackend
+from backend.sqlite_import import import_config_tree
+from benchmarks.fake_dashboard import start_fake_dashboard
+from benchmarks.synthetic_config import generate_config_tree
+from meraki_sdk import auth
+from utils.state import runtime
+
+@pytest.fixture
+def sqlite_lab(tmp_path, monkeypatch):
+    config_dir = tmp_path / "config"
+    generate_config_tree(config_dir, networks=2, vlans=3, firewall_rules=2, devices_per_network=2)
+    with open(config_dir / "defaults.yaml") as f:
+        defaults = yaml.safe_load(f)
+    defaults["backend_providers"] = {"default": "local", "overrides": {"devices": "sqlite", "fixed_assignments": "sqlite"}}
+    with open(config_dir / "defaults.yaml", "w") as f:
+        yaml.safe_dump(defaults, f, sort_keys=False)
+    with open(config_dir / "devices" / "devices.yaml") as f:
+        groups = yaml.safe_load(f)["groups"]
+
+    import_config_tree(config_dir, tmp_path / "state" / "backend.sqlite3")
+    # 🗑️ Only the SQLite database can answer device and fixed-assignment lookups now
+    (config_dir / "devices" / "devices.yaml").unlink()
+    (config_dir / "projects" / "bench_project_0000" / "fixed_ip_assignments.yaml").unlink()
+
+    server = start_fake_dashboard(devices={d["serial"]: {"model": d["model"]} for g in groups for d in g["devices"]})
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MERAKI_API_KEY", "0" * 40)
+    monkeypatch.setenv("MERAKI_BASE_URL", server.url)
+    monkeypatch.setattr("utils.logging.summary.log_deployment_summary", lambda *a, **k: None)
+    router.reset_providers()
+    yield server
+    router.reset_providers()
+    runtime.close_runtime_store()
+    auth.close_dashboard_sessions()
+    server.shutdown()
+    server.server_close()
+
+def test_deploy_reads_devices_and_fixed_ips_from_sqlite(sqlite_lab, monkeypatch):
+    calls = []
+    for name in ("get_devices_for_tag", "get_network_fixed_assignments", "iter_device_groups", "get_fixed_assignments"):
+        real = getattr(SQLiteBackend, name)
+        monkeypatch.setattr(SQLiteBackend, name, lambda self, *a, _name=name, _real=real: calls.append(_name) or _real(self, *a))
+
+    assert main.main(["deploy"]) == 0
+
+    assert calls.count("get_devices_for_tag") == 2 and calls.count("get_network_fixed_assignments") == 2
+    assert "iter_device_groups" not in calls and "get_fixed_assignments" not in calls
+    assert len(sqlite_lab.state.networks) == 2
+    assert sqlite_lab.requests["POST /networks/{id}/devices/claim"] == 4
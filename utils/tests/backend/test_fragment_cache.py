@@ -0,0 +1,21 @@
+# tests/backend/test_fragment_cache.py
+
+import pytest
+from backend.cache import FragmentCache
+from backend.local_yaml_backend import LocalYAMLBackend
+
+def test_fragment_is_parsed_once_and_copied(tmp_path):
+    (tmp_path / "fw.yaml").write_text("outbound_rules:\n  - comment: a\n")
+    backend = LocalYAMLBackend(config_dir=tmp_path, cache=FragmentCache())
+
+    first = backend.get_fragment("fw.yaml")
+    first["outbound_rules"].append({"comment": "mutated"})
+    (tmp_path / "fw.yaml").write_text("outbound_rules: []\n")
+
+    assert backend.get_fragment("fw.yaml") == {"outbound_rules": [{"comment": "a"}]}
+
+def test_missing_fragment_raises_file_not_found(tmp_path):
+    backend = LocalYAMLBackend(config_dir=tmp_path, cache=FragmentCache())
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError):
+            backend.get_fragment("projects/none/ports/mx_ports.yaml")
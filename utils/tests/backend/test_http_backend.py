@@ -0,0 +1,43 @@
+# tests/backend/test_http_backend.py
+
+from pathlib import Path
+import pytest
+from backend.cache import FragmentCache
+from backend.http_backend import HTTPBackend
+from backend.http_standin import start_standin_server
+from backend.local_yaml_backend import LocalYAMLBackend
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "config"
+
+@pytest.fixture
+def server():
+    server = start_standin_server(CONFIG_DIR, page_size=1)
+    yield server
+    server.shutdown()
+
+def test_fragments_and_paginated_devices_match_local(server, tmp_path):
+    backend = HTTPBackend(server.url, cache_dir=tmp_path, cache=FragmentCache())
+    local = LocalYAMLBackend(CONFIG_DIR)
+    assert backend.get_manifest() == local.get_manifest()
+    assert backend.get_devices() == local.get_devices()
+    assert server.requests.count("/devices") == len(local.get_devices()["groups"])
+    with pytest.raises(FileNotFoundError):
+        backend.get_fragment("projects/nope/vpn/mx_autovpn.yaml")
+    backend.close()
+
+def test_prefetch_is_concurrent_and_revalidates_with_etags(server, tmp_path):
+    paths = ["defaults.yaml", "manifest.yaml", "common/vlans/mx_vlans.yaml", "missing.yaml"]
+    first = HTTPBackend(server.url, cache_dir=tmp_path, cache=FragmentCache()).prefetch(paths)
+    assert set(first) == set(paths[:3])
+
+    # 🆕 Fresh process-level cache, same on-disk ETag cache → 304s, same content
+    second = HTTPBackend(server.url, cache_dir=tmp_path, cache=FragmentCache())
+    responses = []
+    get = second.session.get
+    def recording_get(*args, **kwargs):
+        responses.append(get(*args, **kwargs))
+        return responses[-1]
+    second.session.get = recording_get
+
+    assert second.prefetch(paths) == first
+    assert sorted(r.status_code for r in responses) == [304, 304, 304, 404]
@@ -0,0 +1,49 @@
+# tests/backend/test_prefetch.py
+
+import threading
+import time
+from pathlib import Path
+from backend.cache import FragmentCache
+from backend.local_yaml_backend import LocalYAMLBackend
+from backend.prefetch import PREFETCH_WORKERS
+from config_resolver import plan_prefetch, resolve_project_configs
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "config"
+LATENCY = 0.1
+
+class SlowBackend(LocalYAMLBackend):
+    """Local YAML with a fixed per-file latency, standing in for a remote source of truth."""
+
+    def __init__(self):
+        super().__init__(CONFIG_DIR, cache=FragmentCache())
+        self.reads = 0
+        self.in_flight = self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def _read_yaml(self, file_path):
+        with self.lock:
+            self.reads += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(LATENCY)
+            return super()._read_yaml(file_path)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+def test_plan_covers_project_and_network_overrides():
+    backend = LocalYAMLBackend(CONFIG_DIR, cache=FragmentCache())
+    plan = plan_prefetch(backend.get_manifest(), lambda resource: backend)
+    reads = {(method, args) for _, method, args in plan}
+    assert ("get_fixed_assignments", ("percy_street",)) in reads
+    assert ("get_fragment", ("projects/percy_street/firewall/mx_firewall.yaml",)) in reads
+    assert len(reads) == len(plan)
+
+def test_resolve_fetches_overlap():
+    backend = SlowBackend()
+    resolve_project_configs(backend=backend)
+
+    # defaults + manifest are read up front; everything else overlaps (no wall-clock assertion)
+    assert backend.reads > 8
+    assert 1 < backend.max_in_flight <= PREFETCH_WORKERS
@@ -0,0 +1,46 @@
+# tests/backend/test_router.py
+
+import pytest
+from backend import router
+
+@pytest.fixture(autouse=True)
+def fresh_router():
+    router.reset_providers()
+    yield
+    router.reset_providers()
+
+def test_only_selected_providers_are_constructed_and_reused():
+    defaults = {"backend_providers": {"default": "local", "overrides": {"devices": "sqlite"}}}
+    first = router.get_backend_for("vlans", defaults)
+    assert router.get_backend_for("manifest", defaults) is first
+    assert set(router._instances) == {"local"}
+
+    devices = router.get_backend_for("devices", defaults)
+    assert type(devices).__name__ == "SQLiteBackend"
+    assert set(router._instances) == {"local", "sqlite"}
+
+def test_unknown_provider_is_reported():
+    with pytest.raises(ValueError, match="netbox"):
+        router.get_backend_for("devices", {"backend_providers": {"default": "netbox"}})
+
+def test_entry_point_providers_are_discovered(monkeypatch):
+    class FakeEntryPoint:
+        name = "fake"
+        def load(self):
+            return dict
+    monkeypatch.setattr(router, "entry_points", lambda group: [FakeEntryPoint()] if group == router.ENTRY_POINT_GROUP else [])
+    assert router.get_provider("fake") == {}
+    assert router.get_provider("fake") is router.get_provider("fake")
+
+def test_cli_never_imports_unselected_providers(monkeypatch, capsys):
+    import sys
+    from pathlib import Path
+    import main
+
+    for name in ("backend.sqlite_backend", "backend.http_backend"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    monkeypatch.chdir(Path(router.__file__).resolve().parents[1])
+
+    assert main.main(["plan"]) == 0
+    assert "backend.sqlite_backend" not in sys.modules and "backend.http_backend" not in sys.modules
+    assert set(router._instances) == {"local"}
@@ -0,0 +1,33 @@
+# tests/backend/test_sqlite_backend.py
+
+import json
+from pathlib import Path
+from backend.local_yaml_backend import LocalYAMLBackend
+from backend.sqlite_backend import SQLiteBackend
+from backend.sqlite_import import import_config_tree
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "config"
+
+def test_import_round_trips_the_config_tree(tmp_path):
+    db_path = tmp_path / "backend.sqlite3"
+    counts = import_config_tree(CONFIG_DIR, db_path)
+    assert counts["devices"] > 0 and counts["fixed_assignments"] > 0
+
+    local, sqlite = LocalYAMLBackend(CONFIG_DIR), SQLiteBackend(db_path)
+    assert sqlite.get_devices() == local.get_devices()
+    assert sqlite.get_manifest() == local.get_manifest()
+    assert sqlite.get_fixed_assignments("percy_street") == local.get_fixed_assignments("percy_street")
+    assert sqlite.get_fragment("projects/percy_street/ports/mx_ports.yaml") == local.get_mx_ports_project("percy_street")
+
+def test_indexed_lookups(tmp_path):
+    db_path = tmp_path / "backend.sqlite3"
+    import_config_tree(CONFIG_DIR, db_path)
+    sqlite = SQLiteBackend(db_path)
+
+    groups = LocalYAMLBackend(CONFIG_DIR).get_devices()["groups"]
+    group = groups[0]
+    tagged = sqlite.get_devices_for_tag(group["tag"].replace("-", "_"))
+    assert [d["serial"] for d in tagged][:len(group["devices"])] == [d["serial"] for d in group["devices"]]
+    assert group["tag"] in sqlite.get_device(group["devices"][0]["serial"])["tags"]
+    assert sqlite.get_device("NOT-A-SERIAL") is None
+    assert "Internal" in sqlite.get_network_fixed_assignments("percy_street", "studio_hub")
@@ -0,0 +1,34 @@
+# tests/backend/test_yaml_stream.py
+
+import io
+import yaml
+from backend.yaml_stream import iter_sequence
+from models import DeviceInventory
+
+DOC = """
+meta:
+  owner: lab
+  notes: [a, {b: c}]
+groups:
+  - tag: hub
+    devices:
+      - &mx {serial: Q2NY-0001, type: MX}
+      - serial: Q2NY-0002
+        type: MS
+        tags: [access_switch]
+  - tag: spoke
+    devices:
+      - *mx
+trailer: true
+"""
+
+def test_stream_matches_safe_load():
+    expected = yaml.safe_load(DOC)["groups"]
+    assert list(iter_sequence(io.StringIO(DOC), "groups")) == expected
+
+def test_stream_feeds_inventory_and_handles_missing_key():
+    inventory = DeviceInventory.from_groups(iter_sequence(io.StringIO(DOC), "groups"))
+    assert [d["serial"] for d in inventory.for_tag("access-switch")] == ["Q2NY-0002"]
+    assert len(inventory.for_tag("spoke")) == 1
+    assert list(iter_sequence(io.StringIO("other: 1\n"), "groups")) == []
+    assert list(iter_sequence(io.StringIO(""), "groups")) == []
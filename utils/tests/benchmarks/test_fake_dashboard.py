@@ -0,0 +1,36 @@
+# tests/benchmarks/test_fake_dashboard.py
+
+from meraki import DashboardAPI
+
+from benchmarks import deploy_e2e
+from benchmarks.fake_dashboard import endpoint_template, start_fake_dashboard
+
+def test_sdk_round_trips_against_fake_dashboard_with_429s():
+    server = start_fake_dashboard(rate_429=0.3, devices={"Q2BN-00000-000": {"model": "MX68"}}, seed=1)
+    try:
+        dashboard = DashboardAPI("0" * 40, base_url=server.url, suppress_logging=True,
+                                 nginx_429_retry_wait_time=0, maximum_retries=20)
+        org = dashboard.organizations.createOrganization(name="Bench")
+        net = dashboard.organizations.createOrganizationNetwork(org["id"], name="n1", productTypes=["appliance"])
+        dashboard.networks.claimNetworkDevices(net["id"], serials=["Q2BN-00000-000"])
+        dashboard.appliance.createNetworkApplianceVlan(net["id"], id="10", name="MGMT")
+        dashboard.appliance.updateNetworkApplianceVlan(net["id"], "10", subnet="10.0.10.0/24")
+
+        assert dashboard.networks.getNetworkDevices(net["id"])[0]["model"] == "MX68"
+        assert dashboard.appliance.getNetworkApplianceVlan(net["id"], "10")["subnet"] == "10.0.10.0/24"
+        assert server.rate_limited > 0
+        assert server.requests["PUT /networks/{id}/appliance/vlans/{id}"] >= 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_endpoint_template_collapses_ids():
+    assert endpoint_template("GET", "/networks/L_000002/appliance/vlans/10") == "GET /networks/{id}/appliance/vlans/{id}"
+    assert endpoint_template("PUT", "/devices/Q2BN-00001-002") == "PUT /devices/{id}"
+
+def test_full_deploy_against_fake_dashboard():
+    result = deploy_e2e.run_deploy(1, timeout=300)
+
+    assert result["status"] == "ok", result.get("error")
+    assert result["top_endpoints"]["POST /networks/{id}/devices/claim"] == 4
+    assert result["calls_per_network"] > 10
@@ -0,0 +1,7 @@
+# tests/benchmarks/test_model_memory.py
+
+from benchmarks.model_memory import run
+
+def test_records_hold_less_memory_than_dicts():
+    results = run(networks=20, vlans=10, rules=20)
+    assert 0 < results["records"]["bytes"] < results["dicts"]["bytes"]
@@ -0,0 +1,27 @@
+# tests/benchmarks/test_scale_suite.py
+
+from backend.local_yaml_backend import LocalYAMLBackend
+from benchmarks import scale
+from benchmarks.synthetic_config import generate_config_tree
+from config_resolver import resolve_project_configs
+
+def test_synthetic_tree_resolves(tmp_path):
+    summary = generate_config_tree(tmp_path / "config", networks=7, networks_per_project=3, vlans=3, firewall_rules=5)
+    result = resolve_project_configs(backend=LocalYAMLBackend(tmp_path / "config"))
+
+    assert summary["projects"] == 3
+    assert len(result["resolved_networks"]) == 7
+    assert len(result["inventory"]) == summary["devices"]
+    first = result["resolved_networks"][0]["network_config"]
+    assert [v.id for v in first["vlans"]] == [10, 20, 30]
+    assert len(first["firewall"]["outbound_rules"]) == 5
+
+def test_suite_records_results_and_flags_regressions():
+    report = scale.run_suite(sizes=[5], log=lambda line: None)
+    assert {r["5"]["status"] for r in report["results"].values()} == {"ok"}
+
+    slower = {"results": {"resolve": {"5": {**report["results"]["resolve"]["5"], "seconds": 99.0}}}}
+    assert scale.compare(report, report) == []
+    assert scale.compare(slower, report) and "resolve@5: seconds" in scale.compare(slower, report)[0]
+    timed_out = {"results": {"ipam": {"5": {"status": "timeout"}}}}
+    assert scale.compare(timed_out, report) == [f"ipam@5: timeout (baseline {report['results']['ipam']['5']['seconds']}s)"]
@@ -0,0 +1,78 @@
+# tests/cassette/test_cassette_replay.py
+
+import pytest
+from benchmarks.fake_dashboard import start_fake_dashboard
+from meraki_sdk import auth, cassette
+
+@pytest.fixture(autouse=True)
+def no_cassette(monkeypatch):
+    monkeypatch.delenv("MERAKI_API_KEY", raising=False)
+    yield
+    cassette.disable_cassette()
+
+def _deploy(dashboard, networks):
+    org = dashboard.organizations.createOrganization(name="Bench")
+    ids = []
+    for name in networks:
+        net = dashboard.organizations.createOrganizationNetwork(org["id"], name=name, productTypes=["appliance"])
+        dashboard.appliance.createNetworkApplianceVlan(net["id"], id="10", name=f"MGMT {name}")
+        ids.append(net["id"])
+    return ids
+
+def test_record_then_replay_without_the_api(tmp_path):
+    path = str(tmp_path / "run.jsonl.gz")
+    server = start_fake_dashboard(rate_429=0.2, seed=3)
+    try:
+        cassette.enable_recording(path)
+        live = auth.build_dashboard_session(api_key="0" * 40, base_url=server.url, suppress_logging=True,
+                                            nginx_429_retry_wait_time=0, maximum_retries=20)
+        recorded_ids = _deploy(live, ["a", "b"])
+        cassette.disable_cassette()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    _, interactions = cassette.load_cassette(path)
+    assert any(e["status"] == 429 for e in interactions)
+    assert all("X-Cisco-Meraki-API-Key" not in str(e) for e in interactions)
+
+    # Server is gone: every response now comes from the cassette
+    cassette.enable_replay(path, speed=0)
+    replayed = auth.build_dashboard_session(base_url=server.url, suppress_logging=True,
+                                            nginx_429_retry_wait_time=0, maximum_retries=20)
+    assert _deploy(replayed, ["a", "b"]) == recorded_ids
+    player = cassette._state["player"]
+    assert (player.remaining, player.misses) == (0, 0)
+
+def test_compare_writes_allows_interleaving_but_not_changes(tmp_path):
+    def record(name, networks, vlan_name=None):
+        path = str(tmp_path / name)
+        server = start_fake_dashboard()
+        cassette.enable_recording(path)
+        dashboard = auth.build_dashboard_session(api_key="0" * 40, base_url=server.url, suppress_logging=True)
+        org = dashboard.organizations.createOrganization(name="Bench")
+        nets = {n: dashboard.organizations.createOrganizationNetwork(org["id"], name=n, productTypes=["appliance"])["id"]
+                for n in ("a", "b")}
+        for n in networks:
+            dashboard.appliance.createNetworkApplianceVlan(nets[n], id="10", name=vlan_name or n)
+            dashboard.appliance.updateNetworkApplianceVlan(nets[n], "10", subnet="10.0.10.0/24")
+        cassette.disable_cassette()
+        server.shutdown()
+        server.server_close()
+        return path
+
+    sequential = record("seq.jsonl.gz", ["a", "b"])
+    interleaved = record("rev.jsonl.gz", ["b", "a"])
+    renamed = record("ren.jsonl.gz", ["a", "b"], vlan_name="x")
+
+    assert cassette.compare_writes(sequential, interleaved) == []
+    diffs = cassette.compare_writes(sequential, renamed)
+    assert len(diffs) == 2 and '"name":"x"' in diffs[0]
+
+def test_replay_speed_defaults_to_recorded_pace():
+    import main
+
+    parser = main.build_parser()
+    assert parser.parse_args(["deploy", "--replay", "x.jsonl.gz"]).replay_speed == 1.0
+    assert parser.parse_args(["--replay-speed", "0", "deploy"]).replay_speed == 0.0
+    assert parser.parse_args(["deploy", "--replay-speed", "0.5"]).replay_speed == 0.5
@@ -0,0 +1,68 @@
+# tests/cleanup/test_bulk_destroy.py
+
+import threading
+import time
+from types import SimpleNamespace
+
+from meraki_sdk.cleanup import destroy_org_networks
+from meraki_sdk.rate_governor import RateGovernor
+
+class FakeDashboard:
+    """50 networks with 2 devices each; every call takes `latency` seconds."""
+    def __init__(self, networks=50, latency=0.02):
+        self.latency = latency
+        self.calls = []
+        self.lock = threading.Lock()
+        self.in_flight = self.max_in_flight = 0
+        self.nets = [{"id": f"N_{i}", "name": f"Net {i}"} for i in range(networks)]
+        self.inventory = [{"serial": f"Q-{i}-{d}", "networkId": f"N_{i}"} for i in range(networks) for d in range(2)]
+        self.organizations = SimpleNamespace(
+            getOrganizationNetworks=self._api("getOrganizationNetworks", lambda *a, **kw: self.nets),
+            getOrganizationInventoryDevices=self._api("getOrganizationInventoryDevices", lambda *a, **kw: self.inventory),
+        )
+        self.networks = SimpleNamespace(
+            removeNetworkDevices=self._api("removeNetworkDevices"),
+            deleteNetwork=self._api("deleteNetwork"),
+        )
+        self.devices = SimpleNamespace(getDevice=self._api("getDevice"))
+
+    def _api(self, name, result=lambda *a, **kw: None):
+        def call(*args, **kwargs):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            time.sleep(self.latency)
+            with self.lock:
+                self.in_flight -= 1
+                self.calls.append((name, args))
+            return result(*args, **kwargs)
+        return call
+
+def test_bulk_destroy_uses_one_snapshot_and_runs_concurrently():
+    dashboard = FakeDashboard()
+    results = destroy_org_networks(dashboard, "O_1", workers=10, governor=RateGovernor(rate=10_000, burst=100))
+
+    names = [name for name, _ in dashboard.calls]
+    assert all(r["deleted"] for r in results) and len(results) == 50
+    assert [r["network"] for r in results] == sorted(f"Net {i}" for i in range(50))
+    assert names.count("getOrganizationInventoryDevices") == 1
+    assert names.count("getDevice") == 0
+    assert names.count("removeNetworkDevices") == 100  # one serial per call is all the API takes
+    assert names.count("deleteNetwork") == 50
+    # 🧹 every device is gone before the first network is deleted
+    assert max(i for i, n in enumerate(names) if n == "removeNetworkDevices") < names.index("deleteNetwork")
+    # calls overlap up to the worker count (no wall-clock assertion)
+    assert 1 < dashboard.max_in_flight <= 10
+
+def test_rate_governor_paces_calls():
+    now = [0.0]
+    sleeps = []
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+    governor = RateGovernor(rate=10, burst=2, clock=lambda: now[0], sleep=sleep)
+
+    for _ in range(12):
+        governor.acquire()
+    # 2 from the burst, then 10 more at 10/s
+    assert abs(now[0] - 1.0) < 1e-6
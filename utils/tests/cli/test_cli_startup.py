@@ -0,0 +1,33 @@
+# tests/cli/test_cli_startup.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+HEAVY = {"meraki", "coloredlogs", "dotenv"}
+
+def _importtime(code):
+    """Run `code` under `python -X importtime` and return {module: cumulative µs}."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    modules = {}
+    for line in out.stderr.splitlines():
+        parts = line.split("|")
+        if not line.startswith("import time:") or len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        modules[parts[2].strip()] = int(parts[1])
+    return modules
+
+def test_cli_import_skips_heavy_modules_and_stays_within_budget():
+    cli = _importtime("import main")
+    assert not HEAVY & set(cli)
+    # 💤 Budget: loading the CLI costs a fraction of loading the Dashboard SDK alone
+    assert cli["main"] < _importtime("import meraki")["meraki"] / 3
+
+def test_offline_commands_never_import_the_dashboard_sdk():
+    modules = _importtime("import main; main.main(['plan'])")
+    assert "config_resolver" in modules
+    assert not HEAVY & set(modules)
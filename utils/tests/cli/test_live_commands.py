@@ -0,0 +1,50 @@
+# tests/cli/test_live_commands.py
+
+import pytest
+import yaml
+
+import main
+from benchmarks.fake_dashboard import start_fake_dashboard
+from benchmarks.synthetic_config import generate_config_tree
+from meraki_sdk import auth
+from utils.logging.metrics import API_CALLS
+from utils.state import runtime
+
+@pytest.fixture
+def lab(tmp_path, monkeypatch):
+    generate_config_tree(tmp_path / "config", networks=2, vlans=3, firewall_rules=2, devices_per_network=2)
+    with open(tmp_path / "config" / "devices" / "devices.yaml") as f:
+        groups = yaml.safe_load(f)["groups"]
+    server = start_fake_dashboard(devices={d["serial"]: {"model": d["model"]} for g in groups for d in g["devices"]})
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MERAKI_API_KEY", "0" * 40)
+    monkeypatch.setenv("MERAKI_BASE_URL", server.url)
+    monkeypatch.setattr("utils.logging.summary.log_deployment_summary", lambda *a, **k: None)
+    yield server
+    auth.close_dashboard_sessions()
+    server.shutdown()
+    server.server_close()
+
+def test_drift_is_timed_and_releases_its_session(lab):
+    assert main.main(["deploy"]) == 0
+    before = API_CALLS.value(endpoint="appliance.getNetworkApplianceVlans", status="ok")
+
+    assert main.main(["drift"]) == 0
+    assert API_CALLS.value(endpoint="appliance.getNetworkApplianceVlans", status="ok") == before + 2
+    assert auth._sessions == {} and runtime._connections == {}
+
+def test_destroy_releases_its_session_when_a_call_fails(lab, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(main, "_cleanup_previous_org", fail)
+    with pytest.raises(RuntimeError):
+        main.main(["destroy"])
+    assert auth._sessions == {} and runtime._connections == {}
+
+def test_deploy_flags_work_before_or_after_the_subcommand():
+    parser = main.build_parser()
+    for argv in (["--destroy", "--tag", "x", "deploy"], ["deploy", "--destroy", "--tag", "x"]):
+        args = parser.parse_args(argv)
+        assert (args.destroy, args.tag, args.resume) == (True, "x", False)
+    assert parser.parse_args(["--tag", "x", "drift"]).tag == "x"
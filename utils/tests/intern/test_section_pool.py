@@ -0,0 +1,46 @@
+# tests/intern/test_section_pool.py
+
+import copy
+import json
+import pytest
+from utils.intern import SectionPool
+
+RULES = [{"comment": "Allow Common", "policy": "allow", "srcCidr": "VLAN(20).*"}]
+
+def test_identical_sections_share_one_frozen_instance():
+    pool = SectionPool()
+    first = pool.intern("firewall.outbound_rules", RULES)
+    second = pool.intern("firewall.outbound_rules", json.loads(json.dumps(RULES)))
+    assert first is second
+    assert len(pool) == 1
+    with pytest.raises(TypeError):
+        first[0]["srcCidr"] = "10.0.0.0/24"
+    assert json.loads(json.dumps(first)) == RULES
+
+def test_payload_is_built_once_per_interned_section():
+    pool = SectionPool()
+    calls = []
+    section = pool.intern("mx_wireless", {"ssids": [{"number": 1}]})
+    build = lambda s: calls.append(1) or len(s["ssids"])
+    assert pool.payload(section, "ssid_payloads", build) == 1
+    assert pool.payload(section, "ssid_payloads", build) == 1
+    assert len(calls) == 1
+    pool.payload({"ssids": []}, "ssid_payloads", build)
+    assert len(calls) == 2
+
+def test_payloads_are_dropped_with_their_section():
+    pool = SectionPool()
+    calls = []
+    section = pool.intern("mx_wireless", {"ssids": [{"number": 1}]})
+    build = lambda s: calls.append(1) or len(s["ssids"])
+    pool.payload(section, "ssid_payloads", build)
+    pool.clear()
+    pool.payload(section, "ssid_payloads", build)  # no longer interned: built fresh, not cached
+    assert len(calls) == 2 and pool._entries == {}
+
+def test_copies_of_a_frozen_section_are_mutable():
+    section = SectionPool().intern("mx_wireless", {"ssids": [{"number": 1}]})
+    thawed = copy.deepcopy(section)
+    thawed["ssids"].append({"number": 2})
+    assert len(section["ssids"]) == 1
+    assert type(section.copy()) is dict
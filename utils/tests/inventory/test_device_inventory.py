@@ -0,0 +1,28 @@
+# tests/inventory/test_device_inventory.py
+
+from models import DeviceInventory
+
+GROUPED = {
+    "groups": [
+        {"tag": "percy_street-hub", "devices": [
+            {"serial": "Q2NY-0001", "type": "MX"},
+            {"serial": "Q2NY-0002", "type": "MS", "tags": ["access-switch"]},
+        ]},
+        {"tag": "percy-street-spoke", "devices": [
+            {"serial": "Q2NY-0003", "type": "MX", "tags": "spoke"},
+        ]},
+    ]
+}
+
+def test_devices_are_indexed_by_normalised_tag_and_serial():
+    inventory = DeviceInventory(GROUPED)
+    assert len(inventory) == 3
+    assert [d["serial"] for d in inventory.for_tag("percy-street_hub")] == ["Q2NY-0001", "Q2NY-0002"]
+    assert [d["serial"] for d in inventory.for_tag("access_switch")] == ["Q2NY-0002"]
+    assert inventory.get("Q2NY-0003")["tags"] == ["spoke", "percy-street-spoke"]
+    assert inventory.for_tag("unknown") == []
+
+def test_source_devices_are_not_mutated():
+    DeviceInventory(GROUPED)
+    assert "tags" not in GROUPED["groups"][0]["devices"][0]
+    assert DeviceInventory.of(GROUPED).devices[1]["tags"] == ["access-switch", "percy_street-hub"]
@@ -0,0 +1,114 @@
+# tests/journal/test_deploy_resume.py
+
+import pytest
+import yaml
+
+import main
+from benchmarks.fake_dashboard import start_fake_dashboard
+from benchmarks.synthetic_config import generate_config_tree
+from meraki_sdk import auth
+from utils.state import runtime
+from utils.state.journal import DeploymentJournal, get_journal_file, load_checkpoint
+
+@pytest.fixture
+def lab(tmp_path, monkeypatch):
+    generate_config_tree(tmp_path / "config", networks=2, vlans=3, firewall_rules=2, devices_per_network=2)
+    with open(tmp_path / "config" / "devices" / "devices.yaml") as f:
+        groups = yaml.safe_load(f)["groups"]
+    server = start_fake_dashboard(devices={d["serial"]: {"model": d["model"]} for g in groups for d in g["devices"]})
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MERAKI_API_KEY", "0" * 40)
+    monkeypatch.setenv("MERAKI_BASE_URL", server.url)
+    monkeypatch.setattr("utils.logging.summary.log_deployment_summary", lambda *a, **k: None)
+    yield server
+    auth.close_dashboard_sessions()
+    server.shutdown()
+    server.server_close()
+
+def test_resume_continues_the_same_org_after_a_crash(lab, monkeypatch):
+    import meraki_sdk.network.setup_network as setup_network
+
+    calls = []
+    real_routes = setup_network.configure_static_routes
+    def crash_on_second_network(*args, **kwargs):
+        calls.append(args[1])
+        if len(calls) == 2:
+            raise RuntimeError("connection reset")
+        return real_routes(*args, **kwargs)
+
+    monkeypatch.setattr(setup_network, "configure_static_routes", crash_on_second_network)
+    with pytest.raises(RuntimeError):
+        main.main(["deploy"])
+    assert auth._sessions == {} and runtime._connections == {}  # released despite the crash
+
+    checkpoint = load_checkpoint("bench_project_0000")
+    assert checkpoint["org_name"] == "Bench Org 0000 000"
+    assert checkpoint["networks"]["net_00001"]["steps"] == ["network_created", "devices", "vlans", "ports"]
+    vlan_posts = lab.requests["POST /networks/{id}/appliance/vlans"]
+
+    monkeypatch.setattr(setup_network, "configure_static_routes", real_routes)
+    assert main.main(["deploy", "--resume"]) == 0
+
+    assert len(lab.state.orgs) == 1 and len(lab.state.networks) == 2
+    assert lab.requests["POST /networks/{id}/appliance/vlans"] == vlan_posts  # VLANs were not redone
+    assert lab.requests["POST /networks/{id}/devices/claim"] == 4  # one per device, none repeated
+    assert lab.requests["POST /networks/{id}/appliance/staticRoutes"] == 2
+    assert load_checkpoint("bench_project_0000") is None
+
+def test_resume_redoes_a_section_whose_configurator_logged_an_error(lab, monkeypatch):
+    import meraki_sdk.network.setup_network as setup_network
+
+    calls = []
+    real_routes = setup_network.configure_static_routes
+    def log_error_on_first_network(*args, **kwargs):
+        calls.append(args[1])
+        if len(calls) == 1:
+            setup_network.logger.error("❌ Failed to create static route: 500")  # logged, not raised
+            return False
+        return real_routes(*args, **kwargs)
+
+    monkeypatch.setattr(setup_network, "configure_static_routes", log_error_on_first_network)
+    assert main.main(["deploy"]) == 0
+
+    checkpoint = load_checkpoint("bench_project_0000")
+    assert checkpoint is not None  # the org is not marked done
+    first, second = checkpoint["networks"]["net_00000"], checkpoint["networks"]["net_00001"]
+    assert "static_routes" not in first["steps"] and "network" not in first["steps"]
+    assert "static_routes" in second["steps"] and "network" in second["steps"]
+
+    monkeypatch.setattr(setup_network, "configure_static_routes", real_routes)
+    assert main.main(["deploy", "--resume"]) == 0
+
+    assert len(lab.state.orgs) == 1 and len(lab.state.networks) == 2
+    assert lab.requests["POST /networks/{id}/appliance/staticRoutes"] == 2  # first network redone, second not repeated
+    assert load_checkpoint("bench_project_0000") is None
+
+def test_checkpoint_ignores_finished_orgs_and_torn_lines(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first = DeploymentJournal("lab", "O_1", "Lab 001")
+    first.record("org", org_name="Lab 001", sequence=1)
+    first.record("org_done")
+    second = DeploymentJournal("lab", "O_2", "Lab 002")
+    second.record("org", org_name="Lab 002", sequence=2)
+    second.record("network_created", network="core", network_id="L_9", network_name="Core 002")
+    with open(get_journal_file("lab"), "a") as f:
+        f.write('{"step": "vla')
+
+    checkpoint = load_checkpoint("lab")
+    assert (checkpoint["org_id"], checkpoint["sequence"]) == ("O_2", 2)
+    assert checkpoint["networks"] == {"core": {"steps": ["network_created"], "network_id": "L_9", "network_name": "Core 002"}}
+
+def test_record_after_a_torn_line_is_not_lost(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    journal = DeploymentJournal("lab", "O_1", "Lab 001")
+    journal.record("org", org_name="Lab 001", sequence=1)
+    journal.record("network_created", network="n1", network_id="L_1")
+    with open(get_journal_file("lab"), "a") as f:
+        f.write('{"step": "vla')  # killed mid-append
+
+    resumed = DeploymentJournal("lab", "O_1", "Lab 001")
+    resumed.record("network_created", network="n2", network_id="L_2")
+
+    networks = load_checkpoint("lab")["networks"]
+    assert networks["n2"] == {"steps": ["network_created"], "network_id": "L_2"}
+    assert networks["n1"]["network_id"] == "L_1"
@@ -0,0 +1,27 @@
+# tests/loader/test_env_substitution.py
+
+import pytest
+
+from config_loader import check_unresolved, load_yaml_file, resolve_env_vars
+
+def test_error_names_the_key_path(monkeypatch):
+    monkeypatch.delenv("NOPE", raising=False)
+    with pytest.raises(ValueError, match=r"b\[0\]\.c \(\$\{NOPE\}\)"):
+        check_unresolved({"a": "plain", "b": [{"c": "${NOPE}"}]})
+
+def test_substitutes_inside_lists(monkeypatch):
+    monkeypatch.setenv("SITE", "london")
+    assert resolve_env_vars({"tags": ["${SITE}", "hub-${SITE}", 7]}) == {"tags": ["london", "hub-london", 7]}
+
+def test_file_error_names_the_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("NOPE", raising=False)
+    path = tmp_path / "defaults.yaml"
+    path.write_text("network:\n  name: ${NOPE}\n")
+    with pytest.raises(ValueError, match=rf"in {path}: network\.name \(\$\{{NOPE\}}\)"):
+        load_yaml_file(str(path))
+
+def test_keys_are_not_substituted_but_reported(monkeypatch):
+    monkeypatch.setenv("SITE", "london")
+    with pytest.raises(ValueError, match=r"vlans\.\$\{SITE\} \(\$\{SITE\}\)"):
+        check_unresolved({"vlans": {"${SITE}": 10}})
+    assert resolve_env_vars({"${SITE}": "${SITE}"}) == {"${SITE}": "london"}
@@ -0,0 +1,71 @@
+# tests/metrics/test_metrics_exporter.py
+
+import urllib.request
+from types import SimpleNamespace
+
+import pytest
+from utils.logging import metrics, timing
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    metrics.REGISTRY.reset()
+    timing.reset_spans()
+    yield
+    metrics.REGISTRY.reset()
+    timing.reset_spans()
+
+class APIError(Exception):
+    status = 400
+
+def _fail(*args, **kwargs):
+    raise APIError("already claimed")
+
+def test_instrumented_calls_feed_counters_and_histograms():
+    dashboard = timing.instrument_dashboard(SimpleNamespace(
+        appliance=SimpleNamespace(createNetworkApplianceVlan=lambda *a, **kw: {}, getNetworkApplianceVlans=lambda *a: []),
+        networks=SimpleNamespace(claimNetworkDevices=_fail),
+    ))
+    with timing.span("vlans", network="Studio 001"):
+        dashboard.appliance.createNetworkApplianceVlan("N_1", id=10)
+        dashboard.appliance.getNetworkApplianceVlans("N_1")
+    with timing.span("claim"), pytest.raises(APIError):
+        dashboard.networks.claimNetworkDevices("N_1", serials=["Q-1"])
+    metrics.record_http_response("GET", 429)
+
+    assert metrics.API_CALLS.value(endpoint="appliance.createNetworkApplianceVlan", status="ok") == 1
+    assert metrics.API_CALLS.value(endpoint="networks.claimNetworkDevices", status="400") == 1
+    assert metrics.OBJECTS_WRITTEN.value(section="vlans") == 1
+    assert metrics.OBJECTS_WRITTEN.value(section="claim") == 0
+    assert metrics.API_LATENCY.count(endpoint="appliance.getNetworkApplianceVlans") == 1
+    assert metrics.API_RATE_LIMITED.value(method="GET") == 1
+    assert metrics.API_RETRIES.value(method="GET") == 0  # never re-sent
+
+    text = metrics.REGISTRY.render()
+    assert "# TYPE meraki_api_call_seconds histogram" in text
+    assert 'meraki_api_calls_total{endpoint="networks.claimNetworkDevices",status="400"} 1' in text
+    assert 'meraki_api_call_seconds_bucket{endpoint="appliance.createNetworkApplianceVlan",le="+Inf"} 1' in text
+
+def test_retries_count_only_requests_sent_again():
+    url = "https://api.meraki.com/api/v1/organizations/O_1/networks"
+    for status in (429, 503, 200):  # two retries, then success
+        metrics.record_http_response("GET", status, url)
+    for page in range(3):  # pages of one paginated read are not retries
+        metrics.record_http_response("GET", 200, f"{url}?startingAfter={page}")
+    metrics.record_http_response("POST", 429, url)  # gave up: no attempt follows
+    metrics.record_api_call("organizations.createOrganizationNetwork", 0.1, error=APIError())
+    metrics.record_http_response("POST", 201, url)  # a new call, not a retry
+
+    assert metrics.API_RETRIES.value(method="GET") == 2
+    assert metrics.API_RETRIES.value(method="POST") == 0
+    assert metrics.API_RATE_LIMITED.value(method="GET") == 1 == metrics.API_RATE_LIMITED.value(method="POST")
+
+def test_exporter_writes_textfile_and_serves_port(tmp_path):
+    metrics.NETWORK_DURATION.observe(42.0, org="Lab 001")
+    exporter = metrics.start_metrics_exporter({"textfile": str(tmp_path / "deploy.prom"), "interval": 60, "port": 0})
+    try:
+        body = urllib.request.urlopen(f"http://127.0.0.1:{exporter.server.server_address[1]}/metrics").read().decode()
+        assert 'meraki_network_deploy_seconds_count{org="Lab 001"} 1' in body
+    finally:
+        exporter.stop()
+    assert (tmp_path / "deploy.prom").read_text() == metrics.REGISTRY.render()
+    assert metrics.start_metrics_exporter({}) is None
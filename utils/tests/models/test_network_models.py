@@ -0,0 +1,34 @@
+# tests/models/test_network_models.py
+
+import pytest
+from models import VLAN, MXPort, AutoVPNSettings, FirewallRule
+
+def test_vlan_round_trips_and_keeps_dict_access():
+    raw = {"id": 20, "name": "Internal", "subnet": "10.18.20.0/24", "gatewayIp": "10.18.20.1", "groupPolicyId": "101"}
+    vlan = VLAN.from_dict(raw)
+    assert not hasattr(vlan, "__dict__")
+    assert vlan.gateway_ip == vlan["gatewayIp"] == "10.18.20.1"
+    assert vlan.get("dhcpHandling") is None and "dhcpHandling" not in vlan
+    assert vlan.to_dict() == raw
+    assert vlan.to_update_payload()["dhcpLeaseTime"] == "12 hours"
+    with pytest.raises(KeyError):
+        vlan["reservedIpRanges"]
+
+def test_wan_port_payload_only_sends_name_and_enabled():
+    port = MXPort.from_dict({"port": 1, "name": "WAN 1", "enabled": True, "type": "wan", "vlan": 20})
+    assert port.to_payload() == {"name": "WAN 1", "enabled": True}
+    access = MXPort.from_dict({"port": 3, "type": "access", "vlan": 20, "allowedVlans": "all"})
+    assert access.to_payload() == {"type": "access", "vlan": 20}
+
+def test_autovpn_hubs_become_records():
+    settings = AutoVPNSettings.from_dict({"mode": "spoke", "hubs": [{"hubId": "TBD", "useDefaultRoute": True}]})
+    settings.hubs[0]["hubId"] = "N_123"
+    assert settings.to_payload() == {"mode": "spoke", "hubs": [{"hubId": "N_123", "useDefaultRoute": True}]}
+
+def test_firewall_rule_payload_requires_policy_and_cidrs():
+    rule = FirewallRule.from_dict({"policy": "allow", "srcCidr": "any", "destCidr": "10.18.20.0/24"})
+    assert rule.to_payload()["protocol"] == "any"
+    with pytest.raises(KeyError):
+        rule.to_payload(inbound=True)  # inbound rules need a protocol
+    with pytest.raises(KeyError):
+        FirewallRule.from_dict({"policy": "deny", "srcCidr": "any"}).to_payload()
@@ -0,0 +1,33 @@
+# tests/models/test_port_spec.py
+
+from models import MXPortSpec
+
+DEFAULTS = {"name": "LAN Port", "type": "access", "vlan": 20, "poeEnabled": False}
+
+def test_range_is_kept_compact_and_looked_up_by_number():
+    spec = MXPortSpec(DEFAULTS, [{"portId": "3-10", "poeEnabled": True}])
+    assert len(spec.profiles) == 1
+    assert len(spec) == 8
+    assert 7 in spec and 11 not in spec
+    assert spec.port("7").to_dict() == {**DEFAULTS, "poeEnabled": True, "port": 7}
+
+def test_payload_is_built_once_per_profile():
+    spec = MXPortSpec(DEFAULTS, [{"portId": "3-10", "poeEnabled": True}, {"portId": 1, "type": "wan"}])
+    assert spec.payload(3) is spec.payload("10")
+    assert spec.payload(3) == {"name": "LAN Port", "type": "access", "vlan": 20, "poeEnabled": True}
+    assert spec.payload(1) == {"name": "LAN Port"}
+    assert spec.payload(11) is None
+
+def test_later_definition_wins_for_duplicate_ports():
+    spec = MXPortSpec(DEFAULTS, [{"portId": 3, "vlan": 20}, {"portId": 3, "vlan": 60}])
+    assert spec.port(3).vlan == 60
+    assert [p.number for p in spec] == [3]
+
+def test_invalid_range_is_skipped():
+    spec = MXPortSpec(DEFAULTS, [{"portId": "a-b"}, {"portId": 1, "type": "wan"}])
+    assert len(spec) == 1
+    assert spec.port(1).type == "wan"
+
+def test_to_dict_keeps_ranges():
+    spec = MXPortSpec(DEFAULTS, [{"portId": "3-10"}])
+    assert spec.to_dict() == {"defaults": DEFAULTS, "ports": [{"portId": "3-10"}]}
@@ -0,0 +1,33 @@
+# tests/profiling/test_phase_profiling.py
+
+import pstats
+
+import pytest
+from utils.logging import profiling
+from utils.logging.timing import span
+
+@pytest.fixture(autouse=True)
+def profiling_off():
+    yield
+    profiling.disable_profiling()
+
+def _busy():
+    return sorted(str(i) for i in range(20_000))
+
+def test_only_selected_phases_are_profiled(tmp_path):
+    profiling.enable_profiling(["vlans"], memory=True, folder=str(tmp_path))
+    with span("network", org="Lab 001", network="Studio-Hub 001"):
+        with span("vlans"):
+            _busy()
+        with span("ports"):
+            _busy()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert len(files) == 3 and all(f.startswith("vlans-lab001-studiohub001-") for f in files)
+    stats_file = next(tmp_path.glob("*.pstats"))
+    assert any(func[2] == "_busy" for func in pstats.Stats(str(stats_file)).stats)
+    assert "Peak traced memory" in next(tmp_path.glob("*.alloc.txt")).read_text()
+
+def test_unknown_phase_is_rejected():
+    with pytest.raises(ValueError, match="bogus"):
+        profiling.enable_profiling(["bogus"])
@@ -0,0 +1,46 @@
+# tests/state/test_intended_snapshots.py
+
+import subprocess
+
+from utils.state import config as intended
+
+def _config(network_name, network_id, firewall_comment="Allow"):
+    return {
+        "network": {"name": network_name, "timeZone": "Europe/London"},
+        "vlans": [{"id": 10, "name": "MGMT", "subnet": "10.0.10.0/24"}],
+        "firewall": {"outbound_rules": [{"comment": firewall_comment, "policy": "allow"}]},
+        "org_id": "O_1",
+        "network_id": network_id,
+        "named_devices": [],
+    }
+
+def _blobs(folder):
+    return sorted(p.name for p in (folder / "blobs").rglob("*.json.gz"))
+
+def test_identical_sections_are_stored_once_and_round_trip(tmp_path, monkeypatch):
+    runs = []
+    real_run = subprocess.run
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: runs.append(a) or real_run(*a, **k))
+    intended.get_git_commit_hash.cache_clear()
+
+    first = intended.save_intended_state(_config("Hub 001", "L_1"), "Lab 001", folder=tmp_path)
+    after_first = _blobs(tmp_path)
+    intended.save_intended_state(_config("Hub 002", "L_2"), "Lab 002", folder=tmp_path)
+    intended.save_intended_state(_config("Hub 002", "L_2"), "Lab 002", folder=tmp_path)
+
+    # Second network only adds its network section and tree; the repeat adds nothing
+    assert len(_blobs(tmp_path)) == len(after_first) + 2
+    assert len(runs) == 1
+
+    tree = first.rsplit("/", 1)[-1].split(".")[0]
+    assert intended.load_intended_state(tree, folder=tmp_path) == _config("Hub 001", "L_1")
+
+def test_index_lookups_by_org_and_time(tmp_path):
+    intended.save_intended_state(_config("Hub 001", "L_1"), "Lab 001", folder=tmp_path)
+    intended.save_intended_state(_config("Hub 002", "L_2", "Deny"), "Lab 002", folder=tmp_path)
+
+    [entry] = intended.find_intended_states(org="Lab 002", folder=tmp_path)
+    assert entry["network"] == "Hub 002" and entry["network_id"] == "L_2"
+    assert intended.load_intended_state(entry["tree"], folder=tmp_path)["firewall"]["outbound_rules"][0]["comment"] == "Deny"
+    assert len(intended.find_intended_states(since="2000-01-01T00:00:00Z", folder=tmp_path)) == 2
+    assert intended.find_intended_states(until="2000-01-01T00:00:00Z", folder=tmp_path) == []
@@ -0,0 +1,94 @@
+# tests/state/test_runtime_store.py
+
+import json
+import multiprocessing
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+from backend.cache import FRAGMENT_CACHE
+from config_resolver import resolve_project_configs
+from utils.state import runtime
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "config"
+
+@pytest.fixture(autouse=True)
+def in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    yield
+    runtime.close_runtime_store()
+
+def _write_networks(worker):
+    for n in range(25):
+        runtime.record_runtime_network("lab", f"net-{worker}-{n}", f"L_{worker}{n}", f"Net {worker}-{n}")
+
+def test_concurrent_threads_and_processes_keep_every_network():
+    runtime.record_runtime_org("lab", "O_1", "Lab 001")
+    threads = [threading.Thread(target=_write_networks, args=(w,)) for w in range(4)]
+    processes = [multiprocessing.get_context("spawn").Process(target=_write_networks, args=(w,)) for w in range(4, 6)]
+    for worker in threads + processes:
+        worker.start()
+    for worker in threads + processes:
+        worker.join()
+
+    state = runtime.load_runtime_state("lab")
+    assert state["org"] == {"org_id": "O_1", "org_name": "Lab 001"}
+    assert len(state["networks"]) == 6 * 25
+    assert runtime.get_network_id_by_slug("lab", "net-5-24") == "L_524"
+
+def test_new_org_clears_old_network_ids():
+    runtime.record_runtime_org("lab", "O_1", "Lab 001")
+    runtime.record_runtime_network("lab", "hub", "L_1", "Hub 001")
+    runtime.record_runtime_org("lab", "O_1", "Lab 001")
+    assert runtime.get_network_id_by_slug("lab", "hub") == "L_1"
+
+    runtime.record_runtime_org("lab", "O_2", "Lab 002")
+    assert runtime.load_runtime_state("lab")["networks"] == {}
+    assert runtime.get_org_id("lab") == "O_2"
+
+def test_legacy_json_is_imported_once(tmp_path):
+    (tmp_path / "state" / "runtime").mkdir(parents=True)
+    legacy = {"project_slug": "Percy Street", "org": {"org_id": "O_7", "org_name": "Percy Street 007"},
+              "networks": {"studio_hub": {"network_id": "L_7", "network_name": "Studio Hub 007"}}}
+    (tmp_path / "state" / "runtime" / "Percy Street.json").write_text(json.dumps(legacy))
+
+    assert runtime.get_network_id_by_slug("percy_street", "studio_hub") == "L_7"
+    assert runtime.load_runtime_snapshot()["projects"]["percy_street"]["org"]["org_id"] == "O_7"
+
+def test_close_runtime_store_closes_every_thread():
+    threads = [threading.Thread(target=runtime.get_org_id, args=("lab",)) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    connections = list(runtime._connections.values())
+    assert len(connections) == 3
+
+    runtime.close_runtime_store()
+    assert runtime._connections == {}
+    for conn in connections:
+        with pytest.raises(Exception, match="closed"):
+            conn.execute("SELECT 1")
+
+def _spoke_hub_id():
+    resolved = resolve_project_configs()["resolved_networks"]
+    spoke = next(n for n in resolved if n["network_slug"] == "studio_spoke")
+    return spoke["network_config"]["mx_autovpn"].to_dict()["hubs"][0]["hubId"]
+
+def test_resolver_seeds_hub_ids_from_the_runtime_store(tmp_path):
+    shutil.copytree(CONFIG_DIR, tmp_path / "config")
+    assert _spoke_hub_id() == "TBD"
+
+    runtime.record_runtime_org("percy_street", "O_1", "Percy Street 001")
+    runtime.record_runtime_network("percy_street", "studio_hub", "L_42", "Studio Hub 001")
+    assert _spoke_hub_id() == "L_42"
+
+    # 📌 A network_id pinned in the manifest wins over the runtime store
+    manifest_path = tmp_path / "config" / "manifest.yaml"
+    manifest = yaml.safe_load(manifest_path.read_text())
+    manifest["projects"][0]["networks"][0]["network_id"] = "L_PINNED"
+    manifest_path.write_text(yaml.safe_dump(manifest))
+    FRAGMENT_CACHE.clear()
+    assert _spoke_hub_id() == "L_PINNED"
@@ -0,0 +1,52 @@
+# tests/summary/test_summary_stream.py
+
+import logging
+import threading
+
+from models import VLAN
+from utils.logging import summary
+
+def _deploy_network(n, org_name="Lab 001"):
+    config = {"network": {"name": f"Net {n:03d}"}, "org_id": "O_1", "network_id": f"L_{n}",
+              "vlans": [VLAN(id=10, name="MGMT", subnet=f"10.{n}.10.0/24")]}
+    devices = [{"model": "MX68", "name": f"mx-{n}", "serial": f"Q2BN-{n:05d}-000"}]
+    safe_org = org_name.lower().replace(" ", "")
+    summary.log_deployment_summary(config, org_name, devices, dashboard=None, summary_filename=f"summary-{safe_org}.log")
+
+def test_concurrent_networks_append_one_record_each(tmp_path, monkeypatch, caplog):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(summary, "_streams", {})
+    stream = tmp_path / "logs" / "summary_log" / "summary-lab001.jsonl"
+    stream.parent.mkdir(parents=True)
+    stream.write_text('{"organization": "Lab 001", "network": "Net ')  # torn line from a killed run
+    (stream.parent / "summary-lab001.log").write_text("🧾 earlier run\n")
+
+    threads = [threading.Thread(target=_deploy_network, args=(n,)) for n in range(12)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    records = summary.read_deployment_summaries(stream)["Lab 001"]
+    assert sorted(r["network"] for r in records) == [f"Net {n:03d}" for n in range(12)]
+    assert {r["device_count"] for r in records} == {1}
+    assert next(r for r in records if r["network"] == "Net 003")["vlans"] == [
+        {"id": 10, "name": "MGMT", "subnet": "10.3.10.0/24", "fixed_assignments": {}}]
+    assert "summary_lines" not in records[0]
+
+    # 📝 Human-readable log: every network's block lands whole, no header re-written
+    log = (stream.parent / "summary-lab001.log").read_text()
+    assert "This file contains" not in log
+    for n in range(12):
+        block = log.split(f"📡 Network: Net {n:03d} — Deployment Summary Begins\n", 1)[1]
+        assert block.split("✅ End of configuration summary")[0].count("📡 Network:") == 0
+        assert f"• VLAN 10 'MGMT' → 10.{n}.10.0/24" in block.split("✅ End")[0]
+
+    _deploy_network(99, org_name="Lab 002")
+    with caplog.at_level(logging.INFO, logger=summary.logger.name):
+        summary.print_final_summary()
+    assert "🏢 12 network(s) deployed:\n" in caplog.messages
+    assert "🆔 Network ID: L_7" in caplog.messages
+    assert "💾 Lab 001 JSON summary stream: logs/summary_log/summary-lab001.jsonl" in caplog.messages
+    assert "📝 Lab 002 deployment summary saved to logs/summary_log/summary-lab002.log" in caplog.messages
+    assert "This file contains" in (stream.parent / "summary-lab002.log").read_text()
@@ -0,0 +1,75 @@
+# tests/timing/test_timing_spans.py
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from utils.logging import timing
+
+@pytest.fixture(autouse=True)
+def fresh_spans():
+    timing.reset_spans()
+    yield
+    timing.reset_spans()
+
+def test_calls_inherit_span_labels_and_feed_the_report(tmp_path):
+    dashboard = timing.instrument_dashboard(SimpleNamespace(
+        appliance=SimpleNamespace(createNetworkApplianceVlan=lambda *a, **kw: {"id": 10}),
+        networks=SimpleNamespace(claimNetworkDevices=lambda *a, **kw: None),
+    ))
+    with timing.span("devices", org="Lab 001", network="Studio 001"):
+        with timing.span("claim"):
+            dashboard.networks.claimNetworkDevices("N_1", serials=["Q-1"])
+    with timing.span("network", org="Lab 001", network="Studio 001"):
+        with timing.span("vlans"):
+            assert dashboard.appliance.createNetworkApplianceVlan("N_1", id=10) == {"id": 10}
+            dashboard.appliance.createNetworkApplianceVlan("N_1", id=20)
+
+    path, report = timing.write_performance_report("lab001", folder=tmp_path)
+    assert report["total_calls"] == 3
+    assert report["endpoints"]["appliance.createNetworkApplianceVlan"]["count"] == 2
+    assert set(report["sections"]) == {"devices", "claim", "network", "vlans"}
+    assert report["networks"]["Studio 001"]["by_section"] == {"claim": 1, "vlans": 2}
+    assert json.loads(open(path).read()) == report
+
+def test_percentiles_use_nearest_rank():
+    values = sorted(i / 1000 for i in range(1, 101))
+    assert timing._percentile(values, 50) == 0.05
+    assert timing._percentile(values, 95) == 0.095
+
+def test_latencies_are_aggregated_with_a_bounded_reservoir(monkeypatch):
+    monkeypatch.setattr(timing, "RESERVOIR_SIZE", 50)
+    dashboard = timing.instrument_dashboard(SimpleNamespace(
+        networks=SimpleNamespace(getNetwork=lambda *a, **kw: None)))
+    with timing.span("network", org="Lab 001", network="Studio 001"):
+        for _ in range(500):
+            dashboard.networks.getNetwork("N_1")
+
+    [stats] = timing._aggregates[timing._ALL].endpoints.values()
+    assert stats.count == 500 and len(stats.samples) == 50
+    report = timing.build_performance_report("Lab 001")
+    assert report["endpoints"]["networks.getNetwork"]["count"] == 500
+    assert report["networks"]["Studio 001"]["calls"] == 500
+
+def test_final_summary_writes_one_report_per_org(tmp_path, monkeypatch):
+    from utils.logging import summary
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(summary, "_streams", {})
+    dashboard = timing.instrument_dashboard(SimpleNamespace(
+        organizations=SimpleNamespace(getOrganizations=lambda: []),
+        networks=SimpleNamespace(claimNetworkDevices=lambda *a, **kw: None),
+    ))
+    dashboard.organizations.getOrganizations()
+    for org, network in (("Lab 001", "Studio 001"), ("Lab 002", "Studio 002"), ("Lab 002", "Office 002")):
+        with timing.span("devices", org=org, network=network):
+            dashboard.networks.claimNetworkDevices("N_1", serials=["Q-1"])
+
+    summary.print_final_summary()
+
+    folder = tmp_path / "logs" / "summary_log"
+    reports = {p.name: json.loads(p.read_text()) for p in folder.glob("perf-*.json")}
+    assert set(reports) == {"perf-lab001.json", "perf-lab002.json", "perf-run.json"}
+    assert set(reports["perf-lab001.json"]["networks"]) == {"Studio 001"}
+    assert set(reports["perf-lab002.json"]["networks"]) == {"Studio 002", "Office 002"}
+    assert reports["perf-run.json"]["total_calls"] == 1
@@ -0,0 +1,44 @@
+# tests/vlans/test_vlan_index.py
+
+from ipam.vlan_index import VLANIndex
+from meraki_sdk.network.firewall.mx_firewall import _resolve_vlan_macros
+
+VLANS = [
+    {"id": 10, "name": "MGMT", "subnet": "10.18.10.0/24", "gatewayIp": "10.18.10.1"},
+    {"id": 20, "name": "Internal", "subnet": "10.18.20.0/24", "gatewayIp": "10.18.20.1"},
+    {"id": 30, "name": "Cameras", "subnet": "10.18.30.0/23", "gatewayIp": "10.18.30.1"},
+]
+
+def test_lookup_by_id_and_casefolded_name():
+    index = VLANIndex(VLANS)
+    assert index.get(20)["name"] == "Internal"
+    assert index.get("20")["name"] == "Internal"
+    assert index.get("internal")["id"] == 20
+    assert index.get("Guest") is None
+
+def test_resolve_refs_by_id_and_name():
+    index = VLANIndex(VLANS)
+    assert index.resolve_refs("VLAN(20)") == "10.18.20.0/24"
+    assert index.resolve_refs("VLAN(mgmt)") == "10.18.10.0/24"
+    assert index.resolve_refs("VLAN(99)") == "VLAN(99)"
+    assert index.resolve_refs("any") == "any"
+
+def test_resolve_macros_only_rewrites_leading_id_macros():
+    index = VLANIndex(VLANS)
+    assert index.resolve_macros("VLAN(20).*") == "10.18.20.0/24"
+    assert index.resolve_macros("VLAN(10).5") == "10.18.10.5/32"
+    assert index.resolve_macros("VLAN(20)") == "VLAN(20)"  # no host part: not a macro
+    assert index.resolve_macros("VLAN(mgmt).5") == "VLAN(mgmt).5"  # ids only
+    assert index.resolve_macros("VLAN(99).*") == "VLAN(99).*"
+    assert index.resolve_macros("any") == "any"
+
+def test_host_macros_follow_the_subnet_size():
+    index = VLANIndex(VLANS)
+    assert index.resolve_macros("VLAN(30).300") == "10.18.31.44/32"
+    assert index.resolve_macros("VLAN(20).300") == "VLAN(20).300"  # outside the /24
+
+def test_firewall_macros_accept_prebuilt_index():
+    rules = [{"srcCidr": "VLAN(10).*", "destCidr": "VLAN(20).7"}]
+    resolved = _resolve_vlan_macros(rules, VLANIndex(VLANS))
+    assert resolved[0]["srcCidr"] == "10.18.10.0/24"
+    assert resolved[0]["destCidr"] == "10.18.20.7/32"